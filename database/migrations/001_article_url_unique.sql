@@ -0,0 +1,19 @@
+-- Adds unique index on article.url required by set-based article ingestion
+-- (INSERT ... ON CONFLICT (url) DO NOTHING).
+-- Duplicated URLs are collapsed first, keeping the copy assigned to a daily summary
+-- or the oldest one.
+
+BEGIN;
+
+DELETE FROM article a
+    USING article b
+WHERE a.url = b.url
+  AND a.id <> b.id
+  AND (
+        (a.daily_summary_id IS NULL AND b.daily_summary_id IS NOT NULL)
+        OR ((a.daily_summary_id IS NULL) = (b.daily_summary_id IS NULL) AND a.id > b.id)
+    );
+
+CREATE UNIQUE INDEX IF NOT EXISTS article_url_key ON article (url);
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Adds SimHash signature and near-duplicate cluster id of articles, assigned at ingest time.
+-- Articles stored before this migration stay unclustered.
+
+BEGIN;
+
+ALTER TABLE article ADD COLUMN IF NOT EXISTS simhash BIGINT;
+ALTER TABLE article ADD COLUMN IF NOT EXISTS cluster_id BIGINT;
+
+CREATE INDEX IF NOT EXISTS article_cluster_id_idx ON article (cluster_id);
+CREATE INDEX IF NOT EXISTS article_published_at_idx ON article (published_at) WHERE simhash IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,31 @@
+-- Adds cold archive tier of articles left unreferenced by their daily summary. The agent
+-- service moves them here instead of deleting them, see services/agent-service
+-- app/services/archive_service.py.
+
+BEGIN;
+
+-- Cold tier of articles not referenced by their daily summary, moved here by the agent
+-- service once the summary is committed. Rows are only appended, removed by the retention
+-- policy or restored back into article. toast_tuple_target makes even short rows compressed.
+CREATE TABLE article_archive (
+                                 id INT NOT NULL,
+                                 url VARCHAR(500) NOT NULL,
+                                 published_at TIMESTAMPTZ NOT NULL,
+                                 title TEXT,
+                                 description TEXT,
+                                 source VARCHAR(30),
+                                 categories JSONB,
+                                 category VARCHAR(20) DEFAULT '',
+                                 simhash BIGINT,
+                                 cluster_id BIGINT,
+                                 archived_at TIMESTAMPTZ NOT NULL DEFAULT now()
+) WITH (fillfactor = 100, toast_tuple_target = 128);
+
+ALTER TABLE article_archive ALTER COLUMN title SET STORAGE MAIN;
+ALTER TABLE article_archive ALTER COLUMN description SET STORAGE MAIN;
+ALTER TABLE article_archive ALTER COLUMN categories SET STORAGE MAIN;
+
+-- rows arrive roughly in published_at order, a BRIN index stays tiny
+CREATE INDEX article_archive_published_at_idx ON article_archive USING brin (published_at);
+
+COMMIT;
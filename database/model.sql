@@ -1,5 +1,7 @@
 DROP TABLE IF EXISTS daily_summary CASCADE;
 DROP TABLE IF EXISTS article CASCADE;
+DROP TABLE IF EXISTS article_url CASCADE;
+DROP TABLE IF EXISTS article_archive CASCADE;
 
 CREATE TABLE daily_summary (
                                id INT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
@@ -8,19 +10,140 @@ CREATE TABLE daily_summary (
                                categories JSONB
 );
 
+-- Range-partitioned by month on published_at, see create_article_partitions() below.
+-- Rows without a matching monthly partition land in article_default.
 CREATE TABLE article (
-                         id INT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                         id INT GENERATED BY DEFAULT AS IDENTITY,
                          url VARCHAR(500) NOT NULL,
-                         published_at TIMESTAMPTZ,
+                         published_at TIMESTAMPTZ NOT NULL,
                          title TEXT,
                          description TEXT,
                          source VARCHAR(30),
                          categories JSONB,
                          category VARCHAR(20) DEFAULT '',
+                         simhash BIGINT,
+                         cluster_id BIGINT,
 
-                         daily_summary_id INT REFERENCES daily_summary(id)
+                         daily_summary_id INT REFERENCES daily_summary(id),
+                         PRIMARY KEY (id, published_at)
+) PARTITION BY RANGE (published_at);
+
+CREATE TABLE article_default PARTITION OF article DEFAULT;
+
+CREATE INDEX article_source_published_at_idx ON article (source, published_at);
+CREATE INDEX article_summary_source_category_idx ON article (daily_summary_id, source, category);
+CREATE INDEX article_cluster_id_idx ON article (cluster_id);
+CREATE INDEX article_published_at_idx ON article (published_at) WHERE simhash IS NOT NULL;
+
+-- Unique index of a partitioned table has to contain the partition key, so URL uniqueness
+-- across all partitions is kept in a separate registry claimed by every inserted article.
+CREATE TABLE article_url (
+                             url VARCHAR(500) PRIMARY KEY,
+                             article_id INT NOT NULL
 );
 
+-- Inserted row is skipped (like ON CONFLICT DO NOTHING) when its URL belongs to another
+-- article. The same article may claim its URL again - a row moved to another partition
+-- by an UPDATE of published_at, or restored from the archive.
+CREATE OR REPLACE FUNCTION article_claim_url()
+    RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO article_url (url, article_id) VALUES (NEW.url, NEW.id)
+    ON CONFLICT (url) DO UPDATE SET article_id = EXCLUDED.article_id
+    WHERE article_url.article_id = EXCLUDED.article_id;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION article_release_urls()
+    RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM article_url u
+        USING deleted_article d
+    WHERE u.url = d.url
+      AND u.article_id = d.id;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER article_claim_url
+    BEFORE INSERT ON article
+    FOR EACH ROW EXECUTE FUNCTION article_claim_url();
+
+CREATE TRIGGER article_release_urls
+    AFTER DELETE ON article
+    REFERENCING OLD TABLE AS deleted_article
+    FOR EACH STATEMENT EXECUTE FUNCTION article_release_urls();
+
+-- Creates monthly partitions covering [p_from, p_to), month boundaries are UTC. Rows of a
+-- new month already stored in article_default are moved into its partition. Called by the
+-- partition maintenance task of the data scraper service, safe to run concurrently.
+CREATE OR REPLACE FUNCTION create_article_partitions(p_from DATE, p_to DATE)
+    RETURNS INT LANGUAGE plpgsql AS $$
+DECLARE
+    month_start DATE := date_trunc('month', p_from)::DATE;
+    lower_bound TIMESTAMPTZ;
+    upper_bound TIMESTAMPTZ;
+    partition_name TEXT;
+    created INT := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('create_article_partitions'));
+
+    WHILE month_start < p_to LOOP
+        partition_name := 'article_p' || to_char(month_start, 'YYYY_MM');
+        lower_bound := month_start::TIMESTAMP AT TIME ZONE 'UTC';
+        upper_bound := (month_start + INTERVAL '1 month')::TIMESTAMP AT TIME ZONE 'UTC';
+
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I (LIKE article INCLUDING DEFAULTS)', partition_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM article_default WHERE published_at >= %L AND published_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                lower_bound, upper_bound, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE article ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+            created := created + 1;
+        END IF;
+
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+
+    RETURN created;
+END;
+$$;
+
+SELECT create_article_partitions((now() - INTERVAL '12 months')::DATE, (now() + INTERVAL '3 months')::DATE);
+
+-- Cold tier of articles not referenced by their daily summary, moved here by the agent
+-- service once the summary is committed. Rows are only appended, removed by the retention
+-- policy or restored back into article. toast_tuple_target makes even short rows compressed.
+CREATE TABLE article_archive (
+                                 id INT NOT NULL,
+                                 url VARCHAR(500) NOT NULL,
+                                 published_at TIMESTAMPTZ NOT NULL,
+                                 title TEXT,
+                                 description TEXT,
+                                 source VARCHAR(30),
+                                 categories JSONB,
+                                 category VARCHAR(20) DEFAULT '',
+                                 simhash BIGINT,
+                                 cluster_id BIGINT,
+                                 archived_at TIMESTAMPTZ NOT NULL DEFAULT now()
+) WITH (fillfactor = 100, toast_tuple_target = 128);
+
+ALTER TABLE article_archive ALTER COLUMN title SET STORAGE MAIN;
+ALTER TABLE article_archive ALTER COLUMN description SET STORAGE MAIN;
+ALTER TABLE article_archive ALTER COLUMN categories SET STORAGE MAIN;
+
+-- rows arrive roughly in published_at order, a BRIN index stays tiny
+CREATE INDEX article_archive_published_at_idx ON article_archive USING brin (published_at);
+
 CREATE OR REPLACE FUNCTION get_summary_references(p_summary_id INT)
     RETURNS JSONB LANGUAGE sql STABLE AS '
     SELECT
@@ -36,6 +159,9 @@ CREATE OR REPLACE FUNCTION get_summary_references(p_summary_id INT)
                           jsonb_agg(id::text || '' - '' || coalesce(title, '''')) AS items
                       FROM article
                       WHERE daily_summary_id = p_summary_id
+                        -- lets the planner skip partitions of other months
+                        AND published_at >= (SELECT date FROM daily_summary WHERE id = p_summary_id) - 1
+                        AND published_at < (SELECT date FROM daily_summary WHERE id = p_summary_id) + 2
                       GROUP BY source, category
                   ) inner_sub
              GROUP BY source
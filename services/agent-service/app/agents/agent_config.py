@@ -16,3 +16,21 @@ class AgentSettings(BaseSettings):
         "BBC",
         "NewYorkTimes",
     ]
+    # estimated tokens of article descriptions sent in one prompt, larger sources are
+    # summarized in chunks and merged
+    chunk_token_budget: int = 30000
+    # model calls running at once across all sources and chunks, and limit of a single call
+    llm_max_concurrency: int = 8
+    llm_timeout_seconds: float = 120
+    # quota of the model shared by the whole service, 0 disables a limit
+    llm_requests_per_minute: int = 60
+    llm_tokens_per_minute: int = 1_000_000
+    # repeats of calls failed with 429 / 5xx, backoff doubles from llm_backoff_seconds
+    llm_max_retries: int = 4
+    llm_backoff_seconds: float = 2.0
+    # articles are compressed before they are put into prompts, 0 disables a step
+    prompt_compression: bool = True
+    prompt_max_description_chars: int = 600
+    prompt_max_categories: int = 5
+    # extractive selection of sentences most related to the title, off by default
+    prompt_max_sentences: int = 0
@@ -0,0 +1,88 @@
+import math
+
+from app.schemas.article import Article
+
+# rough average for english and polish news text, close enough for budgeting prompts
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimates number of model tokens of given text without calling the model
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chunk_articles(articles: list[Article], token_budget: int) -> list[list[Article]]:
+    """
+    Splits articles into chunks whose descriptions fit into `token_budget` tokens.
+
+    Articles that fit are returned unchanged as a single chunk. Otherwise they are grouped
+    by their first feed category before packing, so related articles tend to end up in the
+    same chunk. An article larger than the budget gets its own chunk.
+
+    :param articles: articles of a single source
+    :type articles: list[Article]
+    :param token_budget: max estimated tokens of article descriptions in one chunk
+    :type token_budget: int
+    :return: chunks in packing order, a single chunk if everything fits
+    :rtype: list[list[Article]]
+    """
+    sized = [
+        (article, estimate_tokens(article.full_description) + 1) for article in articles
+    ]
+    if sum(tokens for _, tokens in sized) <= token_budget:
+        return [list(articles)]
+
+    sized.sort(key=lambda item: item[0].categories[0] if item[0].categories else "")
+
+    chunks: list[list[Article]] = []
+    current: list[Article] = []
+    current_tokens = 0
+    for article, tokens in sized:
+        if current and current_tokens + tokens > token_budget:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(article)
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def merge_references(partials: list[dict], categories: list[str]) -> dict:
+    """
+    Merges per-category article id lists of chunk outputs, keeping first-seen order
+    """
+    merged = {}
+    for category in categories:
+        ids = {}
+        for partial in partials:
+            for article_id in partial.get("references", {}).get(category) or []:
+                ids.setdefault(article_id, None)
+        merged[category] = list(ids)
+    return merged
+
+
+def merge_counts(partials: list[dict], categories: list[str]) -> dict:
+    return {
+        category: sum(
+            partial.get("categories", {}).get(category) or 0 for partial in partials
+        )
+        for category in categories
+    }
+
+
+def partial_summaries(partials: list[dict], categories: list[str]) -> dict:
+    """
+    Collects non-empty summaries of every category written for separate chunks
+    """
+    return {
+        category: [
+            summary
+            for partial in partials
+            if (summary := partial.get("summaries", {}).get(category))
+        ]
+        for category in categories
+    }
@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+from dotenv import load_dotenv
+
+from app.core.metrics import LLM_CACHE_EVICTIONS, LLM_CACHE_REQUESTS
+
+load_dotenv()
+
+LLM_CACHE_FILE = os.getenv("LLM_CACHE_FILE", ".cache/llm_cache.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+# 0 disables the cache
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+
+
+class LLMCache:
+    """
+    Persistent content-addressed cache of parsed LLM outputs with LRU + TTL eviction.
+
+    Entries are keyed by a hash of everything that determines the answer (prompt version,
+    model, temperature and the rendered prompt), so a retried daily job or a repeated
+    periodic request costs no model call. Stored in SQLite (WAL), which makes it shared
+    by threads and worker processes of the service and safe for concurrent writers.
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_FILE,
+        ttl: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.initialized = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @staticmethod
+    def key(prompt_version: str, model: str, temperature: Any, rendered: str) -> str:
+        payload = json.dumps(
+            [prompt_version, model, temperature, rendered], default=str
+        ).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str, prompt: str = "") -> dict | None:
+        """
+        Returns cached output for given key, `None` if missing or expired
+
+        :param key: cache key, see `LLMCache.key`
+        :type key: str
+        :param prompt: prompt name used as metrics label
+        :type prompt: str
+        """
+        if not self.enabled:
+            return None
+
+        now = self.clock()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl > 0 and row[1] <= now - self.ttl:
+                connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                LLM_CACHE_EVICTIONS.labels("ttl").inc()
+                row = None
+            if row is not None:
+                connection.execute(
+                    "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        LLM_CACHE_REQUESTS.labels(prompt, "miss" if row is None else "hit").inc()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        """
+        Stores output under given key, evicts expired and least recently used entries
+        above `max_entries`
+        """
+        if not self.enabled:
+            return
+
+        now = self.clock()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO llm_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                (key, json.dumps(value), now, now),
+            )
+            if self.ttl > 0:
+                expired = connection.execute(
+                    "DELETE FROM llm_cache WHERE created_at <= ?", (now - self.ttl,)
+                ).rowcount
+                LLM_CACHE_EVICTIONS.labels("ttl").inc(expired)
+            evicted = connection.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            LLM_CACHE_EVICTIONS.labels("lru").inc(evicted)
+
+    async def aget(self, key: str, prompt: str = "") -> dict | None:
+        """
+        `get` run in a worker thread, waiting for a locked database must not block
+        the event loop
+        """
+        return await asyncio.to_thread(self.get, key, prompt)
+
+    async def aput(self, key: str, value: dict) -> None:
+        """
+        `put` run in a worker thread
+        """
+        await asyncio.to_thread(self.put, key, value)
+
+    def clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM llm_cache")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Opens a short-lived connection wrapping one transaction, connections are never
+        shared between threads
+        """
+        if not self.initialized:
+            with self.lock:
+                if not self.initialized:
+                    self._initialize()
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _initialize(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_accessed_at_idx "
+                "ON llm_cache (accessed_at)"
+            )
+            connection.commit()
+        finally:
+            connection.close()
+        self.initialized = True
+
+
+llm_cache = LLMCache()
@@ -0,0 +1,169 @@
+import logging
+import re
+
+from app.agents.agent_config import AgentSettings
+from app.agents.chunking import estimate_tokens
+from app.core.metrics import PROMPT_TOKENS_SAVED
+from app.schemas.article import Article
+
+logger = logging.getLogger(__name__)
+
+# feed and publisher boilerplate carrying no information about the article
+BOILERPLATE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"the post .{0,200}? appeared first on .{0,100}?(\.|$)",
+        # trailing calls to action, only as a separate sentence
+        r"(^|(?<=[.!?…]))\s*(continue reading|read more|click here|czytaj (więcej|też|także)"
+        r"|(zobacz|sprawdź) (też|także|również))\b.{0,150}$",
+        r"\[(…|\.\.\.|&#8230;)\]",
+        r"https?://\S+",
+    )
+)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+WORD = re.compile(r"\w{4,}")
+
+
+def normalize(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+def remove_boilerplate(text: str) -> str:
+    for pattern in BOILERPLATE_PATTERNS:
+        text = pattern.sub("", text)
+    return " ".join(text.split())
+
+
+def drop_title(description: str, title: str | None) -> str:
+    """
+    Returns an empty description if it only repeats the title, and strips the title
+    repeated at the start of a longer description
+    """
+    if not title:
+        return description
+    normalized_title = normalize(title)
+    normalized_description = normalize(description)
+    if not normalized_description or normalized_description in normalized_title:
+        return ""
+    title = title.strip()
+    if description.lower().startswith(title.lower()):
+        return description[len(title) :].lstrip(" .:-–—|")
+    return description
+
+
+def select_sentences(description: str, title: str | None, count: int) -> str:
+    """
+    Keeps `count` sentences sharing the most words with the title, the lead sentence
+    wins ties, in their original order
+    """
+    sentences = SENTENCE_END.split(description)
+    if len(sentences) <= count:
+        return description
+    title_words = set(WORD.findall((title or "").lower()))
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (-len(title_words & set(WORD.findall(sentences[i].lower()))), i),
+    )
+    return " ".join(sentences[i] for i in sorted(ranked[:count]))
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """
+    Cuts text to `max_chars` at the last sentence end or word boundary
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    sentence_end = max(cut.rfind(". "), cut.rfind("! "), cut.rfind("? "))
+    if sentence_end >= max_chars // 2:
+        return cut[: sentence_end + 1]
+    return cut.rsplit(" ", 1)[0] + "…"
+
+
+def abbreviate_categories(categories: list[str], max_categories: int) -> list[str]:
+    """
+    Drops repeated categories (case insensitive) and keeps the first `max_categories`,
+    the feed category always comes first
+    """
+    unique = {}
+    for category in categories:
+        unique.setdefault(category.strip().lower(), category.strip())
+    return list(unique.values())[:max_categories]
+
+
+class PromptCompressor:
+    """
+    Shrinks articles before they are rendered into the summary prompt. Every step is
+    optional, a limit of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_description_chars: int = 600,
+        max_categories: int = 5,
+        max_sentences: int = 0,
+    ) -> None:
+        """
+        :param max_description_chars: descriptions are cut to this length
+        :type max_description_chars: int
+        :param max_categories: categories kept per article, NYT facet lists are long
+        :type max_categories: int
+        :param max_sentences: sentences kept by extractive selection, 0 keeps all
+        :type max_sentences: int
+        """
+        self.enabled = enabled
+        self.max_description_chars = max_description_chars
+        self.max_categories = max_categories
+        self.max_sentences = max_sentences
+
+    @classmethod
+    def from_settings(cls, settings: AgentSettings) -> "PromptCompressor":
+        return cls(
+            enabled=settings.prompt_compression,
+            max_description_chars=settings.prompt_max_description_chars,
+            max_categories=settings.prompt_max_categories,
+            max_sentences=settings.prompt_max_sentences,
+        )
+
+    def compress_article(self, article: Article) -> Article:
+        description = drop_title(remove_boilerplate(article.description), article.title)
+        if self.max_sentences > 0:
+            description = select_sentences(
+                description, article.title, self.max_sentences
+            )
+        if self.max_description_chars > 0:
+            description = truncate(description, self.max_description_chars)
+
+        categories = article.categories
+        if self.max_categories > 0:
+            categories = abbreviate_categories(categories, self.max_categories)
+
+        return article.model_copy(
+            update={"description": description, "categories": categories}
+        )
+
+    def compress(self, articles: list[Article], source: str) -> list[Article]:
+        """
+        Returns compressed copies of articles of a source, reports estimated tokens saved
+
+        :param articles: articles of a single source
+        :type articles: list[Article]
+        :param source: source name used in logs and as metrics label
+        :type source: str
+        """
+        if not self.enabled or not articles:
+            return articles
+
+        compressed = [self.compress_article(article) for article in articles]
+        before = sum(estimate_tokens(article.full_description) for article in articles)
+        after = sum(estimate_tokens(article.full_description) for article in compressed)
+        PROMPT_TOKENS_SAVED.labels(source).observe(before - after)
+        logger.info(
+            "[Compression] source=%s articles=%d tokens=%d->%d",
+            source,
+            len(articles),
+            before,
+            after,
+        )
+        return compressed
@@ -0,0 +1,193 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import TypeVar
+
+from app.agents.agent_config import AgentSettings
+from app.core.metrics import LLM_QUEUE_WAIT, LLM_RETRIES
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class Priority(IntEnum):
+    """
+    Order in which waiting model calls are sent, lower values go first
+    """
+
+    INTERACTIVE = 0
+    DAILY = 1
+    BACKFILL = 2
+
+
+def status_code(error: BaseException) -> int | None:
+    """
+    Finds the HTTP status code of a failed model call, following wrapped exceptions
+    (langchain errors wrap the errors of the Google SDK)
+    """
+    while error is not None:
+        code = getattr(error, "code", None) or getattr(error, "status_code", None)
+        if isinstance(code, int):
+            return code
+        error = error.__cause__
+    return None
+
+
+class RateGovernor:
+    """
+    Admits model calls of the whole service within concurrency, requests-per-minute and
+    tokens-per-minute budgets, serving waiting calls by priority and then in arrival order.
+    Calls failed with a rate limit (429) or server (5xx) error are repeated after a
+    jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_retries: int = 4,
+        backoff_seconds: float = 2.0,
+        max_backoff_seconds: float = 60.0,
+        window: float = 60.0,
+    ) -> None:
+        """
+        :param requests_per_minute: calls sent per `window`, 0 disables the limit
+        :type requests_per_minute: int
+        :param tokens_per_minute: estimated prompt tokens sent per `window`, 0 disables
+            the limit. A single call larger than the budget is sent into an empty window.
+        :type tokens_per_minute: int
+        :param window: length of the sliding window of both budgets in seconds
+        :type window: float
+        """
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.window = window
+        self.active = 0
+        # (sent at, tokens) of calls sent within the window
+        self.sent: deque[tuple[float, int]] = deque()
+        # heap of (priority, arrival number) of waiting calls
+        self.waiting: list[tuple[int, int]] = []
+        self.arrivals = itertools.count()
+        self.condition = asyncio.Condition()
+
+    @classmethod
+    def from_settings(cls, settings: AgentSettings) -> "RateGovernor":
+        return cls(
+            max_concurrency=settings.llm_max_concurrency,
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            max_retries=settings.llm_max_retries,
+            backoff_seconds=settings.llm_backoff_seconds,
+        )
+
+    async def call(
+        self,
+        function: Callable[[], Awaitable[T]],
+        tokens: int,
+        priority: Priority = Priority.DAILY,
+    ) -> T:
+        """
+        Runs `function` in a slot of the governor, retrying rate limit and server errors
+
+        :param function: creates the awaitable of a single model call, called per attempt
+        :type function: Callable[[], Awaitable[T]]
+        :param tokens: estimated tokens of the prompt
+        :type tokens: int
+        :param priority: priority class of the call
+        :type priority: Priority
+        """
+        for attempt in itertools.count():
+            try:
+                async with self.slot(tokens, priority):
+                    return await function()
+            except Exception as error:
+                code = status_code(error)
+                if attempt >= self.max_retries or code not in RETRYABLE_STATUS_CODES:
+                    raise
+                LLM_RETRIES.labels(str(code)).inc()
+            await asyncio.sleep(self.backoff(attempt))
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full jitter, so calls failed together are not repeated together
+        """
+        return random.uniform(
+            0, min(self.max_backoff_seconds, self.backoff_seconds * 2**attempt)
+        )
+
+    @asynccontextmanager
+    async def slot(
+        self, tokens: int, priority: Priority = Priority.DAILY
+    ) -> AsyncIterator[None]:
+        """
+        Waits until the call is first in the queue and fits into all budgets, the slot
+        is released on exit
+        """
+        entry = (priority, next(self.arrivals))
+        queued_at = time.monotonic()
+        async with self.condition:
+            heapq.heappush(self.waiting, entry)
+            try:
+                while (delay := self._delay(entry, tokens)) != 0:
+                    try:
+                        await asyncio.wait_for(self.condition.wait(), delay)
+                    except TimeoutError:
+                        pass
+            finally:
+                self.waiting.remove(entry)
+                heapq.heapify(self.waiting)
+                self.condition.notify_all()
+            self.active += 1
+            self.sent.append((time.monotonic(), tokens))
+        LLM_QUEUE_WAIT.labels(priority.name.lower()).observe(
+            time.monotonic() - queued_at
+        )
+
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.active -= 1
+                self.condition.notify_all()
+
+    def _delay(self, entry: tuple[int, int], tokens: int) -> float | None:
+        """
+        Seconds until the call can be sent, `None` until it is first in the queue and a
+        slot is free (the waiter is notified then)
+        """
+        if self.waiting[0] != entry or self.active >= self.max_concurrency:
+            return None
+
+        now = time.monotonic()
+        while self.sent and self.sent[0][0] <= now - self.window:
+            self.sent.popleft()
+
+        delay = 0.0
+        if 0 < self.requests_per_minute <= len(self.sent):
+            oldest = self.sent[len(self.sent) - self.requests_per_minute][0]
+            delay = oldest + self.window - now
+
+        excess = sum(sent for _, sent in self.sent) + tokens - self.tokens_per_minute
+        if self.tokens_per_minute > 0 and excess > 0 and self.sent:
+            for sent_at, sent in self.sent:
+                excess -= sent
+                if excess <= 0:
+                    break
+            delay = max(delay, sent_at + self.window - now)
+
+        return max(delay, 0.0)
+
+
+llm_governor = RateGovernor.from_settings(AgentSettings())
@@ -1,8 +1,20 @@
+from collections.abc import Awaitable, Iterable
 from datetime import date
+import asyncio
 import json
 import json_repair
 
 from app.agents.agent_config import AgentSettings
+from app.agents.chunking import (
+    chunk_articles,
+    estimate_tokens,
+    merge_counts,
+    merge_references,
+    partial_summaries,
+)
+from app.agents.llm_cache import LLMCache
+from app.agents.prompt_compression import PromptCompressor
+from app.agents.rate_governor import Priority, RateGovernor
 from app.schemas.article import Article
 from app.schemas.daily_summary import DailySummary
 from app.schemas.periodic_summary import PeriodicSummary
@@ -14,10 +26,38 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+async def run_all(awaitables: Iterable[Awaitable]) -> list:
+    """
+    Runs awaitables concurrently and returns their results in order. The first failure
+    cancels the others and is raised as is, cancelling the caller cancels all of them.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(awaitable) for awaitable in awaitables]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0]
+    return [task.result() for task in tasks]
+
+
 class SummaryAgent:
-    def __init__(self, model: str, settings: AgentSettings):
+    # bump when parsing of model outputs changes, cached outputs of older versions are skipped
+    PROMPT_VERSION = "1"
+
+    def __init__(
+        self,
+        model: str,
+        settings: AgentSettings,
+        cache: LLMCache | None = None,
+        governor: RateGovernor | None = None,
+        priority: Priority = Priority.DAILY,
+    ):
         self.settings = settings
         self.model = model
+        self.cache = cache
+        # pass the shared governor to enforce concurrency and quota service-wide
+        self.governor = governor or RateGovernor.from_settings(settings)
+        self.priority = priority
+        self.compressor = PromptCompressor.from_settings(settings)
         self.summary_categories = ", ".join(self.settings.article_categories)
         self.summary_sources = ", ".join(self.settings.sources)
         self.daily_summary_id = 0
@@ -87,6 +127,35 @@ class SummaryAgent:
         """
         )
 
+    @property
+    def merge_summaries_prompt(self):
+        return ChatPromptTemplate.from_template(
+            """
+            The articles from {source} published on a single day were summarized in several parts.\
+            Below are the partial summaries written for every category:\
+            {partial_summaries}\
+
+            Language: english\
+
+            Return JSON with the following field:\
+            - summaries: a dict where keys are category names and values are detailed summaries
+              (5-7 sentences) combining all partial summaries of the category into one text\
+
+            Constraints:
+            - Include only the categories present in the input.
+            - Keep the most important events, drop repetitions.
+
+            EXPECTED_OUTPUT_STRUCTURE:
+            {{
+              "summaries": {{
+                "Category": "Merged summary"
+              }}
+            }}
+
+            IMPORTANT: Return ONLY raw JSON. Do NOT wrap it in markdown code blocks. Do NOT use ```json or ``` markers.
+        """
+        )
+
     @property
     def periodic_summary_prompt(self):
         return ChatPromptTemplate.from_template(
@@ -196,7 +265,48 @@ class SummaryAgent:
             except Exception:
                 raise ValueError("Failed to parse LLM output.")
 
-    def get_daily_summary_for_source(
+    async def invoke_prompt(
+        self, name: str, prompt: ChatPromptTemplate, inputs: dict
+    ) -> dict:
+        """
+        Runs prompt through the model with `ainvoke` and parses JSON output, answers cached
+        for the same prompt version, model, temperature and rendered prompt are reused.
+
+        Calls are sent through the rate governor in the priority class of the agent, each
+        attempt limited to `llm_timeout_seconds` (`TimeoutError`) not counting the wait
+        in the governor queue.
+        """
+        rendered = prompt.format(**inputs)
+        key = self.cache_key(rendered) if self.cache else None
+        if key:
+            cached = await self.cache.aget(key, name)
+            if cached is not None:
+                return cached
+
+        chain = prompt | self.model | StrOutputParser()
+
+        async def call_model() -> str:
+            async with asyncio.timeout(self.settings.llm_timeout_seconds):
+                return await chain.ainvoke(inputs)
+
+        raw_content = await self.governor.call(
+            call_model, estimate_tokens(rendered), self.priority
+        )
+        output = self.parse_json_response(raw_content)
+
+        if key:
+            await self.cache.aput(key, output)
+        return output
+
+    def cache_key(self, rendered: str) -> str:
+        return LLMCache.key(
+            self.PROMPT_VERSION,
+            str(getattr(self.model, "model", type(self.model).__name__)),
+            getattr(self.model, "temperature", None),
+            rendered,
+        )
+
+    async def get_daily_summary_for_source(
         self, articles: list[Article], source: str, summary_date: date
     ) -> dict:
         if not articles:
@@ -209,31 +319,74 @@ class SummaryAgent:
                 "references": {source: empty_refs},
             }
 
+        articles = self.compressor.compress(articles, source)
+        chunks = chunk_articles(articles, self.settings.chunk_token_budget)
+        if len(chunks) == 1:
+            output = await self.summarize_articles(chunks[0], source)
+        else:
+            partials = await run_all(
+                self.summarize_articles(chunk, source) for chunk in chunks
+            )
+            output = await self.reduce_summaries(partials, source)
+
+        return {
+            "summaries": {source: output.get("summaries", {})},
+            "categories": {source: output.get("categories", {})},
+            "references": {source: output.get("references", {})},
+        }
+
+    async def summarize_articles(self, articles: list[Article], source: str) -> dict:
         articles_description = "\n".join(
             [article.full_description for article in articles]
         )
 
-        daily_summary_chain = (
-            self.daily_summary_for_source_prompt | self.model | StrOutputParser()
-        )
-
-        raw_content = daily_summary_chain.invoke(
+        return await self.invoke_prompt(
+            "daily_summary",
+            self.daily_summary_for_source_prompt,
             {
                 "articles": articles_description,
                 "source": source,
                 "categories": self.summary_categories,
-            }
+            },
         )
 
-        output = self.parse_json_response(raw_content)
+    async def reduce_summaries(self, partials: list[dict], source: str) -> dict:
+        """
+        Merges outputs of chunks of one source. Reference lists and counts are merged
+        directly, the model is asked only to merge categories summarized in several chunks.
+        """
+        categories = self.settings.article_categories
+        texts = partial_summaries(partials, categories)
+        summaries = {
+            category: items[0] if len(items) == 1 else ""
+            for category, items in texts.items()
+        }
+
+        to_merge = {
+            category: items for category, items in texts.items() if len(items) > 1
+        }
+        if to_merge:
+            merged = await self.invoke_prompt(
+                "merge_summaries",
+                self.merge_summaries_prompt,
+                {
+                    "source": source,
+                    "partial_summaries": json.dumps(
+                        to_merge, ensure_ascii=False, indent=2
+                    ),
+                },
+            )
+            merged = merged.get("summaries", {})
+            for category, items in to_merge.items():
+                summaries[category] = merged.get(category) or " ".join(items)
 
         return {
-            "summaries": {source: output.get("summaries", {})},
-            "categories": {source: output.get("categories", {})},
-            "references": {source: output.get("references", {})},
+            "summaries": summaries,
+            "categories": merge_counts(partials, categories),
+            "references": merge_references(partials, categories),
         }
 
-    def get_periodic_summary(
+    async def get_periodic_summary(
         self,
         daily_summaries: list[DailySummary],
         sources: list[str],
@@ -272,16 +425,12 @@ class SummaryAgent:
                 if src in sources
             }
 
-        periodic_summary_chain = (
-            self.periodic_summary_prompt | self.model | StrOutputParser()
+        output = await self.invoke_prompt(
+            "periodic_summary",
+            self.periodic_summary_prompt,
+            {"daily_summaries": daily_summaries},
         )
 
-        raw_content = periodic_summary_chain.invoke(
-            {"daily_summaries": daily_summaries}
-        )
-
-        output = self.parse_json_response(raw_content)
-
         return PeriodicSummary(
             start_date=start_date,
             end_date=end_date,
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
 from app.database.database import get_db
 from app.schemas import DailySummaryResponse
-from app.services import summary_service
+from app.services import archive_service, summary_service
 
 router = APIRouter(prefix="/daily_summary")
 
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/daily_summary")
 )
 async def get_daily_summary(
     summary_date: date = Query(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     return await summary_service.get_daily_summary_async(summary_date, db)
 
@@ -24,7 +24,23 @@ async def get_daily_summary(
     response_model=list[dict],
     status_code=status.HTTP_200_OK,
 )
-def get_recent_daily_summaries(
-    db: Session = Depends(get_db),
+async def get_recent_daily_summaries(
+    db: AsyncSession = Depends(get_db),
 ):
-    return summary_service.get_recent_daily_summaries(db)
+    return await summary_service.get_recent_daily_summaries(db)
+
+
+@router.post(
+    "/archive/restore",
+    response_model=dict,
+    status_code=status.HTTP_200_OK,
+)
+async def restore_archived_articles(
+    summary_date: date = Query(...),
+    sources: list[str] | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    restored = await archive_service.restore_archived_articles(
+        db, summary_date, sources
+    )
+    return {"summary_date": summary_date, "restored": restored}
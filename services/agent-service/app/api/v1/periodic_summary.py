@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, Query, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 import uuid
 
@@ -17,7 +17,7 @@ def start_periodic_summary(
     end: date = Query(...),
     sources: list[str] = Query(...),
     categories: list[str] = Query(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     task_id = str(uuid.uuid4())
     task_service.create_task(task_id)
@@ -0,0 +1,36 @@
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+registry = CollectorRegistry()
+
+LLM_CACHE_REQUESTS = Counter(
+    "agent_llm_cache_requests",
+    "Lookups of the LLM response cache by prompt and result (hit / miss)",
+    ["prompt", "result"],
+    registry=registry,
+)
+LLM_CACHE_EVICTIONS = Counter(
+    "agent_llm_cache_evictions",
+    "LLM response cache entries removed as expired (ttl) or least recently used (lru)",
+    ["reason"],
+    registry=registry,
+)
+LLM_QUEUE_WAIT = Histogram(
+    "agent_llm_queue_wait_seconds",
+    "Time a model call waited in the rate governor queue before being sent",
+    ["priority"],
+    buckets=(0.01, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+    registry=registry,
+)
+LLM_RETRIES = Counter(
+    "agent_llm_retries",
+    "Model calls repeated after a rate limit (429) or server (5xx) error, by status code",
+    ["status"],
+    registry=registry,
+)
+PROMPT_TOKENS_SAVED = Histogram(
+    "agent_prompt_tokens_saved",
+    "Estimated article tokens removed from a summary prompt of a source by compression",
+    ["source"],
+    buckets=(0, 100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000),
+    registry=registry,
+)
@@ -3,7 +3,9 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.api.v1.daily_summary import router as daily_summary_router
 from app.api.v1.periodic_summary import router as periodic_summary_router
+from app.api.v1.metrics import router as metrics_router
 from app.services.task_service import start_cleanup_task, stop_cleanup_task
+from app.database.database import engine
 
 
 @asynccontextmanager
@@ -13,6 +15,7 @@ async def lifespan(app):
         yield
     finally:
         stop_cleanup_task()
+        await engine.dispose()
 
 
 app = FastAPI(
@@ -24,6 +27,7 @@ app = FastAPI(
 
 app.include_router(daily_summary_router)
 app.include_router(periodic_summary_router)
+app.include_router(metrics_router)
 
 
 @app.exception_handler(Exception)
@@ -1,9 +1,11 @@
 from .daily_summary import DailySummary
 from .article import Article
+from .article_archive import ArticleArchive
 from .viev_daily_summary import ViewDailySummary
 
 __all__ = [
     "DailySummary",
     "Article",
+    "ArticleArchive",
     "ViewDailySummary",
 ]
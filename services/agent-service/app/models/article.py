@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Text, DateTime, Integer, ForeignKey, Identity
+from sqlalchemy import BigInteger, Text, DateTime, Integer, ForeignKey, Identity
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from .base import Base
@@ -14,14 +14,17 @@ class Article(Base):
 
     id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
     url: Mapped[str] = mapped_column(Text, nullable=False)
-    published_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True
+    # partition key of the month-partitioned table
+    published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
     )
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     source: Mapped[str | None] = mapped_column(Text, nullable=True)
     categories: Mapped[list] = mapped_column(JSONB, nullable=True)  # DODANE
     category: Mapped[str] = mapped_column(Text, nullable=True)
+    simhash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    cluster_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     daily_summary_id: Mapped[int | None] = mapped_column(ForeignKey("daily_summary.id"))
     daily_summary: Mapped["DailySummary"] = relationship(back_populates="articles")
@@ -0,0 +1,29 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Text, DateTime, Integer, func
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime
+from .base import Base
+
+
+class ArticleArchive(Base):
+    __tablename__ = "article_archive"
+
+    # append-only table has no key of its own, rows are identified like in `article`
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    title: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description: Mapped[str] = mapped_column(Text, nullable=True)
+    source: Mapped[str | None] = mapped_column(Text, nullable=True)
+    categories: Mapped[list] = mapped_column(JSONB, nullable=True)
+    category: Mapped[str] = mapped_column(Text, nullable=True)
+    simhash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    cluster_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"ArticleArchive(id={self.id}, title={self.title})"
@@ -0,0 +1,149 @@
+import logging
+import os
+from datetime import date, datetime, timedelta
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from dotenv import load_dotenv
+
+from app.database import database
+from app.models import Article, ArticleArchive, DailySummary
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# archived articles older than this are purged for good, 0 keeps them forever
+ARCHIVE_RETENTION_DAYS = int(os.getenv("ARTICLE_ARCHIVE_RETENTION_DAYS", "365"))
+
+ARCHIVED_COLUMNS = (
+    "id",
+    "url",
+    "published_at",
+    "title",
+    "description",
+    "source",
+    "categories",
+    "category",
+    "simhash",
+    "cluster_id",
+)
+
+
+def day_range(summary_date: date) -> tuple[datetime, datetime]:
+    start_date = datetime.combine(summary_date, datetime.min.time())
+    return start_date, start_date + timedelta(days=1)
+
+
+async def archive_unassigned_articles(db: AsyncSession, summary_date: date) -> int:
+    """
+    Moves articles of the day not referenced by its daily summary into `article_archive`
+    with a single `WITH moved AS (DELETE ... RETURNING) INSERT ... SELECT` statement
+    """
+    start_date, end_date = day_range(summary_date)
+    moved = (
+        delete(Article)
+        .where(
+            Article.published_at >= start_date,
+            Article.published_at < end_date,
+            Article.daily_summary_id.is_(None),
+        )
+        .returning(*(getattr(Article, column) for column in ARCHIVED_COLUMNS))
+        .cte("moved")
+    )
+    result = await db.execute(
+        insert(ArticleArchive).from_select(ARCHIVED_COLUMNS, select(moved))
+    )
+    return result.rowcount
+
+
+async def restore_archived_articles(
+    db: AsyncSession, summary_date: date, sources: list[str] | None = None
+) -> int:
+    """
+    Moves archived articles of the day back into `article`, e.g. to summarize the day again.
+    Articles whose URL was scraped again in the meantime stay in the archive. If anything
+    was restored, the summary of the day is deleted so it can be generated again. Commits.
+    """
+    start_date, end_date = day_range(summary_date)
+    archived = select(
+        *(getattr(ArticleArchive, column) for column in ARCHIVED_COLUMNS)
+    ).where(
+        ArticleArchive.published_at >= start_date,
+        ArticleArchive.published_at < end_date,
+    )
+    if sources:
+        archived = archived.where(ArticleArchive.source.in_(sources))
+
+    restored = (
+        insert(Article)
+        .from_select(ARCHIVED_COLUMNS, archived)
+        .returning(Article.id)
+        .cte("restored")
+    )
+    result = await db.execute(
+        delete(ArticleArchive)
+        .where(
+            ArticleArchive.published_at >= start_date,
+            ArticleArchive.published_at < end_date,
+            ArticleArchive.id.in_(select(restored.c.id)),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        await reset_daily_summary(db, summary_date)
+    await db.commit()
+    return result.rowcount
+
+
+async def reset_daily_summary(db: AsyncSession, summary_date: date) -> None:
+    """
+    Deletes the summary of the day, articles it referenced are released first
+    """
+    summary_id = select(DailySummary.id).where(DailySummary.date == summary_date)
+    await db.execute(
+        update(Article)
+        .where(Article.daily_summary_id.in_(summary_id))
+        .values(daily_summary_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        delete(DailySummary)
+        .where(DailySummary.date == summary_date)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def purge_expired_archive(
+    db: AsyncSession,
+    today: date | None = None,
+    retention_days: int = ARCHIVE_RETENTION_DAYS,
+) -> int:
+    if retention_days <= 0:
+        return 0
+    cutoff = datetime.combine(
+        (today or date.today()) - timedelta(days=retention_days), datetime.min.time()
+    )
+    result = await db.execute(
+        delete(ArticleArchive)
+        .where(ArticleArchive.published_at < cutoff)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def archive_day(summary_date: date) -> None:
+    """
+    Archives unreferenced articles of a summarized day and applies the retention policy.
+    Runs in its own session after the summary is committed, a failure only leaves the
+    articles in the hot table until the next run.
+    """
+    try:
+        async with database.Session() as db:
+            archived = await archive_unassigned_articles(db, summary_date)
+            purged = await purge_expired_archive(db)
+            await db.commit()
+        logger.info(
+            "[Archive] date=%s archived=%d purged=%d", summary_date, archived, purged
+        )
+    except Exception:
+        logger.exception("[Archive] Error archiving articles of %s", summary_date)
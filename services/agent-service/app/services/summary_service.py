@@ -1,7 +1,6 @@
-import asyncio
-from functools import partial
 from datetime import date, datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from langchain_google_genai import ChatGoogleGenerativeAI
 
@@ -12,45 +11,51 @@ from app.schemas import (
     Article as ArticleSchema,
     PeriodicSummaryResponse,
 )
-from app.agents.summary_agent import SummaryAgent
+from app.agents.summary_agent import SummaryAgent, run_all
 from app.agents.agent_config import AgentSettings
+from app.agents.llm_cache import llm_cache
+from app.agents.rate_governor import Priority, llm_governor
+from app.services import archive_service
 
 
-def create_summary_agent() -> SummaryAgent:
+def create_summary_agent(priority: Priority = Priority.DAILY) -> SummaryAgent:
     settings = AgentSettings()
     model = ChatGoogleGenerativeAI(
         model="gemini-2.5-flash",
         temperature=0,
         response_mime_type="application/json",
+        # retries are done by the governor, so they respect the shared quota
+        max_retries=1,
+    )
+    return SummaryAgent(
+        model, settings, cache=llm_cache, governor=llm_governor, priority=priority
     )
-    return SummaryAgent(model, settings)
 
 
-def fetch_articles_by_source(
-    db: Session, summary_date: date, source: str
+async def fetch_articles_by_source(
+    db: AsyncSession, summary_date: date, source: str
 ) -> list[Article]:
     start_date = datetime.combine(summary_date, datetime.min.time())
     end_date = start_date + timedelta(days=1)
 
-    return (
-        db.query(Article)
-        .filter(
+    result = await db.execute(
+        select(Article).where(
             Article.published_at >= start_date,
             Article.published_at < end_date,
             Article.source == source,
         )
-        .all()
     )
+    return list(result.scalars().all())
 
 
-def fetch_all_articles_grouped(
-    db: Session, summary_date: date
+async def fetch_all_articles_grouped(
+    db: AsyncSession, summary_date: date
 ) -> dict[str, list[Article]]:
     settings = AgentSettings()
     result = {}
 
     for source in settings.sources:
-        articles = fetch_articles_by_source(db, summary_date, source)
+        articles = await fetch_articles_by_source(db, summary_date, source)
         if articles:
             result[source] = articles
 
@@ -63,13 +68,13 @@ def fetch_all_articles_grouped(
     return result
 
 
-def process_source_summary(
+async def process_source_summary(
     agent: SummaryAgent,
     source: str,
     articles: list[ArticleSchema],
     summary_date: date,
 ) -> tuple[str, dict]:
-    partial_summary = agent.get_daily_summary_for_source(
+    partial_summary = await agent.get_daily_summary_for_source(
         articles=articles,
         source=source,
         summary_date=summary_date,
@@ -93,49 +98,34 @@ def convert_articles_to_schema(articles: list[Article]) -> list[ArticleSchema]:
     ]
 
 
-def delete_unassigned_articles(
-    db: Session, summary_date: date, referenced_ids: set[int]
-) -> None:
-    start_date = datetime.combine(summary_date, datetime.min.time())
-    end_date = start_date + timedelta(days=1)
-    db.query(Article).filter(
-        Article.published_at >= start_date,
-        Article.published_at < end_date,
-        ~Article.id.in_(referenced_ids),
-    ).delete(synchronize_session=False)
-
-
-def update_article_references(
-    db: Session, db_summary: DailySummary, references_data: dict, summary_date: date
+async def update_article_references(
+    db: AsyncSession,
+    db_summary: DailySummary,
+    references_data: dict,
 ) -> None:
     if not references_data:
         return
 
-    all_referenced_ids: set[int] = set()
-
     for categories_dict in references_data.values():
         for category_name, article_ids in categories_dict.items():
             if article_ids:
-                all_referenced_ids.update(article_ids)
-                db.query(Article).filter(Article.id.in_(article_ids)).update(
-                    {
-                        Article.daily_summary_id: db_summary.id,
-                        Article.category: category_name,
-                    },
-                    synchronize_session=False,
+                await db.execute(
+                    update(Article)
+                    .where(Article.id.in_(article_ids))
+                    .values(daily_summary_id=db_summary.id, category=category_name)
+                    .execution_options(synchronize_session=False)
                 )
 
-    delete_unassigned_articles(db, summary_date, all_referenced_ids)
 
-
-def replace_article_ids_with_urls(
-    db: Session, references: dict[str, list[int]]
+async def replace_article_ids_with_urls(
+    db: AsyncSession, references: dict[str, list[int]]
 ) -> dict[str, list[str]]:
     all_ids = []
     for source_refs in references.values():
         all_ids.extend(source_refs)
 
-    articles = db.query(Article).filter(Article.id.in_(all_ids)).all()
+    result = await db.execute(select(Article).where(Article.id.in_(all_ids)))
+    articles = result.scalars().all()
     id_to_url = {article.id: article.url for article in articles}
 
     return {
@@ -216,11 +206,11 @@ def fill_dates_in_events(
 
 
 async def get_daily_summary_async(
-    summary_date: date, db: Session
+    summary_date: date, db: AsyncSession
 ) -> DailySummaryResponse:
     existing_summary = (
-        db.query(DailySummary).filter(DailySummary.date == summary_date).first()
-    )
+        await db.execute(select(DailySummary).where(DailySummary.date == summary_date))
+    ).scalar_one_or_none()
 
     if existing_summary:
         raise HTTPException(
@@ -228,9 +218,11 @@ async def get_daily_summary_async(
             detail=f"Daily summary for {summary_date} already exists",
         )
 
-    articles_by_source = fetch_all_articles_grouped(db, summary_date)
+    articles_by_source = await fetch_all_articles_grouped(db, summary_date)
 
-    agent = create_summary_agent()
+    # regenerating older days must not delay the summary of yesterday
+    is_backfill = summary_date < date.today() - timedelta(days=1)
+    agent = create_summary_agent(Priority.BACKFILL if is_backfill else Priority.DAILY)
     settings = AgentSettings()
 
     articles_schema_by_source = {
@@ -238,23 +230,15 @@ async def get_daily_summary_async(
         for source, articles in articles_by_source.items()
     }
 
-    loop = asyncio.get_event_loop()
-
-    tasks = [
-        loop.run_in_executor(
-            None,
-            partial(
-                process_source_summary,
-                agent,
-                source,
-                articles_schema_by_source.get(source, []),
-                summary_date,
-            ),
+    results = await run_all(
+        process_source_summary(
+            agent,
+            source,
+            articles_schema_by_source.get(source, []),
+            summary_date,
         )
         for source in settings.sources
-    ]
-
-    results = await asyncio.gather(*tasks)
+    )
 
     merged_summaries = {}
     merged_categories = {}
@@ -276,24 +260,27 @@ async def get_daily_summary_async(
         categories=merged_categories,
     )
     db.add(db_summary)
-    db.flush()
+    await db.flush()
 
-    update_article_references(db, db_summary, merged_references, summary_date)
+    await update_article_references(db, db_summary, merged_references)
 
-    db.commit()
-    db.refresh(db_summary)
+    await db.commit()
+    await db.refresh(db_summary)
+
+    # unreferenced articles are moved to the cold archive outside the summary transaction
+    await archive_service.archive_day(summary_date)
 
     db_summary.references = merged_references
 
     return db_summary
 
 
-def get_periodic_summary(
+async def get_periodic_summary(
     start: date,
     end: date,
     sources: list[str],
     categories: list[str],
-    db: Session,
+    db: AsyncSession,
 ) -> PeriodicSummaryResponse:
     if start > end:
         raise HTTPException(
@@ -302,9 +289,14 @@ def get_periodic_summary(
         )
 
     summaries = (
-        db.query(ViewDailySummary)
-        .filter(ViewDailySummary.date >= start, ViewDailySummary.date <= end)
-        .order_by(ViewDailySummary.date.desc())
+        (
+            await db.execute(
+                select(ViewDailySummary)
+                .where(ViewDailySummary.date >= start, ViewDailySummary.date <= end)
+                .order_by(ViewDailySummary.date.desc())
+            )
+        )
+        .scalars()
         .all()
     )
 
@@ -319,8 +311,8 @@ def get_periodic_summary(
 
     summaries_valid = [DailySummaryResponse.model_validate(s) for s in summaries]
 
-    agent = create_summary_agent()
-    periodic_summary = agent.get_periodic_summary(
+    agent = create_summary_agent(Priority.INTERACTIVE)
+    periodic_summary = await agent.get_periodic_summary(
         daily_summaries=summaries_valid,
         sources=sources,
         categories=categories,
@@ -328,7 +320,7 @@ def get_periodic_summary(
         end_date=end,
     )
 
-    references_with_urls = replace_article_ids_with_urls(
+    references_with_urls = await replace_article_ids_with_urls(
         db, periodic_summary.references
     )
 
@@ -358,14 +350,22 @@ def get_periodic_summary(
     )
 
 
-def get_recent_daily_summaries(db: Session) -> list[dict]:
+async def get_recent_daily_summaries(db: AsyncSession) -> list[dict]:
     end_date = date.today() - timedelta(days=1)
     start_date = end_date - timedelta(days=6)
 
     summaries = (
-        db.query(ViewDailySummary)
-        .filter(ViewDailySummary.date >= start_date, ViewDailySummary.date <= end_date)
-        .order_by(ViewDailySummary.date.desc())
+        (
+            await db.execute(
+                select(ViewDailySummary)
+                .where(
+                    ViewDailySummary.date >= start_date,
+                    ViewDailySummary.date <= end_date,
+                )
+                .order_by(ViewDailySummary.date.desc())
+            )
+        )
+        .scalars()
         .all()
     )
 
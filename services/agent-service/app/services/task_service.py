@@ -3,7 +3,7 @@ import logging
 from typing import Any
 from datetime import datetime, date
 from app.schemas.task_status import TaskStatus
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.summary_service import get_periodic_summary
 
 
@@ -85,16 +85,16 @@ def stop_cleanup_task():
         cleanup_task = None
 
 
-def generate_summary_task(
+async def generate_summary_task(
     task_id: str,
     start: date,
     end: date,
     sources: list[str],
     categories: list[str],
-    db: Session,
+    db: AsyncSession,
 ):
     try:
-        result = get_periodic_summary(start, end, sources, categories, db)
+        result = await get_periodic_summary(start, end, sources, categories, db)
         update_task_result(task_id, result.model_dump())
     except Exception as e:
         logger.exception("[Task %s] Error generating summary", task_id)
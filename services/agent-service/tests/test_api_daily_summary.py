@@ -83,3 +83,17 @@ def test_get_recent_summaries(mock_service):
         data[0]["summary"]
         == "Roxie Węgiel's outfit revolutionizes polish technology market. Meanwhile, fortnite releases 3 new Arcane skins."
     )
+
+
+@patch("app.api.v1.daily_summary.archive_service.restore_archived_articles")
+def test_restore_archived_articles(mock_restore):
+    mock_restore.return_value = 7
+
+    response = client.post(
+        f"{BASE_URL}/archive/restore?summary_date=2026-01-01&sources=BBC&sources=TVN24"
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"summary_date": "2026-01-01", "restored": 7}
+    args, _ = mock_restore.call_args
+    assert args[1:] == (date(2026, 1, 1), ["BBC", "TVN24"])
@@ -0,0 +1,124 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+
+import pytest
+from app.services import archive_service
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def compiled(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def mock_db():
+    db = MagicMock(spec=AsyncSession)
+    db.execute.return_value = MagicMock(rowcount=3)
+    return db
+
+
+@pytest.fixture
+def mock_session(mock_db):
+    session = MagicMock()
+    session.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+    session.return_value.__aexit__ = AsyncMock(return_value=False)
+    with patch("app.services.archive_service.database.Session", session):
+        yield session
+
+
+# --- UNIT TESTS ---
+def test_archive_moves_unassigned_articles_in_one_statement(mock_db):
+    archived = asyncio.run(
+        archive_service.archive_unassigned_articles(mock_db, date(2026, 1, 1))
+    )
+
+    assert archived == 3
+    mock_db.execute.assert_awaited_once()
+    sql = compiled(mock_db.execute.call_args.args[0])
+    assert sql.startswith("WITH moved AS \n(DELETE FROM article")
+    assert "article.daily_summary_id IS NULL" in sql
+    assert "'2026-01-01 00:00:00'" in sql and "'2026-01-02 00:00:00'" in sql
+    assert "INSERT INTO article_archive" in sql
+    assert "NOT IN" not in sql
+
+
+def test_restore_keeps_rows_not_taken_back_in_archive(mock_db):
+    restored = asyncio.run(
+        archive_service.restore_archived_articles(
+            mock_db, date(2026, 1, 1), ["Pudelek"]
+        )
+    )
+
+    assert restored == 3
+    sql = compiled(mock_db.execute.call_args_list[0].args[0])
+    assert sql.startswith("WITH restored AS \n(INSERT INTO article")
+    assert "article_archive.source IN ('Pudelek')" in sql
+    assert "article_archive.id IN (SELECT restored.id" in sql
+    mock_db.commit.assert_awaited_once()
+
+
+def test_restore_deletes_summary_of_the_day(mock_db):
+    asyncio.run(archive_service.restore_archived_articles(mock_db, date(2026, 1, 1)))
+
+    release, reset = (
+        compiled(call.args[0]) for call in mock_db.execute.call_args_list[1:]
+    )
+    assert release.startswith("UPDATE article SET daily_summary_id=NULL")
+    assert "daily_summary.date = '2026-01-01'" in release
+    assert reset.startswith("DELETE FROM daily_summary")
+    assert "daily_summary.date = '2026-01-01'" in reset
+
+
+def test_restore_of_nothing_keeps_summary(mock_db):
+    mock_db.execute.return_value = MagicMock(rowcount=0)
+
+    restored = asyncio.run(
+        archive_service.restore_archived_articles(mock_db, date(2026, 1, 1))
+    )
+
+    assert restored == 0
+    mock_db.execute.assert_awaited_once()
+    mock_db.commit.assert_awaited_once()
+
+
+def test_purge_removes_rows_past_retention(mock_db):
+    purged = asyncio.run(
+        archive_service.purge_expired_archive(
+            mock_db, today=date(2026, 3, 1), retention_days=30
+        )
+    )
+
+    assert purged == 3
+    sql = compiled(mock_db.execute.call_args.args[0])
+    assert "article_archive.published_at < '2026-01-30 00:00:00'" in sql
+
+
+def test_purge_disabled_with_zero_retention(mock_db):
+    assert (
+        asyncio.run(archive_service.purge_expired_archive(mock_db, retention_days=0))
+        == 0
+    )
+    mock_db.execute.assert_not_awaited()
+
+
+def test_archive_day_commits_in_own_session(mock_session, mock_db):
+    asyncio.run(archive_service.archive_day(date(2026, 1, 1)))
+
+    mock_session.assert_called_once()
+    assert mock_db.execute.await_count == 2
+    mock_db.commit.assert_awaited_once()
+
+
+def test_archive_day_failure_is_not_raised(mock_session, mock_db):
+    mock_db.execute.side_effect = Exception("Roxie Węgiel tripped over the cable")
+
+    asyncio.run(archive_service.archive_day(date(2026, 1, 1)))
+
+    mock_db.commit.assert_not_awaited()
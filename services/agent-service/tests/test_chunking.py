@@ -0,0 +1,91 @@
+from datetime import datetime
+
+from app.agents.chunking import (
+    chunk_articles,
+    estimate_tokens,
+    merge_counts,
+    merge_references,
+    partial_summaries,
+)
+from app.schemas.article import Article
+
+
+def make_article(article_id: int, category: str, words: int = 10) -> Article:
+    return Article(
+        id=article_id,
+        url=f"http://pudelek.pl/{article_id}",
+        published_at=datetime(2026, 1, 1),
+        title=f"Kacper Siemionek part {article_id}",
+        description="pierogi " * words,
+        source="Pudelek",
+        categories=[category],
+    )
+
+
+# --- UNIT TESTS ---
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Roxie") == 2
+    assert estimate_tokens("x" * 400) == 100
+
+
+def test_articles_within_budget_stay_in_one_chunk_in_order():
+    articles = [make_article(1, "plotki"), make_article(2, "gwiazdy")]
+
+    assert chunk_articles(articles, 10_000) == [articles]
+
+
+def test_articles_over_budget_are_packed_by_category():
+    articles = [
+        make_article(1, "plotki"),
+        make_article(2, "gwiazdy"),
+        make_article(3, "plotki"),
+        make_article(4, "gwiazdy"),
+    ]
+    budget = 2 * max(
+        estimate_tokens(article.full_description) + 1 for article in articles
+    )
+
+    chunks = chunk_articles(articles, budget)
+
+    assert [[article.id for article in chunk] for chunk in chunks] == [[2, 4], [1, 3]]
+
+
+def test_oversized_article_gets_own_chunk():
+    articles = [make_article(1, "plotki", words=500), make_article(2, "plotki")]
+
+    chunks = chunk_articles(articles, 100)
+
+    assert [[article.id for article in chunk] for chunk in chunks] == [[1], [2]]
+
+
+def test_merge_helpers_combine_chunk_outputs():
+    partials = [
+        {
+            "summaries": {"Culture": "Roxie opens a museum.", "Sport": ""},
+            "categories": {"Culture": 2, "Sport": 0},
+            "references": {"Culture": [1, 2], "Sport": []},
+        },
+        {
+            "summaries": {"Culture": "Kacper sings.", "Sport": "Kacper runs."},
+            "categories": {"Culture": 1, "Sport": 1},
+            "references": {"Culture": [2, 3], "Sport": [4]},
+        },
+    ]
+    categories = ["Culture", "Sport", "Economy"]
+
+    assert merge_references(partials, categories) == {
+        "Culture": [1, 2, 3],
+        "Sport": [4],
+        "Economy": [],
+    }
+    assert merge_counts(partials, categories) == {
+        "Culture": 3,
+        "Sport": 1,
+        "Economy": 0,
+    }
+    assert partial_summaries(partials, categories) == {
+        "Culture": ["Roxie opens a museum.", "Kacper sings."],
+        "Sport": ["Kacper runs."],
+        "Economy": [],
+    }
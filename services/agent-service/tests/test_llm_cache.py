@@ -0,0 +1,180 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import asyncio
+import json
+
+import pytest
+from app.agents.llm_cache import LLMCache
+from app.agents.summary_agent import SummaryAgent
+from app.core.metrics import registry
+from langchain_core.runnables import RunnableLambda
+
+SUMMARY = {
+    "summaries": {"Culture": "Roxie Węgiel opens a museum of her own outfits."},
+    "categories": {"Culture": 1},
+    "references": {"Culture": [7]},
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def cache_requests(result: str) -> float:
+    return (
+        registry.get_sample_value(
+            "agent_llm_cache_requests_total",
+            {"prompt": "daily_summary", "result": result},
+        )
+        or 0
+    )
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return LLMCache(
+        str(tmp_path / "cache" / "llm.sqlite3"), ttl=60, max_entries=2, clock=clock
+    )
+
+
+@pytest.fixture
+def model_calls():
+    return []
+
+
+@pytest.fixture
+def agent(cache, model_calls):
+    def model(prompt_value):
+        model_calls.append(prompt_value.to_string())
+        return json.dumps(SUMMARY)
+
+    settings = MagicMock()
+    settings.article_categories = ["Culture"]
+    settings.chunk_token_budget = 1000
+    settings.llm_max_concurrency = 2
+    settings.llm_timeout_seconds = 5
+    settings.llm_requests_per_minute = 0
+    settings.llm_tokens_per_minute = 0
+    settings.llm_max_retries = 0
+    settings.llm_backoff_seconds = 0
+    settings.prompt_compression = False
+    return SummaryAgent(RunnableLambda(model), settings, cache=cache)
+
+
+def article(description: str):
+    item = MagicMock()
+    item.full_description = description
+    return item
+
+
+# --- UNIT TESTS ---
+def test_get_returns_stored_value(cache):
+    cache.put("kacper", SUMMARY)
+
+    assert cache.get("kacper") == SUMMARY
+    assert cache.get("roxie") is None
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.put("kacper", SUMMARY)
+    clock.now += 61
+
+    assert cache.get("kacper") is None
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    cache.put("kacper", {"n": 1})
+    clock.now += 1
+    cache.put("roxie", {"n": 2})
+    clock.now += 1
+    cache.get("kacper")
+    clock.now += 1
+    cache.put("pudelek", {"n": 3})
+
+    assert cache.get("roxie") is None
+    assert cache.get("kacper") == {"n": 1}
+    assert cache.get("pudelek") == {"n": 3}
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"), max_entries=0)
+    cache.put("kacper", SUMMARY)
+
+    assert cache.get("kacper") is None
+
+
+def test_concurrent_writers(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"), max_entries=100)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: cache.put(f"key-{i}", {"n": i}), range(50)))
+
+    assert all(cache.get(f"key-{i}") == {"n": i} for i in range(50))
+
+
+def test_key_depends_on_every_part():
+    base = LLMCache.key("1", "gemini-2.5-flash", 0, "prompt")
+
+    assert base == LLMCache.key("1", "gemini-2.5-flash", 0, "prompt")
+    assert base != LLMCache.key("2", "gemini-2.5-flash", 0, "prompt")
+    assert base != LLMCache.key("1", "gemini-2.5-pro", 0, "prompt")
+    assert base != LLMCache.key("1", "gemini-2.5-flash", 0.7, "prompt")
+    assert base != LLMCache.key("1", "gemini-2.5-flash", 0, "prompt 2")
+
+
+def test_agent_reuses_cached_summary(agent, model_calls):
+    hits, misses = cache_requests("hit"), cache_requests("miss")
+    articles = [article("1 - Kacper Siemionek opens a dumpling bar")]
+
+    first = asyncio.run(agent.get_daily_summary_for_source(articles, "BBC", None))
+    second = asyncio.run(agent.get_daily_summary_for_source(articles, "BBC", None))
+
+    assert first == second
+    assert first["summaries"]["BBC"] == SUMMARY["summaries"]
+    assert len(model_calls) == 1
+    assert cache_requests("hit") - hits == 1
+    assert cache_requests("miss") - misses == 1
+
+
+def test_agent_calls_model_for_different_inputs(agent, model_calls):
+    asyncio.run(
+        agent.get_daily_summary_for_source([article("1 - Kacper")], "BBC", None)
+    )
+    asyncio.run(
+        agent.get_daily_summary_for_source([article("1 - Kacper")], "TVN24", None)
+    )
+    asyncio.run(agent.get_daily_summary_for_source([article("2 - Roxie")], "BBC", None))
+
+    assert len(model_calls) == 3
+
+
+def test_agent_uses_cache_outside_event_loop(agent, cache, monkeypatch):
+    calls = []
+
+    def outside_loop(method):
+        def wrapper(*args):
+            # raises if called on the thread running the event loop
+            asyncio.run(asyncio.sleep(0))
+            calls.append(method.__name__)
+            return method(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(cache, "get", outside_loop(cache.get))
+    monkeypatch.setattr(cache, "put", outside_loop(cache.put))
+
+    asyncio.run(
+        agent.get_daily_summary_for_source([article("1 - Kacper")], "BBC", None)
+    )
+
+    assert calls == ["get", "put"]
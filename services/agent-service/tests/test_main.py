@@ -8,3 +8,9 @@ def test_service_test_client():
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"service": "agent"}
+
+
+def test_metrics_endpoint():
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "agent_llm_cache_requests" in response.text
@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pytest
+from app.agents.prompt_compression import (
+    PromptCompressor,
+    abbreviate_categories,
+    drop_title,
+    remove_boilerplate,
+    select_sentences,
+    truncate,
+)
+from app.core.metrics import registry
+from app.schemas.article import Article
+
+
+def make_article(title: str, description: str, categories: list[str] | None = None):
+    return Article(
+        id=1,
+        url="http://pudelek.pl/roxie",
+        published_at=datetime(2026, 1, 1),
+        title=title,
+        description=description,
+        source="NewYorkTimes",
+        categories=categories or [],
+    )
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def compressor():
+    return PromptCompressor(max_description_chars=120, max_categories=3)
+
+
+# --- UNIT TESTS ---
+def test_description_repeating_title_is_dropped():
+    title = "Roxie Węgiel wore this to the market!?!?!? [PHOTOS]"
+
+    assert drop_title("Roxie Węgiel wore this to the market", title) == ""
+    assert drop_title(title, title) == ""
+    assert drop_title(f"{title}. She bought carrots.", title) == "She bought carrots."
+    assert drop_title("She bought carrots.", title) == "She bought carrots."
+    assert drop_title("She bought carrots.", None) == "She bought carrots."
+
+
+def test_boilerplate_is_removed():
+    assert (
+        remove_boilerplate(
+            "Kacper Siemionek opened a dumpling bar. Continue reading... "
+            "https://example.com/kacper"
+        )
+        == "Kacper Siemionek opened a dumpling bar."
+    )
+    assert (
+        remove_boilerplate(
+            "Roxie released a song [&#8230;] The post Roxie sings appeared first on Pudelek."
+        )
+        == "Roxie released a song"
+    )
+    assert remove_boilerplate("Fans read more books than ever.") == (
+        "Fans read more books than ever."
+    )
+
+
+def test_truncate_cuts_at_sentence_or_word():
+    text = "Kacper Siemionek opened a bar. It serves dumplings with everything inside."
+
+    assert truncate(text, 200) == text
+    assert truncate(text, 40) == "Kacper Siemionek opened a bar."
+    assert truncate("Kacper Siemionek opened a dumpling bar", 20) == "Kacper Siemionek…"
+
+
+def test_categories_are_deduplicated_and_capped():
+    categories = ["Technology", "technology", "Pudelek Inc", "Gossip", "Dumplings"]
+
+    assert abbreviate_categories(categories, 3) == [
+        "Technology",
+        "Pudelek Inc",
+        "Gossip",
+    ]
+
+
+def test_select_sentences_keeps_most_related_in_order():
+    description = (
+        "It was a sunny day. Kacper Siemionek opened a dumpling bar. "
+        "Nobody expected it. The dumpling bar is closed on Mondays."
+    )
+
+    assert (
+        select_sentences(description, "Kacper Siemionek opens dumpling bar", 2)
+        == "Kacper Siemionek opened a dumpling bar. The dumpling bar is closed on Mondays."
+    )
+    assert select_sentences("One sentence.", "Kacper", 2) == "One sentence."
+
+
+def test_compress_shrinks_articles_and_reports_saved_tokens(compressor):
+    saved = registry.get_sample_value(
+        "agent_prompt_tokens_saved_sum", {"source": "NewYorkTimes"}
+    )
+    article = make_article(
+        "Kacper Siemionek opens a dumpling bar",
+        "Kacper Siemionek opens a dumpling bar. " + "It serves pierogi. " * 20,
+        ["Food", "Kacper Siemionek", "Dumplings", "Restaurants", "Poland"],
+    )
+
+    [compressed] = compressor.compress([article], "NewYorkTimes")
+
+    assert compressed.description.startswith("It serves pierogi.")
+    assert len(compressed.description) <= 120
+    assert compressed.categories == ["Food", "Kacper Siemionek", "Dumplings"]
+    assert article.categories[-1] == "Poland"
+    assert (
+        registry.get_sample_value(
+            "agent_prompt_tokens_saved_sum", {"source": "NewYorkTimes"}
+        )
+        - (saved or 0)
+        > 0
+    )
+
+
+def test_disabled_compressor_returns_articles_unchanged():
+    article = make_article("Roxie", "Roxie", ["Gossip"] * 10)
+
+    assert PromptCompressor(enabled=False).compress([article], "BBC") == [article]
@@ -0,0 +1,185 @@
+import asyncio
+import time
+
+import pytest
+from app.agents.rate_governor import Priority, RateGovernor, status_code
+from app.core.metrics import registry
+
+
+class ApiError(Exception):
+    def __init__(self, code: int):
+        super().__init__(f"{code} Kacper Siemionek ate the quota")
+        self.code = code
+
+
+def flaky(failures: list[Exception], calls: list[int]):
+    async def function():
+        calls.append(len(calls))
+        if failures:
+            raise failures.pop(0)
+        return "Roxie Węgiel"
+
+    return function
+
+
+def sample(name: str, labels: dict) -> float:
+    return registry.get_sample_value(name, labels) or 0
+
+
+# --- UNIT TESTS ---
+def test_waiting_calls_are_served_by_priority():
+    governor = RateGovernor(max_concurrency=1)
+    order = []
+
+    async def queued(priority: Priority):
+        async with governor.slot(10, priority):
+            order.append(priority)
+
+    async def main():
+        async with governor.slot(10):
+            tasks = [
+                asyncio.create_task(queued(priority))
+                for priority in (
+                    Priority.BACKFILL,
+                    Priority.DAILY,
+                    Priority.INTERACTIVE,
+                )
+            ]
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+    assert order == [Priority.INTERACTIVE, Priority.DAILY, Priority.BACKFILL]
+
+
+def test_concurrency_is_bounded():
+    governor = RateGovernor(max_concurrency=2)
+    running, peak = 0, 0
+
+    async def call():
+        nonlocal running, peak
+        async with governor.slot(10):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+
+
+def test_requests_per_minute_budget():
+    governor = RateGovernor(requests_per_minute=2, window=0.2)
+    sent_at = []
+
+    async def call():
+        async with governor.slot(10):
+            sent_at.append(time.monotonic())
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(3)))
+
+    asyncio.run(main())
+
+    assert sent_at[1] - sent_at[0] < 0.1
+    assert sent_at[2] - sent_at[0] >= 0.19
+
+
+def test_tokens_per_minute_budget():
+    governor = RateGovernor(tokens_per_minute=100, window=0.2)
+    sent_at = []
+
+    async def call(tokens: int):
+        async with governor.slot(tokens):
+            sent_at.append(time.monotonic())
+
+    async def main():
+        await asyncio.gather(call(60), call(30), call(60))
+
+    asyncio.run(main())
+
+    assert sent_at[1] - sent_at[0] < 0.1
+    assert sent_at[2] - sent_at[0] >= 0.19
+
+
+def test_call_larger_than_token_budget_is_sent():
+    governor = RateGovernor(tokens_per_minute=100, window=60)
+
+    async def main():
+        async with governor.slot(500):
+            return True
+
+    assert asyncio.run(asyncio.wait_for(main(), timeout=1))
+
+
+def test_rate_limited_calls_are_retried():
+    governor = RateGovernor(max_retries=3, backoff_seconds=0)
+    retries = sample("agent_llm_retries_total", {"status": "429"})
+    calls = []
+
+    result = asyncio.run(
+        governor.call(flaky([ApiError(429), ApiError(503)], calls), tokens=10)
+    )
+
+    assert result == "Roxie Węgiel"
+    assert len(calls) == 3
+    assert sample("agent_llm_retries_total", {"status": "429"}) - retries == 1
+
+
+def test_client_errors_are_not_retried():
+    governor = RateGovernor(max_retries=3, backoff_seconds=0)
+    calls = []
+
+    with pytest.raises(ApiError):
+        asyncio.run(governor.call(flaky([ApiError(400)], calls), tokens=10))
+    assert len(calls) == 1
+
+
+def test_retries_are_limited():
+    governor = RateGovernor(max_retries=2, backoff_seconds=0)
+    calls = []
+
+    with pytest.raises(ApiError):
+        asyncio.run(governor.call(flaky([ApiError(500)] * 5, calls), tokens=10))
+    assert len(calls) == 3
+
+
+def test_backoff_grows_up_to_limit():
+    governor = RateGovernor(backoff_seconds=1, max_backoff_seconds=5)
+
+    assert all(0 <= governor.backoff(0) <= 1 for _ in range(20))
+    assert all(0 <= governor.backoff(10) <= 5 for _ in range(20))
+
+
+def test_status_code_of_wrapped_error():
+    try:
+        try:
+            raise ApiError(429)
+        except ApiError as error:
+            raise RuntimeError("Pudelek rate limit") from error
+    except RuntimeError as error:
+        assert status_code(error) == 429
+
+    assert status_code(ValueError("no code")) is None
+
+
+def test_queue_wait_is_reported():
+    governor = RateGovernor()
+    waits = sample("agent_llm_queue_wait_seconds_count", {"priority": "interactive"})
+
+    async def main():
+        async with governor.slot(10, Priority.INTERACTIVE):
+            pass
+
+    asyncio.run(main())
+
+    assert (
+        sample("agent_llm_queue_wait_seconds_count", {"priority": "interactive"})
+        - waits
+        == 1
+    )
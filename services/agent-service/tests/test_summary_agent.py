@@ -1,11 +1,13 @@
-from datetime import date
-from unittest.mock import MagicMock, PropertyMock, patch
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+import asyncio
 import json
 
 import pytest
-from app.agents.summary_agent import SummaryAgent
+from app.agents.summary_agent import SummaryAgent, run_all
 from app.schemas.article import Article
 from app.schemas.daily_summary import DailySummary
+from langchain_core.runnables import RunnableLambda
 
 # --- FIXTURES ---
 
@@ -15,6 +17,14 @@ def mock_settings():
     settings = MagicMock()
     settings.article_categories = ["Technology", "Politics"]
     settings.sources = ["BBC", "TVN24"]
+    settings.chunk_token_budget = 30000
+    settings.llm_max_concurrency = 2
+    settings.llm_timeout_seconds = 5
+    settings.llm_requests_per_minute = 0
+    settings.llm_tokens_per_minute = 0
+    settings.llm_max_retries = 0
+    settings.llm_backoff_seconds = 0
+    settings.prompt_compression = False
     return settings
 
 
@@ -51,7 +61,7 @@ def test_get_daily_summary_for_source(mock_model, mock_settings):
     }
 
     mock_final_chain = MagicMock()
-    mock_final_chain.invoke.return_value = json.dumps(expected_output)
+    mock_final_chain.ainvoke = AsyncMock(return_value=json.dumps(expected_output))
 
     with patch(
         "app.agents.summary_agent.SummaryAgent.daily_summary_for_source_prompt",
@@ -63,7 +73,9 @@ def test_get_daily_summary_for_source(mock_model, mock_settings):
         mock_prompt_obj.__or__.return_value = mock_model
         mock_model.__or__.return_value = mock_final_chain
 
-        result = agent.get_daily_summary_for_source([article], "BBC", test_date)
+        result = asyncio.run(
+            agent.get_daily_summary_for_source([article], "BBC", test_date)
+        )
 
     assert (
         result["summaries"]["BBC"]["Technology"]
@@ -77,7 +89,7 @@ def test_get_daily_summary_for_source_empty(mock_model, mock_settings):
     agent = SummaryAgent(model=mock_model, settings=mock_settings)
     test_date = date(2026, 1, 1)
 
-    result = agent.get_daily_summary_for_source([], "BBC", test_date)
+    result = asyncio.run(agent.get_daily_summary_for_source([], "BBC", test_date))
 
     assert result["summaries"]["BBC"]["Technology"] == ""
     assert result["categories"]["BBC"]["Technology"] == 0
@@ -108,7 +120,9 @@ def test_get_periodic_summary_filtering(mock_model, mock_settings):
     }
 
     mock_final_chain = MagicMock()
-    mock_final_chain.invoke.return_value = json.dumps(mock_output)  # <-- poprawka
+    mock_final_chain.ainvoke = AsyncMock(
+        return_value=json.dumps(mock_output)
+    )  # <-- poprawka
 
     with patch(
         "app.agents.summary_agent.SummaryAgent.periodic_summary_prompt",
@@ -120,12 +134,14 @@ def test_get_periodic_summary_filtering(mock_model, mock_settings):
         mock_prompt_obj.__or__.return_value = mock_model
         mock_model.__or__.return_value = mock_final_chain
 
-        agent.get_periodic_summary(
-            daily_summaries=[daily_mock],
-            sources=["BBC"],
-            categories=["Technology"],
-            start_date=date(2026, 1, 1),
-            end_date=date(2026, 1, 7),
+        asyncio.run(
+            agent.get_periodic_summary(
+                daily_summaries=[daily_mock],
+                sources=["BBC"],
+                categories=["Technology"],
+                start_date=date(2026, 1, 1),
+                end_date=date(2026, 1, 7),
+            )
         )
 
     assert "BBC" in daily_mock.summaries
@@ -154,7 +170,7 @@ def test_get_periodic_summary_structure(mock_model, mock_settings):
     }
 
     mock_final_chain = MagicMock()
-    mock_final_chain.invoke.return_value = json.dumps(mock_output)
+    mock_final_chain.ainvoke = AsyncMock(return_value=json.dumps(mock_output))
 
     with patch(
         "app.agents.summary_agent.SummaryAgent.periodic_summary_prompt",
@@ -165,15 +181,175 @@ def test_get_periodic_summary_structure(mock_model, mock_settings):
         mock_prompt_obj.__or__.return_value = mock_model
         mock_model.__or__.return_value = mock_final_chain
 
-        result = agent.get_periodic_summary(
-            daily_summaries=[],
-            sources=["BBC"],
-            categories=["Technology"],
-            start_date=date(2026, 1, 1),
-            end_date=date(2026, 1, 7),
+        result = asyncio.run(
+            agent.get_periodic_summary(
+                daily_summaries=[],
+                sources=["BBC"],
+                categories=["Technology"],
+                start_date=date(2026, 1, 1),
+                end_date=date(2026, 1, 7),
+            )
         )
 
     assert result.start_date == date(2026, 1, 1)
     assert result.main_summary == "Weekly recap text"
     assert result.trends["rising"] == ["Technology"]
     assert result.category_totals["Technology"] == 10
+
+
+def test_get_daily_summary_for_source_map_reduce(mock_settings):
+    mock_settings.chunk_token_budget = 30
+    prompts = []
+
+    def model(prompt_value):
+        prompt = prompt_value.to_string()
+        prompts.append(prompt)
+        if "partial summaries" in prompt:
+            return json.dumps({"summaries": {"Technology": "Merged tech news."}})
+        article_id = 1 if "id: 1," in prompt else 2
+        return json.dumps(
+            {
+                "summaries": {
+                    "Technology": f"Tech part {article_id}.",
+                    "Politics": "Roxie for president." if article_id == 2 else "",
+                },
+                "categories": {"Technology": 1, "Politics": article_id - 1},
+                "references": {
+                    "Technology": [article_id],
+                    "Politics": [article_id] if article_id == 2 else [],
+                },
+            }
+        )
+
+    agent = SummaryAgent(model=RunnableLambda(model), settings=mock_settings)
+    articles = [
+        Article(
+            id=article_id,
+            url=f"http://kacpersiemionek.com/{article_id}",
+            published_at=datetime(2026, 1, 1),
+            title="Kacper Siemionek",
+            description="Kacper Siemionek releases a new smartphone. " * 2,
+            source="BBC",
+        )
+        for article_id in (1, 2)
+    ]
+
+    result = asyncio.run(
+        agent.get_daily_summary_for_source(articles, "BBC", date(2026, 1, 1))
+    )
+
+    assert len(prompts) == 3
+    assert result["summaries"]["BBC"] == {
+        "Technology": "Merged tech news.",
+        "Politics": "Roxie for president.",
+    }
+    assert result["categories"]["BBC"] == {"Technology": 2, "Politics": 1}
+    assert result["references"]["BBC"] == {"Technology": [1, 2], "Politics": [2]}
+
+
+def test_invoke_prompt_times_out(mock_settings):
+    mock_settings.llm_timeout_seconds = 0.01
+
+    async def model(prompt_value):
+        await asyncio.sleep(1)
+        return "{}"
+
+    agent = SummaryAgent(model=RunnableLambda(model), settings=mock_settings)
+    article = MagicMock(spec=Article)
+    article.full_description = "Kacper Siemionek is still thinking about it"
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            agent.get_daily_summary_for_source([article], "BBC", date(2026, 1, 1))
+        )
+
+
+def test_invoke_prompt_bounds_concurrent_calls(mock_settings):
+    running, peak = 0, 0
+
+    async def model(prompt_value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return json.dumps({"summaries": {}})
+
+    agent = SummaryAgent(model=RunnableLambda(model), settings=mock_settings)
+
+    async def summarize_sources():
+        return await run_all(
+            agent.summarize_articles([], source) for source in ["BBC", "TVN24"] * 3
+        )
+
+    assert len(asyncio.run(summarize_sources())) == 6
+    assert peak == mock_settings.llm_max_concurrency
+
+
+def test_run_all_cancels_remaining_tasks_on_failure():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def failing():
+        raise ValueError("Pudelek is down")
+
+    with pytest.raises(ValueError, match="Pudelek is down"):
+        asyncio.run(run_all([slow(), failing()]))
+    assert cancelled == [True]
+
+
+def test_invoke_prompt_retries_rate_limited_calls(mock_settings):
+    mock_settings.llm_max_retries = 2
+    calls = []
+
+    class RateLimitError(Exception):
+        code = 429
+
+    def model(prompt_value):
+        calls.append(prompt_value)
+        if len(calls) == 1:
+            raise RateLimitError("Too many Roxie Węgiel outfits")
+        return json.dumps({"summaries": {"Technology": "Back online."}})
+
+    agent = SummaryAgent(model=RunnableLambda(model), settings=mock_settings)
+
+    output = asyncio.run(agent.summarize_articles([], "BBC"))
+
+    assert output["summaries"]["Technology"] == "Back online."
+    assert len(calls) == 2
+
+
+def test_articles_are_compressed_before_prompt(mock_settings):
+    mock_settings.prompt_compression = True
+    mock_settings.prompt_max_description_chars = 600
+    mock_settings.prompt_max_categories = 2
+    mock_settings.prompt_max_sentences = 0
+    prompts = []
+
+    def model(prompt_value):
+        prompts.append(prompt_value.to_string())
+        return json.dumps({"summaries": {}, "categories": {}, "references": {}})
+
+    agent = SummaryAgent(model=RunnableLambda(model), settings=mock_settings)
+    article = Article(
+        id=1,
+        url="http://kacpersiemionek.com/1",
+        published_at=datetime(2026, 1, 1),
+        title="Kacper Siemionek releases a smartphone",
+        description="Kacper Siemionek releases a smartphone. Continue reading...",
+        source="NewYorkTimes",
+        categories=["Technology", "Smartphones", "Kacper Siemionek"],
+    )
+
+    asyncio.run(
+        agent.get_daily_summary_for_source([article], "NewYorkTimes", date(2026, 1, 1))
+    )
+
+    assert "Continue reading" not in prompts[0]
+    assert "['Technology', 'Smartphones']" in prompts[0]
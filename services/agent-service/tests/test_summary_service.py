@@ -1,35 +1,39 @@
 from datetime import date, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import asyncio
+from app.agents.rate_governor import Priority
 from app.models import Article, DailySummary
 from app.services import summary_service
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 # --- FIXTURES ---
 @pytest.fixture
 def mock_db():
-    return MagicMock(spec=Session)
+    db = MagicMock(spec=AsyncSession)
+    db.execute.return_value = MagicMock()
+    return db
 
 
 @pytest.fixture
 def mock_agent():
     agent = MagicMock()
-    agent.get_daily_summary_for_source.return_value = {
-        "summaries": {"BBC": {"Technology": "Test summary"}},
-        "categories": {"BBC": {"Technology": 1}},
-        "references": {"BBC": {"Technology": [1]}},
-    }
+    agent.get_daily_summary_for_source = AsyncMock(
+        return_value={
+            "summaries": {"BBC": {"Technology": "Test summary"}},
+            "categories": {"BBC": {"Technology": 1}},
+            "references": {"BBC": {"Technology": [1]}},
+        }
+    )
     return agent
 
 
 # --- UNIT TESTS ---
 def test_fetch_articles_by_source_found(mock_db):
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.all.return_value = [
+    mock_result = mock_db.execute.return_value
+    mock_result.scalars.return_value.all.return_value = [
         Article(
             id=1,
             title="Roxi Węgiel wore this to the market!?!?!? [PHOTOS]",
@@ -37,24 +41,31 @@ def test_fetch_articles_by_source_found(mock_db):
         )
     ]
 
-    result = summary_service.fetch_articles_by_source(mock_db, date(2026, 1, 1), "BBC")
+    result = asyncio.run(
+        summary_service.fetch_articles_by_source(mock_db, date(2026, 1, 1), "BBC")
+    )
     assert len(result) == 1
     assert result[0].title == "Roxi Węgiel wore this to the market!?!?!? [PHOTOS]"
 
 
 def test_fetch_all_articles_grouped_not_found(mock_db):
-    mock_db.query.return_value.filter.return_value.all.return_value = []
+    mock_db.execute.return_value.scalars.return_value.all.return_value = []
 
     with pytest.raises(HTTPException) as exc:
-        summary_service.fetch_all_articles_grouped(mock_db, date(2026, 1, 1))
+        asyncio.run(
+            summary_service.fetch_all_articles_grouped(mock_db, date(2026, 1, 1))
+        )
     assert exc.value.status_code == 404
 
 
+@patch("app.services.summary_service.archive_service.archive_day")
 @patch("app.services.summary_service.create_summary_agent")
 @patch("app.services.summary_service.fetch_all_articles_grouped")
-def test_get_daily_summary_success(mock_fetch, mock_create_agent, mock_db, mock_agent):
+def test_get_daily_summary_success(
+    mock_fetch, mock_create_agent, mock_archive, mock_db, mock_agent
+):
     summary_date = date(2026, 1, 1)
-    mock_db.query.return_value.filter.return_value.first.return_value = None
+    mock_db.execute.return_value.scalar_one_or_none.return_value = None
 
     article = Article(
         id=1,
@@ -71,8 +82,10 @@ def test_get_daily_summary_success(mock_fetch, mock_create_agent, mock_db, mock_
     asyncio.run(summary_service.get_daily_summary_async(summary_date, mock_db))
 
     mock_fetch.assert_called_once_with(mock_db, summary_date)
+    mock_create_agent.assert_called_once_with(Priority.BACKFILL)
     mock_db.add.assert_called_once()
-    mock_db.commit.assert_called_once()
+    mock_db.commit.assert_awaited_once()
+    mock_archive.assert_awaited_once_with(summary_date)
 
     args, _ = mock_db.add.call_args
     added_summary = args[0]
@@ -86,14 +99,14 @@ def test_get_daily_summary_already_exists(mock_db):
         id=99, date=summary_date, summaries={"BBC": {"Technology": "Old summary"}}
     )
 
-    mock_db.query.return_value.filter.return_value.first.return_value = existing_summary
+    mock_db.execute.return_value.scalar_one_or_none.return_value = existing_summary
 
     with pytest.raises(HTTPException) as exc:
         asyncio.run(summary_service.get_daily_summary_async(summary_date, mock_db))
 
     assert exc.value.status_code == 409
     mock_db.add.assert_not_called()
-    mock_db.commit.assert_not_called()
+    mock_db.commit.assert_not_awaited()
 
 
 @patch("app.services.summary_service.create_summary_agent")
@@ -101,7 +114,7 @@ def test_get_daily_summary_already_exists(mock_db):
 def test_get_daily_summary_agent_failure(
     mock_fetch, mock_create_agent, mock_db, mock_agent
 ):
-    mock_db.query.return_value.filter.return_value.first.return_value = None
+    mock_db.execute.return_value.scalar_one_or_none.return_value = None
     mock_fetch.return_value = {"BBC": [MagicMock(spec=Article)]}
     mock_create_agent.return_value = mock_agent
     mock_agent.get_daily_summary_for_source.side_effect = Exception("AI rebellion")
@@ -109,7 +122,7 @@ def test_get_daily_summary_agent_failure(
     with pytest.raises(Exception):
         asyncio.run(summary_service.get_daily_summary_async(date(2026, 1, 1), mock_db))
 
-    mock_db.commit.assert_not_called()
+    mock_db.commit.assert_not_awaited()
 
 
 def test_convert_dict_to_percentages():
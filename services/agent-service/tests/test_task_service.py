@@ -1,5 +1,6 @@
+import asyncio
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 from app.services import task_service
@@ -8,7 +9,7 @@ from app.schemas.task_status import TaskStatus
 
 @pytest.fixture
 def mock_db():
-    return MagicMock(spec=Session)
+    return MagicMock(spec=AsyncSession)
 
 
 def test_create_task():
@@ -66,13 +67,15 @@ def test_generate_summary_task_success(mock_get_summary, mock_db):
     mock_get_summary.return_value = MagicMock(model_dump=lambda: {"data": "summary"})
 
     task_service.create_task("jd3198jw8asd0j9j21")
-    task_service.generate_summary_task(
-        "jd3198jw8asd0j9j21",
-        date(2026, 1, 11),
-        date(2026, 1, 16),
-        ["BBC"],
-        ["Technology"],
-        mock_db,
+    asyncio.run(
+        task_service.generate_summary_task(
+            "jd3198jw8asd0j9j21",
+            date(2026, 1, 11),
+            date(2026, 1, 16),
+            ["BBC"],
+            ["Technology"],
+            mock_db,
+        )
     )
 
     task = task_service.get_task("jd3198jw8asd0j9j21")
@@ -86,13 +89,15 @@ def test_generate_summary_task_failure(mock_get_summary, mock_db):
     mock_get_summary.side_effect = Exception("Error")
 
     task_service.create_task("jd3198jw8asd0j9j21")
-    task_service.generate_summary_task(
-        "jd3198jw8asd0j9j21",
-        date(2026, 1, 11),
-        date(2026, 1, 16),
-        ["BBC"],
-        ["Technology"],
-        mock_db,
+    asyncio.run(
+        task_service.generate_summary_task(
+            "jd3198jw8asd0j9j21",
+            date(2026, 1, 11),
+            date(2026, 1, 16),
+            ["BBC"],
+            ["Technology"],
+            mock_db,
+        )
     )
 
     task = task_service.get_task("jd3198jw8asd0j9j21")
@@ -1,10 +1,14 @@
 from app.services.article_service import scraper_service
 from app.services.db_service import db_service
+from app.services.dedup_service import dedup_service
+from app.services.job_service import job_service
 from app.schemas.articles import ArticleCreate
+from app.schemas.jobs import JobStatusResponse
 from app.core.db import get_db
 
 from fastapi import APIRouter, Query, Depends
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 router = APIRouter(prefix="/articles", responses={404: {"description": "Not found"}})
@@ -18,19 +22,30 @@ router = APIRouter(prefix="/articles", responses={404: {"description": "Not foun
 
 @router.post("")
 async def get_and_save_all_articles(
-    limit: int | None = Query(default=None, ge=1), db: Session = Depends(get_db)
+    limit: int | None = Query(default=None, ge=1),
+    run_async: bool = Query(default=False, alias="async"),
 ) -> dict:
     """
     Scraps all articles and saves them in the Postgres database.
-    :return: list containing dict with results of saving articles to db and list of collected articles
+    Feeds that didn't change since the last successful run, items older than the feed
+    watermark and articles already stored in the database are skipped, near-duplicates
+    are grouped into clusters.
+    The scrape runs in the job worker pool, with `async=true` the job id is returned
+    immediately and the progress can be polled at `/articles/jobs/{job_id}`.
+    :return: results of saving articles to db, or `{"job_id": ...}` in async mode
     """
-    articles = (
-        scraper_service.fetch_all_articles(limit)
-        if limit
-        else scraper_service.fetch_all_articles()
-    )
-    db_result = db_service.save_articles(articles, db)
-    return db_result
+    if run_async:
+        return {"job_id": job_service.submit(limit)}
+
+    return await job_service.wait(job_service.submit(limit))
+
+
+@router.get("/jobs/{job_id}")
+async def get_scrape_job_status(job_id: str) -> JobStatusResponse:
+    """
+    Gets status, per-source progress and result of a scrape job
+    """
+    return job_service.get(job_id)
 
 
 @router.get("/all")
@@ -41,12 +56,28 @@ async def get_all_articles(
     Gets all available articles from online sources like APIs and RSS feeds
     """
     return (
-        scraper_service.fetch_all_articles(limit)
+        await scraper_service.fetch_all_articles(limit)
         if limit
-        else scraper_service.fetch_all_articles()
+        else await scraper_service.fetch_all_articles()
     )
 
 
+@router.get("/all/stream")
+async def stream_all_articles(
+    limit: int | None = Query(default=None, ge=1),
+) -> StreamingResponse:
+    """
+    Streams all available articles from online sources as newline-delimited JSON,
+    articles of every source/category are sent as soon as it is fetched
+    """
+
+    async def ndjson_lines():
+        async for article in scraper_service.stream_all_articles(limit):
+            yield article.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/{source}")
 @router.get("/{source}/{category}")
 async def get_articles_by_choice(
@@ -60,25 +91,26 @@ async def get_articles_by_choice(
     :param category: catrgory of source entries to get, None if source categories are not defined
     :type category: str | None
     """
-    return scraper_service.fetch_articles(source, category)
+    return await scraper_service.fetch_articles(source, category)
 
 
 @router.post("/save")
 async def save_articles_in_db(
-    articles: list[ArticleCreate], db: Session = Depends(get_db)
+    articles: list[ArticleCreate], db: AsyncSession = Depends(get_db)
 ) -> dict:
     """
     Add articles to the Postgres database.
     """
-    return db_service.save_articles(articles, db)
+    return await db_service.save_articles(articles, db)
 
 
 @router.post("/save/{source}")
 @router.post("/save/{source}/{category}")
 async def get_and_save_articles_by_choice(
-    source: str, category: str | None = None, db: Session = Depends(get_db)
+    source: str, category: str | None = None, db: AsyncSession = Depends(get_db)
 ) -> dict:
     """ """
-    articles = scraper_service.fetch_articles(source, category)
-    db_result = db_service.save_articles(articles, db)
+    articles = await run_in_threadpool(scraper_service.fetch_articles, source, category)
+    await dedup_service.assign_clusters(articles, db)
+    db_result = await db_service.save_articles(articles, db)
     return db_result
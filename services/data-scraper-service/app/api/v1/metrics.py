@@ -0,0 +1,15 @@
+from app.core.metrics import registry
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """
+    Exposes scrape pipeline metrics in the Prometheus text format
+    """
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,15 @@
+from app.scrapers.source_health import health_tracker
+
+from fastapi import APIRouter
+
+
+router = APIRouter(prefix="/sources", responses={404: {"description": "Not found"}})
+
+
+@router.get("/health")
+async def get_sources_health() -> dict:
+    """
+    Gets health of every scraped source - circuit breaker state, failure counters,
+    adaptive timeout and recent breaker transitions
+    """
+    return health_tracker.snapshot()
@@ -3,10 +3,7 @@ import json
 CONFIG_FILE = "app/core/config.json"
 
 
-def load_context():
-    with open(CONFIG_FILE, "r") as fh:
+def load_context(config_file: str = CONFIG_FILE):
+    with open(config_file, "r") as fh:
         obj = json.load(fh)
     return obj
-
-
-CONTEXT = load_context()
@@ -1,19 +1,57 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
 
-engine = create_engine(DATABASE_URL, echo=True)
-Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# sync drivers from DATABASE_URL are swapped for their asyncio counterparts
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
 
-def get_db():
-    db = Session()
-    try:
+def async_database_url(url: str) -> str:
+    url = make_url(url)
+    return url.set(
+        drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    ).render_as_string(hide_password=False)
+
+
+def create_engine(**options) -> AsyncEngine:
+    """
+    Creates async engine for `DATABASE_URL`, pool settings apply to Postgres only.
+    Engine connections are bound to the event loop they were opened in.
+    """
+    url = make_url(async_database_url(DATABASE_URL))
+    if url.drivername == "postgresql+asyncpg":
+        # 0 disables prepared statement caching, e.g. behind pgbouncer
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(DB_STATEMENT_CACHE_SIZE)}
+        )
+        if "poolclass" not in options:
+            options = {
+                "pool_size": DB_POOL_SIZE,
+                "max_overflow": DB_MAX_OVERFLOW,
+                "pool_pre_ping": DB_POOL_PRE_PING,
+                **options,
+            }
+    return create_async_engine(url, echo=DB_ECHO, **options)
+
+
+engine = create_engine()
+Session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_db():
+    async with Session() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,428 @@
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dotenv import load_dotenv
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import asyncio
+import importlib.util
+import httpx
+import os
+import random
+import threading
+import time
+
+load_dotenv()
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "32"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "16"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+HTTP_MAX_PER_HOST = int(os.getenv("SCRAPER_MAX_PER_HOST", "4"))
+# throttled (429, 503 with Retry-After) requests are retried this many times
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_SECONDS = float(os.getenv("HTTP_BACKOFF_SECONDS", "1"))
+# longer Retry-After is not waited for, the throttled response is returned instead
+HTTP_MAX_RETRY_AFTER = float(os.getenv("HTTP_MAX_RETRY_AFTER", "30"))
+# seconds a single fetch may wait for rate limit tokens and Retry-After on top of its timeout
+HTTP_MAX_THROTTLE_WAIT = float(os.getenv("HTTP_MAX_THROTTLE_WAIT", "60"))
+
+# HTTP/2 and brotli decoding are used only when their optional packages are installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+BROTLI_AVAILABLE = (
+    importlib.util.find_spec("brotli") is not None
+    or importlib.util.find_spec("brotlicffi") is not None
+)
+ACCEPT_ENCODING = "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """
+    Response stream releasing the host slot once the body is consumed or closed
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore):
+        self.stream = stream
+        self.semaphore = semaphore
+        self.released = False
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self.released:
+                self.released = True
+                self.semaphore.release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper capping the number of in-flight requests per host
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self.transport = transport
+        self.max_per_host = max_per_host
+        self.host_semaphores: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.max_per_host)
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self.host_semaphores[request.url.host]
+        await semaphore.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by all event loops.
+
+    `reserve` takes a token right away and returns how long the caller has to wait for it,
+    so waiting callers are served in order and the rate is never exceeded, even by bursts
+    of concurrent requests. `pause` stops handing out tokens, e.g. after `Retry-After`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.tokens = float(self.burst)
+        self.updated = clock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, returns delay in seconds after which it may be used
+        """
+        with self.lock:
+            now = self.clock()
+            if now > self.updated:
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+            self.tokens -= 1
+            return (self.updated - now) + max(0.0, -self.tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hands out no tokens for given time, afterwards requests go one by one at the rate
+        """
+        with self.lock:
+            self.updated = max(self.updated, self.clock() + seconds)
+            self.tokens = min(self.tokens, 1.0)
+
+
+class RateLimiter:
+    """
+    Token buckets of hosts with a declared rate limit, see `rate_limit` in `core/config.json`
+    """
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def configure(self, limits: dict[str, tuple[float, int]]) -> None:
+        """
+        Sets (requests per second, burst) of every limited host, buckets of hosts whose
+        limit didn't change are kept with their current state
+        """
+        buckets = {}
+        for host, (rate, burst) in limits.items():
+            bucket = self.buckets.get(host)
+            if bucket is None or (bucket.rate, bucket.burst) != (rate, max(1, burst)):
+                bucket = TokenBucket(rate, burst)
+            buckets[host] = bucket
+        self.buckets = buckets
+
+    def bucket(self, host: str) -> TokenBucket | None:
+        return self.buckets.get(host)
+
+
+class ThrottleBudget:
+    """
+    Time a single fetch may spend waiting for rate limit tokens and `Retry-After`, so
+    that only network time counts against its timeout - the deadline of the fetch is
+    moved by every wait within the budget
+    """
+
+    def __init__(
+        self, deadline: asyncio.Timeout, max_wait: float = HTTP_MAX_THROTTLE_WAIT
+    ) -> None:
+        self.deadline = deadline
+        self.max_wait = max_wait
+        self.waited = 0.0
+        # set once a wait didn't fit into the budget
+        self.exhausted = False
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.max_wait - self.waited)
+
+    def extend(self, delay: float) -> None:
+        """
+        Moves the deadline by the part of `delay` still within the budget
+        """
+        granted = min(delay, self.remaining)
+        if granted < delay:
+            self.exhausted = True
+        self.waited += delay
+        when = self.deadline.when()
+        if when is not None and granted > 0:
+            self.deadline.reschedule(when + granted)
+
+
+@contextmanager
+def throttle_budget(budget: ThrottleBudget) -> Iterator[ThrottleBudget]:
+    """
+    Reports waits of `RateLimitedTransport` within the block to given budget
+    """
+    token = _throttle_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _throttle_budget.reset(token)
+
+
+def retry_after(headers: httpx.Headers) -> float | None:
+    """
+    Parses `Retry-After` header given either in seconds or as HTTP date
+    """
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper spacing requests by the token bucket of their host. Throttled
+    responses (429, or 503 with `Retry-After`) pause the host bucket for `Retry-After`,
+    or an exponential backoff if not given, and the request is retried. Waits are
+    reported to the `ThrottleBudget` of the fetch, if any.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: RateLimiter,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff: float = HTTP_BACKOFF_SECONDS,
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self.limiter.bucket(request.url.host)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                await self._wait(bucket.reserve())
+
+            response = await self.transport.handle_async_request(request)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            await response.aclose()
+            if bucket is not None:
+                bucket.pause(delay)
+            else:
+                await self._wait(delay)
+            attempt += 1
+
+    @staticmethod
+    async def _wait(delay: float) -> None:
+        if delay <= 0:
+            return
+        budget = _throttle_budget.get()
+        if budget is not None:
+            budget.extend(delay)
+        await asyncio.sleep(delay)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """
+        Returns delay before retrying a throttled response, None if it shouldn't be retried.
+        A delay longer than the rest of the throttle budget of the fetch is not waited for.
+        """
+        delay = retry_after(response.headers)
+        throttled = response.status_code == 429 or (
+            response.status_code == 503 and delay is not None
+        )
+        if not throttled or attempt >= self.max_retries:
+            return None
+        if delay is None:
+            delay = self.backoff * 2**attempt * random.uniform(1, 1.5)
+        if delay > HTTP_MAX_RETRY_AFTER:
+            return None
+        budget = _throttle_budget.get()
+        if budget is not None and delay > budget.remaining:
+            budget.exhausted = True
+            return None
+        return delay
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HttpClients:
+    """
+    Process-wide HTTP clients shared by all scrapers.
+
+    Connections are pooled per host and kept alive between scrapes, so the many category
+    feeds living on one host reuse a single connection (multiplexed when HTTP/2 is available)
+    instead of paying for a TCP + TLS handshake each time.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.client: httpx.Client | None = None
+        self.async_client: httpx.AsyncClient | None = None
+        self.async_client_loop: asyncio.AbstractEventLoop | None = None
+
+    @staticmethod
+    def _client_options() -> dict:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "timeout": httpx.Timeout(
+                HTTP_READ_TIMEOUT,
+                connect=HTTP_CONNECT_TIMEOUT,
+                read=HTTP_READ_TIMEOUT,
+            ),
+            "headers": {"Accept-Encoding": ACCEPT_ENCODING},
+            "follow_redirects": True,
+        }
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    def get_client(self) -> httpx.Client:
+        """
+        Returns shared blocking client used by `collect_data`
+        """
+        with self.lock:
+            if self.client is None:
+                self.client = httpx.Client(
+                    limits=self._limits(), **self._client_options()
+                )
+            return self.client
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        transport = HostLimitedTransport(
+            RateLimitedTransport(
+                httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=self._limits()),
+                rate_limiter,
+            ),
+            HTTP_MAX_PER_HOST,
+        )
+        return httpx.AsyncClient(transport=transport, **self._client_options())
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """
+        Returns shared async client, created for the running event loop on first use (the
+        API loop, see app lifespan). Client connections are bound to that loop, other
+        loops have to use `async_client_scope` or `current_async_client`.
+        """
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if self.async_client is None:
+                self.async_client = self._create_async_client()
+                self.async_client_loop = loop
+            elif self.async_client_loop is not loop:
+                raise RuntimeError("Shared async client belongs to another event loop")
+            return self.async_client
+
+    @asynccontextmanager
+    async def async_client_scope(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Creates a client used by `current_async_client` within the scope, e.g. by a scrape
+        job running its own event loop. Closed with its connections on exit.
+        """
+        client = self._create_async_client()
+        token = _scoped_async_client.set(client)
+        try:
+            yield client
+        finally:
+            _scoped_async_client.reset(token)
+            await client.aclose()
+
+    @asynccontextmanager
+    async def current_async_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yields the client of the running event loop - the client of the enclosing
+        `async_client_scope`, the shared client on its own loop, otherwise a temporary
+        client closed on exit
+        """
+        client = _scoped_async_client.get()
+        if client is None:
+            try:
+                client = self.get_async_client()
+            except RuntimeError:
+                client = None
+        if client is not None:
+            yield client
+            return
+        async with self.async_client_scope() as client:
+            yield client
+
+    async def aclose(self) -> None:
+        """
+        Closes shared clients and their pooled connections
+        """
+        with self.lock:
+            async_client, self.async_client = self.async_client, None
+            self.async_client_loop = None
+        if async_client is not None:
+            await async_client.aclose()
+        with self.lock:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+
+
+# client of the `HttpClients.async_client_scope` the running task belongs to
+_scoped_async_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "scoped_async_client", default=None
+)
+
+# throttle budget of the fetch the running task belongs to, see `throttle_budget`
+_throttle_budget: ContextVar[ThrottleBudget | None] = ContextVar(
+    "throttle_budget", default=None
+)
+
+rate_limiter = RateLimiter()
+http_clients = HttpClients()
@@ -0,0 +1,76 @@
+from prometheus_client import CollectorRegistry, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+
+# fetches take from tens of milliseconds (304, cached feeds) up to the read timeout
+FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60)
+SAVE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+BREAKER_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+registry = CollectorRegistry()
+
+FETCH_DURATION = Histogram(
+    "scraper_fetch_duration_seconds",
+    "Duration of a single feed fetch, including parsing",
+    ["source", "category", "outcome"],
+    buckets=FETCH_BUCKETS,
+    registry=registry,
+)
+BYTES_DOWNLOADED = Counter(
+    "scraper_bytes_downloaded",
+    "Bytes of feed bodies downloaded",
+    ["source"],
+    registry=registry,
+)
+ITEMS_PARSED = Counter(
+    "scraper_items_parsed",
+    "Feed items turned into article candidates",
+    ["source"],
+    registry=registry,
+)
+ITEMS_REJECTED = Counter(
+    "scraper_items_rejected",
+    "Article candidates rejected by `ArticleCreate` validation",
+    ["source"],
+    registry=registry,
+)
+ITEMS_DEDUPLICATED = Counter(
+    "scraper_items_deduplicated",
+    "Articles recognized as duplicates: already collected or stored (seen), "
+    "joining a cluster of another article (near_duplicate) or skipped by the "
+    "unique URL index on insert (conflict)",
+    ["reason"],
+    registry=registry,
+)
+ITEMS_SAVED = Counter(
+    "scraper_items_saved",
+    "Articles newly stored in the database",
+    registry=registry,
+)
+DB_SAVE_DURATION = Histogram(
+    "scraper_db_save_duration_seconds",
+    "Duration of saving a batch of articles, including commit",
+    ["method"],
+    buckets=SAVE_BUCKETS,
+    registry=registry,
+)
+
+
+class BreakerStateCollector:
+    """
+    Reports circuit breaker state of every source tracked by given `HealthTracker`
+    at scrape time (0 - closed, 1 - half open, 2 - open)
+    """
+
+    def __init__(self, health) -> None:
+        self.health = health
+
+    def collect(self):
+        state = GaugeMetricFamily(
+            "scraper_breaker_state",
+            "Circuit breaker state of a source: 0 closed, 1 half open, 2 open",
+            labels=["source"],
+        )
+        for source, health in self.health.snapshot()["sources"].items():
+            state.add_metric([source], BREAKER_STATE_VALUES[health["state"]])
+        yield state
@@ -1,11 +1,39 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+import asyncio
 
 from app.api.v1.articles import router as data_router
-
-
-app = FastAPI()
+from app.api.v1.metrics import router as metrics_router
+from app.api.v1.sources import router as sources_router
+from app.core.db import engine
+from app.core.http import http_clients
+from app.scrapers.parse_pool import parse_pool
+from app.scrapers.registry import scraper_registry
+from app.services.partition_service import partition_service
+
+
+@asynccontextmanager
+async def lifespan(app):
+    scraper_registry.install_signal_handler()
+    # binds the shared async client to the API event loop
+    http_clients.get_async_client()
+    config_watch = asyncio.create_task(scraper_registry.watch())
+    partition_maintenance = asyncio.create_task(partition_service.maintain())
+    try:
+        yield
+    finally:
+        config_watch.cancel()
+        partition_maintenance.cancel()
+        await http_clients.aclose()
+        await engine.dispose()
+        parse_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(data_router)
+app.include_router(sources_router)
+app.include_router(metrics_router)
 
 
 @app.exception_handler(ValueError)
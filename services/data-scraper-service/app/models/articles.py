@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Text, DateTime, Identity
+from sqlalchemy import BigInteger, Integer, String, Text, DateTime, Identity
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -14,9 +14,28 @@ class ArticleDB(Base):
     id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    url: Mapped[str] = mapped_column(String, nullable=False)
+    # partitioned Postgres table keeps url uniqueness in the `article_url` registry instead
+    url: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     published_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
     source: Mapped[str] = mapped_column(String, nullable=False)
     categories: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
+    simhash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    cluster_id: Mapped[int | None] = mapped_column(
+        BigInteger, nullable=True, index=True
+    )
+
+
+class ArticleArchiveDB(Base):
+    """
+    Cold tier of articles moved away by the agent service, only read by the scraper
+    """
+
+    __tablename__ = "article_archive"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    url: Mapped[str] = mapped_column(String, nullable=False)
+    published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
@@ -1,14 +1,30 @@
-from pydantic import BaseModel, Field, HttpUrl, ValidationError
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    HttpUrl,
+    PlainSerializer,
+    TypeAdapter,
+    ValidationError,
+)
 from datetime import datetime
+from typing import Annotated
+
+# validated as HttpUrl but kept as plain string, so articles map onto DB rows as they are
+HttpUrlStr = Annotated[
+    HttpUrl, AfterValidator(str), PlainSerializer(str, return_type=str)
+]
 
 
 class ArticleCreate(BaseModel):
     title: str = Field(min_length=5)
     description: str = Field(min_length=10)
-    url: HttpUrl
+    url: HttpUrlStr
     published_at: datetime = Field(default_factory=datetime.now)
     source: str
     categories: list[str] = Field(default_factory=list)
+    simhash: int | None = None
+    cluster_id: int | None = None
 
     model_config = {"str_strip_whitespace": True, "extra": "forbid"}
 
@@ -21,3 +37,29 @@ class ArticleCreate(BaseModel):
             return cls(**data)
         except ValidationError:
             return None
+
+    @classmethod
+    def create_batch(cls, rows: list[dict]) -> tuple[list["ArticleCreate"], list[int]]:
+        """
+        Validates raw rows of a whole feed in a single call of the precompiled list
+        validator instead of building and catching errors item by item
+
+        :param rows: raw article fields, one dict per feed item
+        :type rows: list[dict]
+        :return: valid articles (in input order) and indices of rejected rows
+        :rtype: tuple[list[ArticleCreate], list[int]]
+        """
+        try:
+            return ARTICLE_BATCH.validate_python(rows), []
+        except ValidationError as e:
+            rejected = sorted({error["loc"][0] for error in e.errors()})
+
+        # validity of a row doesn't depend on the others, so the rest passes this time
+        skipped = set(rejected)
+        valid = ARTICLE_BATCH.validate_python(
+            [row for index, row in enumerate(rows) if index not in skipped]
+        )
+        return valid, rejected
+
+
+ARTICLE_BATCH = TypeAdapter(list[ArticleCreate])
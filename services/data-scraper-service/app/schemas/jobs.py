@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    NOT_FOUND = "not_found"
+
+
+class SourceProgress(BaseModel):
+    feeds_total: int = 0
+    feeds_done: int = 0
+    articles: int = 0
+    errors: list[str] = Field(default_factory=list)
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    created_at: datetime | None = None
+    completed_at: datetime | None = None
+    sources: dict[str, SourceProgress] = Field(default_factory=dict)
+    result: dict | None = None
+    error: str | None = None
@@ -1,10 +1,13 @@
+from app.core.http import http_clients
 from app.scrapers.base_scraper import BaseScraper, save_scrapers
 from app.schemas.articles import ArticleCreate
 from app.utils.parser import parse_text
+from app.utils.url import canonicalize_url
 
 from abc import abstractmethod
 from datetime import datetime
-import requests
+import httpx
+import json
 
 
 class ApiScraper(BaseScraper):
@@ -17,17 +20,45 @@ class ApiScraper(BaseScraper):
             self.api_key = api_key
             self.url += self.api_key
 
-    def collect_data(self, category: str | None = None) -> list[ArticleCreate]:
+    def collect_data(
+        self, category: str | None = None, incremental: bool = False
+    ) -> list[ArticleCreate]:
         """ """
-        temp_url = self.url % category if category else self.url
+        temp_url = self._build_url(category)
 
         try:
-            response = requests.get(temp_url)
-            response.raise_for_status()
-            response = response.json()
-
-        except requests.RequestException as e:
+            response = http_clients.get_client().get(
+                temp_url, headers=self._conditional_headers(temp_url, incremental)
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
             raise Exception(f"Request failed for {temp_url}: {e}") from e
+
+        return self._process_response(
+            temp_url,
+            response.status_code,
+            response.headers,
+            response.content,
+            category,
+            incremental,
+        )
+
+    def parse_content(
+        self, content: bytes, category: str | None = None, incremental: bool = False
+    ) -> list[ArticleCreate]:
+        """
+        Parses raw JSON API response body into list of articles
+
+        :param content: raw response body
+        :type content: bytes
+        :param category: category the response was fetched for
+        :type category: str | None
+        :param incremental: drop articles already stored in the database
+        :type incremental: bool
+        """
+        try:
+            response = json.loads(content)
         except ValueError as e:
             raise Exception("Response is not valid JSON") from e
 
@@ -35,12 +66,14 @@ class ApiScraper(BaseScraper):
         if status and status not in ("OK", 200):
             raise Exception(f"API error status: {status}")
 
-        return self._extract_data(response, category)
+        return self._extract_data(response, category, incremental)
 
     @abstractmethod
-    def _extract_data(self, response, category): ...
+    def _extract_data(self, response, category, incremental=False): ...
 
-    def _is_valid_article(self, entry, title_tag, description_tag, url_tag):
+    def _is_valid_article(
+        self, entry, title_tag, description_tag, url_tag, incremental=False
+    ):
         title = entry.get(title_tag, None)
         title = parse_text(title)
 
@@ -49,56 +82,82 @@ class ApiScraper(BaseScraper):
 
         url = entry.get(url_tag, None)
 
-        if not title or not description or not url or url in self.collected_by_url:
+        if not title or not description or not url:
+            return False
+
+        url = canonicalize_url(url)
+        if self._is_known(url, incremental):
             return False
         return title, description, url
 
 
 @save_scrapers
 class NYTScraper(ApiScraper):
-    def _extract_data(self, response, category) -> list[ArticleCreate]:
-        data: list[ArticleCreate] = []
+    def _extract_data(
+        self, response, category, incremental=False
+    ) -> list[ArticleCreate]:
+        rows: list[dict] = []
+        walk = self._walk(category, incremental)
         for result in response["results"]:
-            res = self._is_valid_article(
-                result, title_tag="title", description_tag="abstract", url_tag="url"
-            )
-            if not res:
-                continue
-
             date = result.get("published_date", None)
             try:
-                date = datetime.fromisoformat(date) if date else datetime.now()
+                date = datetime.fromisoformat(date) if date else None
             except Exception as e:
                 continue
 
+            guid = result.get("uri") or result.get("url")
+            if walk.reached(date, guid):
+                continue
+            walk.observe(date, guid)
+
+            res = self._is_valid_article(
+                result,
+                title_tag="title",
+                description_tag="abstract",
+                url_tag="url",
+                incremental=incremental,
+            )
+            if not res:
+                continue
+
             categories = [category] if category else []
             categories += result.get("des_facet", []) + result.get("org_facet", [])
 
-            article = self._save_article(*res, categories, date)
-            if article:
-                data.append(article)
-        return data
+            rows.append(self._article_row(*res, categories, date))
+
+        walk.stage()
+        return self._validate_articles(rows)
 
 
 @save_scrapers
 class BBCScraper(ApiScraper):
-    def _extract_data(self, response, category) -> list[ArticleCreate]:
-        data: list[ArticleCreate] = []
+    def _extract_data(
+        self, response, category, incremental=False
+    ) -> list[ArticleCreate]:
+        rows: list[dict] = []
+        walk = self._walk(category, incremental)
         for key, values in response.items():
             if isinstance(values, list):
                 for value in values:
+                    # BBC entries have no publishing date, only the newest link is tracked
+                    guid = value.get("news_link")
+                    if walk.reached(None, guid):
+                        continue
+                    walk.observe(None, guid)
+
                     res = self._is_valid_article(
                         value,
                         title_tag="title",
                         description_tag="summary",
                         url_tag="news_link",
+                        incremental=incremental,
                     )
                     if not res:
                         continue
 
                     categories = ([category] if category else []) + [key]
 
-                    article = self._save_article(*res, categories)
-                    if article:
-                        data.append(article)
-        return data
+                    rows.append(self._article_row(*res, categories))
+
+        walk.stage()
+        return self._validate_articles(rows)
@@ -1,7 +1,17 @@
+from app.core.metrics import (
+    BYTES_DOWNLOADED,
+    ITEMS_DEDUPLICATED,
+    ITEMS_PARSED,
+    ITEMS_REJECTED,
+)
 from app.schemas.articles import ArticleCreate
+from app.scrapers.feed_cache import feed_cache
+from app.scrapers.seen_filter import seen_filter
+from app.scrapers.watermarks import FeedWalk, watermark_store
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+import httpx
 
 
 API_SCRAPERS = {}
@@ -16,12 +26,118 @@ class BaseScraper(ABC):
     def __init__(self, url: str, source_name: str = "Unknown") -> None:
         self.url = url
         self.source_name = source_name
-        self.collected_by_url = set()
+        # unique key of the source in `core/config.json`, set by the scraper registry -
+        # several sources may share the same display name
+        self.source_id = source_name
+        # feed URLs formatted ahead by the scraper registry
+        self.urls: dict[str | None, str] = {}
 
     @abstractmethod
     def collect_data(self) -> list[ArticleCreate]: ...
 
-    def _save_article(
+    @abstractmethod
+    def parse_content(
+        self, content: bytes, category: str | None = None, incremental: bool = False
+    ) -> list[ArticleCreate]: ...
+
+    async def collect_data_async(
+        self,
+        client: httpx.AsyncClient,
+        category: str | None = None,
+        incremental: bool = False,
+    ) -> list[ArticleCreate]:
+        """
+        Asynchronous counterpart of `collect_data`, fetches feed with given client and parses it
+
+        :param client: shared async HTTP client used by the fetch engine
+        :type client: httpx.AsyncClient
+        :param category: category of source entries to get, None if source categories are not defined
+        :type category: str | None
+        :param incremental: skip feeds that didn't change since the last committed scrape
+        :type incremental: bool
+        """
+        temp_url = self._build_url(category)
+
+        try:
+            response = await client.get(
+                temp_url, headers=self._conditional_headers(temp_url, incremental)
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise Exception(f"Request failed for {temp_url}: {e}") from e
+
+        return self._process_response(
+            temp_url,
+            response.status_code,
+            response.headers,
+            response.content,
+            category,
+            incremental,
+        )
+
+    def _build_url(self, category: str | None = None) -> str:
+        url = self.urls.get(category)
+        if url is None:
+            url = self.url % category if category else self.url
+        return url
+
+    def _conditional_headers(self, url: str, incremental: bool) -> dict[str, str]:
+        return feed_cache.conditional_headers(url) if incremental else {}
+
+    def _process_response(
+        self,
+        url: str,
+        status_code: int,
+        headers,
+        content: bytes,
+        category: str | None,
+        incremental: bool,
+    ) -> list[ArticleCreate]:
+        """
+        Parses fetched feed, in incremental mode unchanged feeds (304 or identical body)
+        are skipped without parsing
+        """
+        BYTES_DOWNLOADED.labels(self.source_name).inc(len(content))
+        if not incremental:
+            return self.parse_content(content, category)
+
+        fingerprint = feed_cache.fingerprint(content)
+        if feed_cache.is_unchanged(url, status_code, fingerprint):
+            return []
+
+        data = self.parse_content(content, category, incremental)
+        feed_cache.stage(url, headers, fingerprint)
+        return data
+
+    def _walk(self, category: str | None, incremental: bool) -> FeedWalk:
+        """
+        Starts a walk over feed items, in incremental mode it skips items behind the feed
+        watermark. Watermarks are keyed by the config id of the source, the display name
+        may be shared by several sources.
+        """
+        return watermark_store.walk(self.source_id, category, enabled=incremental)
+
+    def discard_staged(self, category: str | None = None) -> None:
+        """
+        Drops feed cache entry and watermark staged for the feed, e.g. when only a part of
+        its articles is taken, so the next incremental run walks the feed again
+        """
+        feed_cache.unstage(self._build_url(category))
+        watermark_store.unstage(self.source_id, category)
+
+    def _is_known(self, url: str, incremental: bool = False) -> bool:
+        """
+        Checks whether article with given canonical URL is already stored in the database,
+        only in incremental mode. Duplicates within a run are dropped by `ScraperService`,
+        since scraper instances are shared by concurrent runs.
+        """
+        known = incremental and url in seen_filter
+        if known:
+            ITEMS_DEDUPLICATED.labels("seen").inc()
+        return known
+
+    def _article_row(
         self,
         title: str,
         description: str,
@@ -29,17 +145,29 @@ class BaseScraper(ABC):
         categories: list[str],
         date: datetime | None = None,
         source: str | None = None,
-    ):
-        """..."""
-        article = ArticleCreate.create(
-            title=title,
-            description=description,
-            url=url,
-            published_at=date if date else datetime.now(),
-            source=source if source else self.source_name,
-            categories=categories,
-        )
+    ) -> dict:
+        """
+        Builds raw article fields of a feed item, validated later with the whole feed
+        by `_validate_articles`
+        """
+        return {
+            "title": title,
+            "description": description,
+            "url": url,
+            "published_at": date if date else datetime.now(),
+            "source": source if source else self.source_name,
+            "categories": categories,
+        }
+
+    def _validate_articles(self, rows: list[dict]) -> list[ArticleCreate]:
+        """
+        Validates raw rows of a feed at once, invalid ones are dropped
+        """
+        if not rows:
+            return []
 
-        if article:
-            self.collected_by_url.add(url)
-        return article
+        articles, rejected = ArticleCreate.create_batch(rows)
+        ITEMS_PARSED.labels(self.source_name).inc(len(rows))
+        if rejected:
+            ITEMS_REJECTED.labels(self.source_name).inc(len(rejected))
+        return articles
@@ -0,0 +1,120 @@
+from dotenv import load_dotenv
+import hashlib
+import json
+import os
+import threading
+
+load_dotenv()
+
+FEED_CACHE_FILE = os.getenv("FEED_CACHE_FILE", ".cache/feed_cache.json")
+
+
+class FeedCache:
+    """
+    Persistent per-URL cache of HTTP validators (ETag / Last-Modified) and feed body fingerprints.
+
+    Entries are staged while scraping and only persisted by `commit`, once the scraped
+    articles were safely stored, so a failed save never hides a feed from the next run.
+    """
+
+    def __init__(self, path: str = FEED_CACHE_FILE) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = self._load()
+        self.staged: dict[str, dict] = {}
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Returns `If-None-Match` / `If-Modified-Since` headers for given URL (empty if not cached)
+        """
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_unchanged(self, url: str, status_code: int, fingerprint: str) -> bool:
+        """
+        Checks whether feed didn't change since last committed scrape - either server answered
+        with `304 Not Modified` or the body fingerprint is identical
+
+        :param url: feed URL
+        :type url: str
+        :param status_code: HTTP status code of the response
+        :type status_code: int
+        :param fingerprint: fingerprint of the response body
+        :type fingerprint: str
+        """
+        if status_code == 304:
+            return True
+
+        entry = self.entries.get(url)
+        return bool(entry) and entry.get("fingerprint") == fingerprint
+
+    def stage(self, url: str, headers, fingerprint: str) -> None:
+        """
+        Stages validators and fingerprint of a successfully parsed feed
+        """
+        with self.lock:
+            self.staged[url] = {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fingerprint": fingerprint,
+            }
+
+    def unstage(self, url: str) -> None:
+        with self.lock:
+            self.staged.pop(url, None)
+
+    def commit(self) -> None:
+        """
+        Persists all staged entries
+        """
+        with self.lock:
+            if not self.staged:
+                return
+            self.entries.update(self.staged)
+            self.staged = {}
+            self._dump()
+
+    def discard(self) -> None:
+        """
+        Drops all staged entries, e.g. when saving scraped articles failed
+        """
+        with self.lock:
+            self.staged = {}
+
+    @staticmethod
+    def hasher():
+        """
+        Returns incremental hasher used for fingerprints, for bodies consumed in chunks
+        """
+        return hashlib.blake2b(digest_size=16)
+
+    @classmethod
+    def fingerprint(cls, content: bytes) -> str:
+        hasher = cls.hasher()
+        hasher.update(content)
+        return hasher.hexdigest()
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, "r") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _dump(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as fh:
+            json.dump(self.entries, fh)
+        os.replace(temp_path, self.path)
+
+
+feed_cache = FeedCache()
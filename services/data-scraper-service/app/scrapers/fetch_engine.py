@@ -0,0 +1,178 @@
+from app.core.http import ThrottleBudget, http_clients, throttle_budget
+from app.core.metrics import FETCH_DURATION
+from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.source_health import HealthTracker, SourceUnavailable, health_tracker
+from app.schemas.articles import ArticleCreate
+
+from collections.abc import AsyncIterator, Callable
+from dotenv import load_dotenv
+import asyncio
+import os
+
+load_dotenv()
+
+MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "16"))
+
+
+class FetchEngine:
+    """
+    Fetches many source x category feeds at once over the shared HTTP client,
+    bounded by a global cap (per-host cap is enforced by the client transport).
+    Every fetch is bounded by the adaptive timeout of its source and sources with
+    an open circuit breaker are skipped. Time spent waiting for the rate limit of
+    the host doesn't count against the timeout, within the throttle budget.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        health: HealthTracker = health_tracker,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.health = health
+
+    async def gather(
+        self,
+        jobs: list[tuple[BaseScraper, str | None]],
+        incremental: bool = False,
+        on_done: Callable[[int, list[ArticleCreate] | BaseException], None]
+        | None = None,
+    ) -> list[list[ArticleCreate] | BaseException]:
+        """
+        Runs all (scraper, category) jobs concurrently
+
+        :param jobs: pairs of scraper instance and category to fetch (None if source has no categories)
+        :type jobs: list[tuple[BaseScraper, str | None]]
+        :param incremental: skip feeds that didn't change since the last committed scrape
+        :type incremental: bool
+        :param on_done: called with job index and its result as soon as the job finishes
+        :type on_done: Callable | None
+        :return: results in the same order as jobs, exception instance in place of failed job
+        :rtype: list[list[ArticleCreate] | BaseException]
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with http_clients.current_async_client() as client:
+
+            async def run_job(index: int, scraper: BaseScraper, category: str | None):
+                result = await self._fetch(
+                    semaphore, client, scraper, category, incremental
+                )
+                if on_done:
+                    on_done(index, result)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            return await asyncio.gather(
+                *(
+                    run_job(index, scraper, category)
+                    for index, (scraper, category) in enumerate(jobs)
+                ),
+                return_exceptions=True,
+            )
+
+    async def stream(
+        self, jobs: list[tuple[BaseScraper, str | None]], incremental: bool = False
+    ) -> AsyncIterator[tuple[int, list[ArticleCreate] | BaseException]]:
+        """
+        Runs all (scraper, category) jobs concurrently and yields their results in order
+        of completion. Jobs still running are cancelled when the consumer stops iterating.
+
+        :param jobs: pairs of scraper instance and category to fetch (None if source has no categories)
+        :type jobs: list[tuple[BaseScraper, str | None]]
+        :param incremental: skip feeds that didn't change since the last committed scrape
+        :type incremental: bool
+        :return: pairs of job index and its result, exception instance for failed job
+        :rtype: AsyncIterator[tuple[int, list[ArticleCreate] | BaseException]]
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with http_clients.current_async_client() as client:
+
+            async def run_job(index: int, scraper: BaseScraper, category: str | None):
+                return index, await self._fetch(
+                    semaphore, client, scraper, category, incremental
+                )
+
+            tasks = [
+                asyncio.create_task(run_job(index, scraper, category))
+                for index, (scraper, category) in enumerate(jobs)
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # jobs must not outlive a temporary client
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(
+        self,
+        semaphore: asyncio.Semaphore,
+        client,
+        scraper: BaseScraper,
+        category: str | None,
+        incremental: bool,
+    ) -> list[ArticleCreate] | Exception:
+        """
+        Fetches single feed guarded by the breaker and adaptive timeout of its source,
+        returns exception instance in place of result if the fetch failed
+        """
+        source = scraper.source_id
+        if not self.health.allow(source):
+            return SourceUnavailable(
+                f"Source '{source}' skipped - circuit breaker is open"
+            )
+
+        timeout = self.health.timeout(source)
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            started = loop.time()
+            deadline = asyncio.timeout(timeout)
+            budget = ThrottleBudget(deadline)
+            try:
+                async with deadline:
+                    with throttle_budget(budget):
+                        result = await scraper.collect_data_async(
+                            client, category, incremental
+                        )
+            except asyncio.CancelledError:
+                self.health.record_cancelled(source)
+                raise
+            except Exception as e:
+                if budget.exhausted:
+                    # throttled by the rate limit of the host, the source itself is fine
+                    self.health.record_cancelled(source)
+                    FETCH_DURATION.labels(source, category or "", "throttled").observe(
+                        loop.time() - started
+                    )
+                    if isinstance(e, TimeoutError):
+                        return TimeoutError(
+                            f"Fetch from '{source}' throttled for {budget.waited:.1f}s"
+                        )
+                    return e
+                if isinstance(e, TimeoutError):
+                    error = TimeoutError(
+                        f"Fetch from '{source}' timed out after {timeout:.1f}s"
+                    )
+                    self.health.record_failure(source, error, duration=timeout)
+                    FETCH_DURATION.labels(source, category or "", "timeout").observe(
+                        timeout
+                    )
+                    return error
+                self.health.record_failure(source, e)
+                FETCH_DURATION.labels(source, category or "", "error").observe(
+                    loop.time() - started - budget.waited
+                )
+                return e
+
+        # network time only, waits for the rate limit are left out of the latency
+        duration = loop.time() - started - budget.waited
+        self.health.record_success(source, duration)
+        FETCH_DURATION.labels(source, category or "", "success").observe(duration)
+        return result
+
+
+fetch_engine = FetchEngine()
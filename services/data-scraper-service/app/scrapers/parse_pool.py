@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+from dotenv import load_dotenv
+import asyncio
+import multiprocessing
+import os
+import threading
+
+load_dotenv()
+
+# worker processes parsing large feeds, 0 keeps all parsing on the event loop thread
+PARSE_WORKERS = int(os.getenv("SCRAPER_PARSE_WORKERS", "0"))
+# feeds with smaller bodies are parsed inline, shipping them to a worker costs more
+PARSE_POOL_THRESHOLD = int(os.getenv("SCRAPER_PARSE_POOL_THRESHOLD", str(256 * 1024)))
+
+
+class ParsePool:
+    """
+    Optional process pool for the CPU-bound part of scraping - XML parsing, HTML stripping,
+    date parsing and validation - so it doesn't compete for the GIL with the I/O loop.
+
+    Workers are started lazily with the `spawn` method, forking a process running event
+    loops and worker threads is not safe.
+    """
+
+    def __init__(
+        self, workers: int = PARSE_WORKERS, threshold: int = PARSE_POOL_THRESHOLD
+    ) -> None:
+        self.workers = workers
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.executor: ProcessPoolExecutor | None = None
+
+    def should_offload(self, size: int) -> bool:
+        """
+        Checks whether body of given size should be parsed in a worker process
+        """
+        return self.workers > 0 and size >= self.threshold
+
+    async def run(self, function, *args):
+        """
+        Runs picklable module-level function in a worker process
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor(), function, *args
+        )
+
+    def shutdown(self) -> None:
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self.executor
+
+
+parse_pool = ParsePool()
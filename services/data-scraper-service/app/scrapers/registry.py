@@ -0,0 +1,217 @@
+from app.core.config import CONFIG_FILE, load_context
+from app.core.http import RateLimiter, rate_limiter
+from app.scrapers.base_scraper import API_SCRAPERS, BaseScraper
+
+from dotenv import load_dotenv
+import asyncio
+import httpx
+import os
+import signal
+import threading
+
+load_dotenv()
+
+# seconds between checks of the config file modification time, 0 disables watching
+CONFIG_WATCH_INTERVAL = float(os.getenv("SCRAPER_CONFIG_WATCH_INTERVAL", "5"))
+
+
+class RegisteredSource:
+    """
+    Compiled source configuration - scraper instance with its feed URLs already formatted
+    """
+
+    def __init__(
+        self,
+        scraper: BaseScraper,
+        categories: list[str],
+        rate_limit: tuple[float, int] | None = None,
+    ) -> None:
+        self.scraper = scraper
+        self.categories = categories
+        self.rate_limit = rate_limit
+        self.urls = {
+            category: scraper._build_url(category)
+            for category in (categories or [None])
+        }
+        scraper.urls = self.urls
+
+    @property
+    def hosts(self) -> set[str]:
+        return {httpx.URL(url).host for url in self.urls.values()}
+
+
+class ScraperRegistry:
+    """
+    Long-lived scrapers compiled from `core/config.json`.
+
+    Configuration is validated, API keys resolved and scrapers created once, so lookups
+    of the scrape loop are plain dict reads. Reloading (SIGHUP or config file change)
+    compiles a new snapshot aside and swaps it in with a single assignment - callers in
+    the middle of a scrape keep using the snapshot they started with, and an invalid
+    config leaves the current one in place.
+    """
+
+    def __init__(
+        self,
+        config_file: str = CONFIG_FILE,
+        scrapers: dict = API_SCRAPERS,
+        limiter: RateLimiter = rate_limiter,
+    ) -> None:
+        self.config_file = config_file
+        self.scraper_types = scrapers
+        self.limiter = limiter
+        self.lock = threading.Lock()
+        self.snapshot: tuple[
+            dict[str, RegisteredSource], list[tuple[str, BaseScraper, str | None]]
+        ] = ({}, [])
+        self.mtime: float | None = None
+
+    @property
+    def sources(self) -> dict[str, RegisteredSource]:
+        return self.snapshot[0]
+
+    @property
+    def jobs(self) -> list[tuple[str, BaseScraper, str | None]]:
+        """
+        (source name, scraper, category) of every configured feed
+        """
+        return self.snapshot[1]
+
+    def load(self, context: dict | None = None) -> None:
+        """
+        Compiles configuration and swaps it in, raises if the configuration is invalid
+
+        :param context: parsed configuration, read from `config_file` if not given
+        :type context: dict | None
+        """
+        with self.lock:
+            mtime = None
+            if context is None:
+                mtime = self._file_mtime()
+                context = load_context(self.config_file)
+
+            sources = {
+                source: self._compile(source, source_data)
+                for source, source_data in context.items()
+            }
+            jobs = [
+                (entry.scraper.source_name, entry.scraper, category)
+                for entry in sources.values()
+                for category in entry.urls
+            ]
+            self.snapshot = (sources, jobs)
+            self.mtime = mtime
+            self.limiter.configure(self._rate_limits(sources))
+
+    def reload(self) -> bool:
+        """
+        Reloads configuration file, keeps the current scrapers if the new config is invalid
+
+        :return: whether new configuration was loaded
+        :rtype: bool
+        """
+        try:
+            self.load()
+        except Exception as e:
+            print(f"Scraper configuration not reloaded - error: {e}")
+            return False
+        print(f"Scraper configuration reloaded - {len(self.sources)} sources")
+        return True
+
+    def reload_if_changed(self) -> bool:
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self.mtime:
+            return False
+        return self.reload()
+
+    def get(self, source: str, category: str | None = None) -> RegisteredSource:
+        """
+        Returns compiled source, raises `ValueError` for unknown source or category
+        """
+        entry = self.snapshot[0].get(source)
+        if entry is None:
+            raise ValueError(f"Source: `{source}` not found")
+        if category and category not in entry.categories:
+            raise ValueError(f"Category: `{category}` not found for source: `{source}`")
+        return entry
+
+    def install_signal_handler(self) -> None:
+        """
+        Reloads configuration on SIGHUP, must be called from the running event loop
+        """
+        if not hasattr(signal, "SIGHUP"):
+            return
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    async def watch(self, interval: float = CONFIG_WATCH_INTERVAL) -> None:
+        """
+        Reloads configuration whenever the config file changes, runs until cancelled
+        """
+        if interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(interval)
+            self.reload_if_changed()
+
+    def _compile(self, source: str, source_data: dict) -> RegisteredSource:
+        scraper_type = source_data["type"]
+        if scraper_type not in self.scraper_types:
+            raise RuntimeError(f"Scraper `{scraper_type}` is not configured")
+
+        base_url = source_data["endpoint"].get("base_url", None)
+        if not base_url:
+            raise ValueError(f"Source `{source}` scraper missing URL in configuration")
+
+        source_name = source_data.get("title", None) or "Unknown"
+        api_key = os.getenv(source_data.get("api_key", ""))
+        scraper_class = self.scraper_types[scraper_type]
+        scraper = (
+            scraper_class(base_url, source_name, api_key)
+            if api_key
+            else scraper_class(base_url, source_name)
+        )
+        scraper.source_id = source
+        return RegisteredSource(
+            scraper,
+            source_data["endpoint"].get("categories", []),
+            self._rate_limit(source, source_data.get("rate_limit")),
+        )
+
+    @staticmethod
+    def _rate_limit(source: str, rate_limit: dict | None) -> tuple[float, int] | None:
+        if not rate_limit:
+            return None
+        rate = float(rate_limit.get("requests_per_second", 0))
+        if rate <= 0:
+            raise ValueError(
+                f"Source `{source}` rate limit needs positive `requests_per_second`"
+            )
+        return rate, int(rate_limit.get("burst", 1))
+
+    @staticmethod
+    def _rate_limits(
+        sources: dict[str, RegisteredSource],
+    ) -> dict[str, tuple[float, int]]:
+        """
+        Collects limits of every host, the strictest one wins if sources share a host
+        """
+        limits: dict[str, tuple[float, int]] = {}
+        for entry in sources.values():
+            if entry.rate_limit is None:
+                continue
+            for host in entry.hosts:
+                limits[host] = min(limits.get(host, entry.rate_limit), entry.rate_limit)
+        return limits
+
+    def _file_mtime(self) -> float | None:
+        try:
+            return os.stat(self.config_file).st_mtime
+        except OSError:
+            return None
+
+
+scraper_registry = ScraperRegistry()
+scraper_registry.load()
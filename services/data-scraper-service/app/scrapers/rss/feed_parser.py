@@ -0,0 +1,82 @@
+try:
+    from lxml.etree import XMLPullParser
+
+    LXML_AVAILABLE = True
+except ImportError:
+    from xml.etree.ElementTree import XMLPullParser
+
+    LXML_AVAILABLE = False
+
+
+ITEM_FIELDS = {"title", "description", "link", "pubDate", "guid"}
+
+
+class RssStreamParser:
+    """
+    Incremental RSS parser built on a pull (iterparse-style) parser.
+
+    Body chunks are fed as they arrive, every completed `<item>` is read in a single pass
+    over its children and removed from the tree right away, so memory usage stays flat
+    regardless of the feed size. Uses lxml when installed, stdlib ElementTree otherwise.
+    """
+
+    def __init__(self) -> None:
+        self.parser = XMLPullParser(events=("start", "end"))
+        self.stack = []
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """
+        Feeds next chunk of the body and returns items completed so far
+
+        :param chunk: next part of raw feed body
+        :type chunk: bytes
+        :return: list of raw item dicts with keys from `ITEM_FIELDS` and `categories`
+        :rtype: list[dict]
+        """
+        self.parser.feed(chunk)
+        return self._read_items()
+
+    def close(self) -> list[dict]:
+        """
+        Finishes parsing, raises if the document is not well-formed
+        """
+        self.parser.close()
+        return self._read_items()
+
+    def _read_items(self) -> list[dict]:
+        items = []
+        for event, element in self.parser.read_events():
+            if event == "start":
+                self.stack.append(element)
+                continue
+
+            self.stack.pop()
+            if element.tag != "item":
+                continue
+
+            items.append(self._read_item(element))
+            element.clear()
+            if self.stack:
+                self.stack[-1].remove(element)
+        return items
+
+    @staticmethod
+    def _read_item(element) -> dict:
+        item = {field: None for field in ITEM_FIELDS}
+        item["categories"] = []
+
+        for child in element:
+            if child.tag == "category":
+                if child.text:
+                    item["categories"].append(child.text)
+            elif child.tag in ITEM_FIELDS:
+                item[child.tag] = child.text
+        return item
+
+
+def parse_feed(content: bytes) -> list[dict]:
+    """
+    Parses whole feed body at once with the streaming parser
+    """
+    parser = RssStreamParser()
+    return parser.feed(content) + parser.close()
@@ -1,68 +1,280 @@
+from app.core.http import http_clients
+from app.core.metrics import BYTES_DOWNLOADED, ITEMS_PARSED, ITEMS_REJECTED
 from app.scrapers.base_scraper import BaseScraper, save_scrapers
+from app.scrapers.feed_cache import feed_cache
+from app.scrapers.parse_pool import parse_pool
+from app.scrapers.watermarks import FeedWalk
+from app.scrapers.rss.feed_parser import RssStreamParser, parse_feed
 from app.schemas.articles import ArticleCreate
 from app.utils.parser import parse_text
+from app.utils.url import canonicalize_url
 
-import xml.etree.ElementTree as ET
 from datetime import datetime
-import requests
+import httpx
+
+
+def parse_item(
+    item: dict, category: str | None, source_name: str
+) -> tuple[str | None, datetime | None, dict | None] | None:
+    """
+    Extracts guid, publishing date and raw article fields of a feed item. Pure CPU work,
+    safe to run in a worker process.
+
+    :return: None if the publishing date can't be parsed, fields are None if the item
+        lacks title, description or link
+    :rtype: tuple[str | None, datetime | None, dict | None] | None
+    """
+    url = item["link"]
+    date = item["pubDate"]
+    try:
+        published_date = (
+            datetime.strptime(date.replace("+0000", "GMT"), "%a, %d %b %Y %H:%M:%S %Z")
+            if date
+            else None
+        )
+    except Exception as e:
+        print(f"Error parsing article publishing date - {e}")
+        return None
+
+    guid = item["guid"] or url
+    title = parse_text(item["title"])
+    description = parse_text(item["description"])
+    if not title or not description or not url:
+        return guid, published_date, None
+
+    return (
+        guid,
+        published_date,
+        {
+            "title": title,
+            "description": description,
+            "url": canonicalize_url(url),
+            "published_at": published_date if published_date else datetime.now(),
+            "source": source_name,
+            "categories": [category] if category else item["categories"],
+        },
+    )
+
+
+def extract_articles(
+    content: bytes, category: str | None, source_name: str
+) -> tuple[list[tuple[str | None, datetime | None, dict | None]], int, int]:
+    """
+    Parses and validates whole feed body in a worker process of the parse pool. Watermarks
+    and the seen filter live in the main process, so all items are returned in feed order.
+
+    :return: (guid, publishing date, validated row or None) of every item with a valid
+        date, number of article candidates and number of rejected ones
+    :rtype: tuple[list, int, int]
+    """
+    entries = [
+        entry
+        for item in parse_feed(content)
+        if (entry := parse_item(item, category, source_name)) is not None
+    ]
+    rows = [row for _, _, row in entries if row is not None]
+    articles, rejected = ArticleCreate.create_batch(rows)
+
+    skipped = set(rejected)
+    valid = iter(articles)
+    result = []
+    row_index = 0
+    for guid, published_date, row in entries:
+        if row is not None:
+            row = None if row_index in skipped else dict(next(valid))
+            row_index += 1
+        result.append((guid, published_date, row))
+    return result, len(rows), len(rejected)
 
 
 @save_scrapers
 class RssScraper(BaseScraper):
-    def collect_data(self, category: str | None = None) -> list[ArticleCreate]:
+    def __init__(self, url: str, source_name: str = "Unknown") -> None:
+        super().__init__(url, source_name)
+        # last body size of every feed URL, picks the parse path when size isn't announced
+        self.body_sizes: dict[str, int] = {}
+
+    def collect_data(
+        self, category: str | None = None, incremental: bool = False
+    ) -> list[ArticleCreate]:
         """
         ...
         """
-        temp_url = self.url % category if category else self.url
+        temp_url = self._build_url(category)
 
         try:
-            response = requests.get(temp_url)
-            root = ET.fromstring(response.content)
-        except requests.RequestException as e:
+            response = http_clients.get_client().get(
+                temp_url, headers=self._conditional_headers(temp_url, incremental)
+            )
+        except httpx.HTTPError as e:
             raise Exception(f"Request failed for {temp_url}: {e}")
+
+        return self._process_response(
+            temp_url,
+            response.status_code,
+            response.headers,
+            response.content,
+            category,
+            incremental,
+        )
+
+    async def collect_data_async(
+        self,
+        client: httpx.AsyncClient,
+        category: str | None = None,
+        incremental: bool = False,
+    ) -> list[ArticleCreate]:
+        """
+        Streams feed body straight into the incremental parser, the whole body is never
+        held in memory. In incremental mode the body fingerprint is computed on the fly,
+        articles of an unchanged feed and items behind the feed watermark are dropped.
+
+        Bodies above the parse pool threshold are downloaded whole and parsed in a worker
+        process instead, unchanged ones are skipped before parsing.
+        """
+        temp_url = self._build_url(category)
+        parser = RssStreamParser()
+        hasher = feed_cache.hasher()
+        walk = self._walk(category, incremental)
+        rows: list[dict] = []
+        body: list[bytes] | None = None
+
+        try:
+            async with client.stream(
+                "GET",
+                temp_url,
+                headers=self._conditional_headers(temp_url, incremental),
+            ) as response:
+                if incremental and response.status_code == 304:
+                    return []
+                response.raise_for_status()
+
+                size = response.headers.get("content-length")
+                if parse_pool.should_offload(
+                    int(size) if size else self.body_sizes.get(temp_url, 0)
+                ):
+                    body = []
+
+                async for chunk in response.aiter_bytes():
+                    BYTES_DOWNLOADED.labels(self.source_name).inc(len(chunk))
+                    hasher.update(chunk)
+                    if body is not None:
+                        body.append(chunk)
+                        continue
+                    rows += self._build_rows(
+                        self._feed_parser(parser, chunk), category, incremental, walk
+                    )
+                if body is None:
+                    rows += self._build_rows(
+                        self._feed_parser(parser), category, incremental, walk
+                    )
+        except httpx.HTTPError as e:
+            raise Exception(f"Request failed for {temp_url}: {e}") from e
+
+        self.body_sizes[temp_url] = response.num_bytes_downloaded
+
+        fingerprint = hasher.hexdigest()
+        if incremental and feed_cache.is_unchanged(
+            temp_url, response.status_code, fingerprint
+        ):
+            return []
+
+        if body is not None:
+            data = await self._extract_in_pool(
+                b"".join(body), category, incremental, walk
+            )
+        else:
+            data = self._validate_articles(rows)
+
+        if incremental:
+            feed_cache.stage(temp_url, response.headers, fingerprint)
+            walk.stage()
+        return data
+
+    async def _extract_in_pool(
+        self, content: bytes, category: str | None, incremental: bool, walk: FeedWalk
+    ) -> list[ArticleCreate]:
+        """
+        Parses body in the parse pool, then applies the watermark walk and the seen filter
+        to the returned rows, which are already validated
+        """
+        try:
+            entries, parsed, rejected = await parse_pool.run(
+                extract_articles, content, category, self.source_name
+            )
         except Exception as e:
             raise Exception(e)
 
+        ITEMS_PARSED.labels(self.source_name).inc(parsed)
+        ITEMS_REJECTED.labels(self.source_name).inc(rejected)
+
         data: list[ArticleCreate] = []
+        for guid, published_date, row in entries:
+            if walk.reached(published_date, guid):
+                continue
+            walk.observe(published_date, guid)
+            if row is None or self._is_known(row["url"], incremental):
+                continue
+            data.append(ArticleCreate.model_construct(**row))
+        return data
 
-        for item in root.iter("item"):
-            title = item.find(".//title").text
-            title = parse_text(title)
+    def parse_content(
+        self, content: bytes, category: str | None = None, incremental: bool = False
+    ) -> list[ArticleCreate]:
+        """
+        Parses raw RSS feed body into list of articles
 
-            description = item.find(".//description").text
-            description = parse_text(description)
-            url = item.find(".//link").text
+        :param content: raw feed body
+        :type content: bytes
+        :param category: category the feed was fetched for
+        :type category: str | None
+        :param incremental: drop articles already stored in the database
+        :type incremental: bool
+        """
+        try:
+            items = parse_feed(content)
+        except Exception as e:
+            raise Exception(e)
 
-            if not title or not description or not url or url in self.collected_by_url:
-                continue
+        return self._validate_articles(self._build_rows(items, category, incremental))
+
+    @staticmethod
+    def _feed_parser(parser: RssStreamParser, chunk: bytes | None = None) -> list[dict]:
+        try:
+            return parser.feed(chunk) if chunk is not None else parser.close()
+        except Exception as e:
+            raise Exception(e)
+
+    def _build_rows(
+        self,
+        items: list[dict],
+        category: str | None = None,
+        incremental: bool = False,
+        walk: FeedWalk | None = None,
+    ) -> list[dict]:
+        """
+        Builds raw article rows from feed items, in incremental mode skips items behind
+        the feed watermark. Walk is staged here unless passed by the caller.
+        """
+        owns_walk = walk is None
+        if owns_walk:
+            walk = self._walk(category, incremental)
+        rows: list[dict] = []
 
-            date = item.find(".//pubDate").text
-            try:
-                date = date.replace("+0000", "GMT")
-                published_date = (
-                    datetime.strptime(date, "%a, %d %b %Y %H:%M:%S %Z")
-                    if date
-                    else datetime.now()
-                )
-            except Exception as e:
-                print(f"Error parsing article publishing date - {e}")
+        for item in items:
+            entry = parse_item(item, category, self.source_name)
+            if entry is None:
                 continue
 
-            categories = (
-                [category]
-                if category
-                else []
-                + [
-                    category.text
-                    for category in item.findall(".//category")
-                    if category.text
-                ]
-            )
+            guid, published_date, row = entry
+            if walk.reached(published_date, guid):
+                continue
+            walk.observe(published_date, guid)
 
-            article = self._save_article(
-                title, description, url, categories, published_date
-            )
-            if article:
-                data.append(article)
+            if row is None or self._is_known(row["url"], incremental):
+                continue
+            rows.append(row)
 
-        return data
\ No newline at end of file
+        if owns_walk:
+            walk.stage()
+        return rows
@@ -0,0 +1,97 @@
+from sqlalchemy import select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.articles import ArticleArchiveDB, ArticleDB
+from app.utils.url import canonicalize_url
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from dotenv import load_dotenv
+import hashlib
+import os
+import threading
+
+load_dotenv()
+
+SEEN_URLS_FILE = os.getenv("SEEN_URLS_FILE", ".cache/seen_urls.bin")
+
+
+def url_hash(url: str) -> int:
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "big")
+
+
+class SeenUrlFilter:
+    """
+    Persistent membership filter of canonical URLs of articles already stored in the database.
+
+    URLs are kept as a sorted array of 64-bit hashes (8 bytes per article, binary search
+    lookups), persisted on disk and rebuilt from the `article` and `article_archive` tables
+    when missing. Scrapers consult it in incremental mode to drop known articles before
+    validating them.
+    """
+
+    def __init__(self, path: str = SEEN_URLS_FILE) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.hashes = array("Q")
+        self.loaded = self._load()
+
+    def __contains__(self, url: str) -> bool:
+        return self._has_hash(url_hash(url))
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def update(self, urls: Iterable[str]) -> None:
+        """
+        Adds canonical URLs of newly stored articles and persists the filter
+        """
+        with self.lock:
+            new_hashes = {
+                value
+                for value in (url_hash(url) for url in urls)
+                if not self._has_hash(value)
+            }
+            if not new_hashes:
+                return
+            self.hashes = array("Q", sorted([*self.hashes, *new_hashes]))
+            self._dump()
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """
+        Rebuilds the filter from URLs stored in the `article` table and in the archive,
+        archived articles lose their `article_url` claim and would be inserted again
+        """
+        urls = union_all(select(ArticleDB.url), select(ArticleArchiveDB.url))
+        hashes = {
+            url_hash(canonicalize_url(url))
+            async for url in await db.stream_scalars(select(urls.subquery().c.url))
+        }
+        with self.lock:
+            self.hashes = array("Q", sorted(hashes))
+            self.loaded = True
+            self._dump()
+
+    def _has_hash(self, value: int) -> bool:
+        hashes = self.hashes
+        index = bisect_left(hashes, value)
+        return index < len(hashes) and hashes[index] == value
+
+    def _load(self) -> bool:
+        try:
+            with open(self.path, "rb") as fh:
+                self.hashes.frombytes(fh.read())
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _dump(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as fh:
+            self.hashes.tofile(fh)
+        os.replace(temp_path, self.path)
+
+
+seen_filter = SeenUrlFilter()
@@ -0,0 +1,196 @@
+from app.core.http import HTTP_READ_TIMEOUT
+from app.core.metrics import BreakerStateCollector, registry
+
+from collections import deque
+from dotenv import load_dotenv
+from datetime import datetime
+from enum import Enum
+import math
+import os
+import threading
+import time
+
+load_dotenv()
+
+# consecutive failures opening the breaker of a source
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+# seconds an open breaker waits before letting a single probe request through
+BREAKER_COOLDOWN_SECONDS = float(os.getenv("BREAKER_COOLDOWN_SECONDS", "300"))
+# adaptive timeout = p95 of recent fetch durations x multiplier, within the bounds below
+TIMEOUT_P95_MULTIPLIER = float(os.getenv("TIMEOUT_P95_MULTIPLIER", "3"))
+TIMEOUT_MIN_SECONDS = float(os.getenv("TIMEOUT_MIN_SECONDS", "2"))
+TIMEOUT_MAX_SECONDS = float(os.getenv("TIMEOUT_MAX_SECONDS", str(HTTP_READ_TIMEOUT)))
+LATENCY_WINDOW = 50
+LATENCY_MIN_SAMPLES = 5
+TRANSITIONS_KEPT = 100
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class SourceUnavailable(Exception):
+    """
+    Raised instead of fetching a source whose circuit breaker is open
+    """
+
+
+class SourceHealth:
+    def __init__(self) -> None:
+        self.state = BreakerState.CLOSED
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.consecutive_failures = 0
+        self.total_successes = 0
+        self.total_failures = 0
+        self.opened_at: float | None = None
+        self.probe_in_flight = False
+        self.last_error: str | None = None
+
+    def p95(self) -> float | None:
+        if len(self.latencies) < LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+
+class HealthTracker:
+    """
+    Per-source health of the scrape loop: adaptive fetch timeouts and circuit breakers.
+
+    Timeout of a source follows the p95 of its recent fetch durations. After
+    `failure_threshold` consecutive failures the breaker opens and the source is skipped
+    for `cooldown` seconds, then a single probe request decides whether it closes again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN_SECONDS,
+        clock=time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.sources: dict[str, SourceHealth] = {}
+        self.transitions: deque[dict] = deque(maxlen=TRANSITIONS_KEPT)
+
+    def timeout(self, source: str) -> float:
+        """
+        Returns timeout of the next fetch from given source
+        """
+        with self.lock:
+            p95 = self._health(source).p95()
+        if p95 is None:
+            return TIMEOUT_MAX_SECONDS
+        return min(
+            TIMEOUT_MAX_SECONDS, max(TIMEOUT_MIN_SECONDS, p95 * TIMEOUT_P95_MULTIPLIER)
+        )
+
+    def allow(self, source: str) -> bool:
+        """
+        Checks whether source may be fetched now, an open breaker past its cool-down
+        lets exactly one probe through
+        """
+        with self.lock:
+            health = self._health(source)
+            if health.state == BreakerState.CLOSED:
+                return True
+            if health.state == BreakerState.OPEN:
+                if self.clock() - health.opened_at < self.cooldown:
+                    return False
+                self._transition(source, health, BreakerState.HALF_OPEN)
+            if health.probe_in_flight:
+                return False
+            health.probe_in_flight = True
+            return True
+
+    def record_success(self, source: str, duration: float) -> None:
+        with self.lock:
+            health = self._health(source)
+            health.latencies.append(duration)
+            health.consecutive_failures = 0
+            health.total_successes += 1
+            health.probe_in_flight = False
+            if health.state != BreakerState.CLOSED:
+                self._transition(source, health, BreakerState.CLOSED)
+
+    def record_failure(
+        self, source: str, error: BaseException, duration: float | None = None
+    ) -> None:
+        """
+        Records failed fetch, duration of a timed out fetch is kept as a latency sample
+        so a source that became slower gets a longer timeout instead of failing forever
+        """
+        with self.lock:
+            health = self._health(source)
+            if duration is not None:
+                health.latencies.append(duration)
+            health.consecutive_failures += 1
+            health.total_failures += 1
+            health.last_error = str(error) or type(error).__name__
+            health.probe_in_flight = False
+            if health.state == BreakerState.HALF_OPEN or (
+                health.state == BreakerState.CLOSED
+                and health.consecutive_failures >= self.failure_threshold
+            ):
+                health.opened_at = self.clock()
+                self._transition(source, health, BreakerState.OPEN)
+
+    def record_cancelled(self, source: str) -> None:
+        """
+        Releases probe slot of a fetch cancelled before it finished
+        """
+        with self.lock:
+            self._health(source).probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        """
+        Returns state of every tracked source and recent breaker transitions
+        """
+        with self.lock:
+            sources = {
+                source: {
+                    "state": health.state,
+                    "consecutive_failures": health.consecutive_failures,
+                    "total_successes": health.total_successes,
+                    "total_failures": health.total_failures,
+                    "p95_seconds": health.p95(),
+                    "last_error": health.last_error,
+                    "retry_in_seconds": (
+                        max(0.0, self.cooldown - (self.clock() - health.opened_at))
+                        if health.state == BreakerState.OPEN
+                        else None
+                    ),
+                }
+                for source, health in self.sources.items()
+            }
+            transitions = list(self.transitions)
+
+        for source in sources:
+            sources[source]["timeout_seconds"] = self.timeout(source)
+        return {"sources": sources, "transitions": transitions}
+
+    def _health(self, source: str) -> SourceHealth:
+        if source not in self.sources:
+            self.sources[source] = SourceHealth()
+        return self.sources[source]
+
+    def _transition(
+        self, source: str, health: SourceHealth, state: BreakerState
+    ) -> None:
+        self.transitions.append(
+            {
+                "source": source,
+                "from": health.state,
+                "to": state,
+                "at": datetime.now().isoformat(),
+            }
+        )
+        health.state = state
+
+
+health_tracker = HealthTracker()
+registry.register(BreakerStateCollector(health_tracker))
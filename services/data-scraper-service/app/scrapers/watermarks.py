@@ -0,0 +1,173 @@
+from dotenv import load_dotenv
+from datetime import datetime, timezone
+import json
+import os
+import threading
+
+load_dotenv()
+
+WATERMARKS_FILE = os.getenv("WATERMARKS_FILE", ".cache/watermarks.json")
+
+
+def _as_utc(date: datetime) -> datetime:
+    # feeds publish naive dates in GMT
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+    return date.astimezone(timezone.utc)
+
+
+class FeedWalk:
+    """
+    Tracks a single pass over items of a feed against its watermark.
+
+    Extractors ask `reached` before handling every item and skip the item when it returns
+    True, then `observe` the rest. The whole feed is always walked, since some feeds
+    (most viewed, top stories) are ordered by ranking and list new items below old ones.
+    A disabled walk skips nothing and records nothing.
+    """
+
+    def __init__(
+        self,
+        store: "WatermarkStore",
+        key: str,
+        watermark: dict | None,
+        enabled: bool = True,
+    ) -> None:
+        self.store = store
+        self.key = key
+        self.enabled = enabled
+        self.guid = watermark.get("guid") if watermark else None
+        self.published_at = (
+            datetime.fromisoformat(watermark["published_at"])
+            if watermark and watermark.get("published_at")
+            else None
+        )
+        self.newest: dict | None = None
+
+    def reached(self, published_at: datetime | None, guid: str | None) -> bool:
+        """
+        Checks whether item was already seen in a committed scrape - it is the newest item
+        recorded by the watermark or it was published before it
+
+        :param published_at: publishing date of the item, None if feed doesn't provide it
+        :type published_at: datetime | None
+        :param guid: guid of the item (or its URL)
+        :type guid: str | None
+        """
+        if not self.enabled:
+            return False
+
+        return (guid is not None and guid == self.guid) or (
+            published_at is not None
+            and self.published_at is not None
+            and _as_utc(published_at) < self.published_at
+        )
+
+    def observe(self, published_at: datetime | None, guid: str | None) -> None:
+        """
+        Records an item walked past, the first one becomes the new watermark
+        """
+        if not self.enabled:
+            return
+
+        if self.newest is None:
+            self.newest = {"guid": guid, "published_at": None}
+        if published_at is not None:
+            published_at = _as_utc(published_at)
+            newest_date = self.newest["published_at"]
+            if newest_date is None or published_at > datetime.fromisoformat(
+                newest_date
+            ):
+                self.newest["published_at"] = published_at.isoformat()
+
+    def stage(self) -> None:
+        """
+        Stages new watermark of the feed if any new item was walked
+        """
+        if self.enabled and self.newest is not None:
+            if self.newest["published_at"] is None and self.published_at is not None:
+                self.newest["published_at"] = self.published_at.isoformat()
+            self.store.stage(self.key, self.newest)
+
+
+class WatermarkStore:
+    """
+    Persistent high-watermarks of feeds keyed by (source id, category) - newest
+    `published_at` and guid seen in the last committed scrape. Entries of the former
+    keys by display name are never read, such feeds are walked whole once.
+
+    Like the feed cache, watermarks are staged while scraping and persisted by `commit`
+    only once the scraped articles were stored.
+    """
+
+    def __init__(self, path: str = WATERMARKS_FILE) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = self._load()
+        self.staged: dict[str, dict] = {}
+
+    @staticmethod
+    def key(source: str, category: str | None = None) -> str:
+        return f"{source}/{category}" if category else source
+
+    def get(self, source: str, category: str | None = None) -> dict | None:
+        return self.entries.get(self.key(source, category))
+
+    def walk(
+        self, source: str, category: str | None = None, enabled: bool = True
+    ) -> FeedWalk:
+        """
+        Starts a walk over items of given feed
+
+        :param source: config id of the source
+        :type source: str
+        :param category: category of the feed, None if source categories are not defined
+        :type category: str | None
+        :param enabled: track the watermark, disabled walks skip nothing
+        :type enabled: bool
+        """
+        key = self.key(source, category)
+        return FeedWalk(self, key, self.entries.get(key), enabled)
+
+    def stage(self, key: str, watermark: dict) -> None:
+        with self.lock:
+            self.staged[key] = watermark
+
+    def unstage(self, source: str, category: str | None = None) -> None:
+        with self.lock:
+            self.staged.pop(self.key(source, category), None)
+
+    def commit(self) -> None:
+        """
+        Persists all staged watermarks
+        """
+        with self.lock:
+            if not self.staged:
+                return
+            self.entries.update(self.staged)
+            self.staged = {}
+            self._dump()
+
+    def discard(self) -> None:
+        """
+        Drops all staged watermarks, e.g. when saving scraped articles failed
+        """
+        with self.lock:
+            self.staged = {}
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, "r") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _dump(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as fh:
+            json.dump(self.entries, fh)
+        os.replace(temp_path, self.path)
+
+
+watermark_store = WatermarkStore()
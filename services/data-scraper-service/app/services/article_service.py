@@ -1,13 +1,12 @@
-from app.scrapers import API_SCRAPERS
-from app.core.config import CONTEXT
-
+from app.core.http import http_clients
+from app.core.metrics import ITEMS_DEDUPLICATED
 from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.fetch_engine import fetch_engine
+from app.scrapers.registry import scraper_registry
 from app.schemas.articles import ArticleCreate
 
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
+from collections.abc import AsyncIterator, Callable, Iterable
+import asyncio
 
 
 class ScraperService(object):
@@ -20,125 +19,161 @@ class ScraperService(object):
             cls.instance = super(ScraperService, cls).__new__(cls)
         return cls.instance
 
-    def fetch_articles(
+    async def fetch_articles(
         self, source: str, category: str | None = None
     ) -> list[ArticleCreate]:
         """
         Fetch_articles gets all articles from given source of 'category' (if specified else all available)
+        over the shared async client, so requests keep to the rate limit of the host
 
         :param source: name of accessed source e.g. RSS, API
         :type source: str
         :param category: catrgory of source entries to get, None if source categories are not defined
         :type category: str | None
         """
-        if source not in CONTEXT:
-            raise ValueError(f"Source: `{source}` not found")
-
-        scraper_type, base_url, available_categories, source_name, api_key_name = (
-            self._validate_configuration(source, category)
-        )
-
-        scraper = API_SCRAPERS[scraper_type]
-        api_key = os.getenv(api_key_name)
-        source_name = source_name if source_name else "Unknown"
-        scraper: BaseScraper = (
-            scraper(base_url, source_name, api_key)
-            if api_key
-            else scraper(base_url, source_name)
-        )
-
-        if not category and available_categories:
-            scraped_articles: list[ArticleCreate] = []
-            for category in available_categories:
-                scraped_articles += scraper.collect_data(category)
-            return scraped_articles
+        entry = scraper_registry.get(source, category)
+        categories = [category] if category else list(entry.urls)
+
+        async with http_clients.current_async_client() as client:
+            results = await asyncio.gather(
+                *(
+                    entry.scraper.collect_data_async(client, category)
+                    for category in categories
+                ),
+                return_exceptions=True,
+            )
 
-        return scraper.collect_data(category)
+        seen_urls: set[str] = set()
+        scraped_articles: list[ArticleCreate] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            scraped_articles += self._unique(result, seen_urls)
+        return scraped_articles
 
-    def fetch_all_articles(
-        self, limit_per_source: int | None = None
+    def feeds(self) -> list[tuple[str, str | None]]:
+        """
+        Lists (source name, category) pairs of all feeds scraped by `fetch_all_articles`
+        """
+        return [
+            (source_name, category) for source_name, _, category in self._build_jobs()
+        ]
+
+    async def fetch_all_articles(
+        self,
+        limit_per_source: int | None = None,
+        incremental: bool = False,
+        on_feed_done: Callable[
+            [str, str | None, list[ArticleCreate] | BaseException], None
+        ]
+        | None = None,
     ) -> list[ArticleCreate]:
         """
         Fetch_articles gets all articles from all sources and categories (if specified)
-        defined in `core/config.json` file
+        defined in `core/config.json` file. All source x category feeds are fetched
+        concurrently by the fetch engine.
 
-        :param limit_per_source: Description
+        :param limit_per_source: max number of articles taken from a single feed, in
+            incremental mode the rest of a cut feed is taken by the next runs
         :type limit_per_source: int
+        :param incremental: skip feeds that didn't change since the last committed scrape
+            (`feed_cache.commit()` has to be called once the articles are stored)
+        :type incremental: bool
+        :param on_feed_done: called with source name, category and articles (or error)
+            of every feed as soon as it is fetched
+        :type on_feed_done: Callable | None
         :returns: ...
         :rtype: list[ArticleCreate]
         """
-        data: list[ArticleCreate] = []
-
-        for source in CONTEXT:
-            (
-                scraper_type,
-                base_url,
-                available_categories,
+        jobs = self._build_jobs()
+
+        def limit(index: int, result: list[ArticleCreate]) -> list[ArticleCreate]:
+            if not limit_per_source or len(result) <= limit_per_source:
+                return result
+            if incremental:
+                # position of a cut feed is not committed, articles left out are not
+                # stored yet, so the seen filter lets them through in the next run
+                _, scraper, category = jobs[index]
+                scraper.discard_staged(category)
+            return result[:limit_per_source]
+
+        def feed_done(index: int, result: list[ArticleCreate] | BaseException):
+            source_name, _, category = jobs[index]
+            on_feed_done(
                 source_name,
-                api_key_name,
-            ) = self._validate_configuration(source)
-
-            scraper = API_SCRAPERS[scraper_type]
-            api_key = os.getenv(api_key_name)
-            source_name = source_name if source_name else "Unknown"
-            scraper = (
-                scraper(base_url, source_name, api_key)
-                if api_key
-                else scraper(base_url, source_name)
+                category,
+                result if isinstance(result, BaseException) else limit(index, result),
             )
-            try:
-                if available_categories:
-                    for category in available_categories:
-                        data += (
-                            scraper.collect_data(category)[:limit_per_source]
-                            if limit_per_source
-                            else scraper.collect_data(category)
-                        )
-                else:
-                    data += (
-                        scraper.collect_data()[:limit_per_source]
-                        if limit_per_source
-                        else scraper.collect_data()
-                    )
-            except Exception as e:
-                print(f"Data source '{source_name}' is not responding - error: {e}")
+
+        results = await fetch_engine.gather(
+            [(scraper, category) for _, scraper, category in jobs],
+            incremental,
+            feed_done if on_feed_done else None,
+        )
+
+        seen_urls: set[str] = set()
+        data: list[ArticleCreate] = []
+        for index, ((source_name, _, _), result) in enumerate(zip(jobs, results)):
+            if isinstance(result, BaseException):
+                print(
+                    f"Data source '{source_name}' is not responding - error: {result}"
+                )
+                continue
+            data += self._unique(limit(index, result), seen_urls)
 
         return data
 
-    def _validate_configuration(
-        self, source: str, category: str | None = None
-    ) -> tuple:
+    async def stream_all_articles(
+        self, limit_per_source: int | None = None
+    ) -> AsyncIterator[ArticleCreate]:
         """
-        Docstring for _validate_configuration
+        Streaming counterpart of `fetch_all_articles`, yields articles of every feed as soon
+        as the feed is fetched, only articles of a single feed are held at a time
 
-        :param self: Description
-        :param source_data: Description
+        :param limit_per_source: Description
+        :type limit_per_source: int
+        :returns: ...
+        :rtype: AsyncIterator[ArticleCreate]
         """
-        source_data = CONTEXT[source]
-
-        scraper_type = source_data["type"]
-        if scraper_type not in API_SCRAPERS:
-            raise RuntimeError(f"Scraper `{scraper_type}` is not configured")
-
-        base_url = source_data["endpoint"].get("base_url", None)
-        if not base_url:
-            raise ValueError("Chosen source scraper missing URL in configuration")
-
-        available_categories = source_data["endpoint"].get("categories", [])
-
-        if category and category not in available_categories:
-            raise ValueError(f"Category: `{category}` not found for source: `{source}`")
-
-        source_name = source_data.get("title", None)
-        api_key_name = source_data.get("api_key", "")
+        jobs = self._build_jobs()
+        seen_urls: set[str] = set()
+
+        async for index, result in fetch_engine.stream(
+            [(scraper, category) for _, scraper, category in jobs]
+        ):
+            source_name, _, _ = jobs[index]
+            if isinstance(result, BaseException):
+                print(
+                    f"Data source '{source_name}' is not responding - error: {result}"
+                )
+                continue
+            feed_articles = result[:limit_per_source] if limit_per_source else result
+            for article in self._unique(feed_articles, seen_urls):
+                yield article
+
+    def _build_jobs(self) -> list[tuple[str, BaseScraper, str | None]]:
+        """
+        Returns (source name, scraper, category) of every configured feed, scrapers
+        are long-lived instances compiled by the scraper registry
+        """
+        return scraper_registry.jobs
 
-        return (
-            scraper_type,
-            base_url,
-            available_categories,
-            source_name,
-            api_key_name,
-        )
+    @staticmethod
+    def _unique(
+        articles: Iterable[ArticleCreate], seen_urls: set[str]
+    ) -> list[ArticleCreate]:
+        """
+        Drops articles whose URL was already collected in this run, e.g. the same story
+        listed in several categories of a source
+        """
+        unique: list[ArticleCreate] = []
+        for article in articles:
+            if article.url in seen_urls:
+                ITEMS_DEDUPLICATED.labels("seen").inc()
+                continue
+            seen_urls.add(article.url)
+            unique.append(article)
+        return unique
 
 
 scraper_service = ScraperService()
@@ -1,57 +1,160 @@
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import DB_SAVE_DURATION, ITEMS_DEDUPLICATED, ITEMS_SAVED
 from app.models.articles import ArticleDB
 from app.schemas.articles import ArticleCreate
 
+from dotenv import load_dotenv
+import json
+import os
+import time
+
+load_dotenv()
+
+# batches of at least this size are streamed through a COPY staging table (Postgres only)
+COPY_THRESHOLD = int(os.getenv("DB_COPY_THRESHOLD", "1000"))
+INSERT_BATCH_SIZE = int(os.getenv("DB_INSERT_BATCH_SIZE", "1000"))
+
+ARTICLE_COLUMNS = (
+    "title",
+    "description",
+    "url",
+    "published_at",
+    "source",
+    "categories",
+    "simhash",
+    "cluster_id",
+)
+
 
 class DatabaseService:
-    def save_articles(self, articles: list[ArticleCreate], db: Session) -> dict:
+    async def save_articles(
+        self, articles: list[ArticleCreate], db: AsyncSession
+    ) -> dict:
         """
-        Allows to save scraped articles in database
+        Allows to save scraped articles in database. Articles are inserted set-based and
+        duplicates are skipped by the database instead of being looked up and added one by
+        one - by the url registry of the partitioned `article` table in Postgres, by the
+        unique index on `article.url` elsewhere.
 
         :param self: Description
         :param articles: Description
         :type articles: list[ArticleCreate]
         :param db: Description
-        :type db: Session
+        :type db: AsyncSession
         """
+        rows = [self._to_row(article) for article in articles]
+        use_copy = len(rows) >= COPY_THRESHOLD and self._supports_copy(db)
 
-        saved_count = 0
-        skipped_count = 0
-
-        urls_to_check = [str(article.url) for article in articles]
-        existing_article_records = {
-            record.url
-            for record in db.query(ArticleDB)
-            .filter(ArticleDB.url.in_(urls_to_check))
-            .all()
-        }
-
-        for article in articles:
-            if str(article.url) in existing_article_records:
-                skipped_count += 1
-                continue
-
-            article_data = article.model_dump(mode="json", exclude_none=True)
-            article_db = ArticleDB(**article_data)
-            db.add(article_db)
-            saved_count += 1
-
+        started = time.perf_counter()
         try:
-            db.commit()
+            if use_copy:
+                saved_count = await self._copy_articles(rows, db)
+            else:
+                saved_count = await self._insert_articles(rows, db)
+            await db.commit()
             status = "SUCCESS"
         except IntegrityError:
-            db.rollback()
-            status = "FAIL"
+            await db.rollback()
             raise RuntimeError("Database error during bulk save")
+        DB_SAVE_DURATION.labels("copy" if use_copy else "insert").observe(
+            time.perf_counter() - started
+        )
+        ITEMS_SAVED.inc(saved_count)
+        ITEMS_DEDUPLICATED.labels("conflict").inc(len(articles) - saved_count)
 
         return {
             "status": status,
             "total_scraped": len(articles),
             "new_saved": saved_count,
-            "skipped_duplicates": skipped_count,
+            "skipped_duplicates": len(articles) - saved_count,
         }
 
+    async def _insert_articles(self, rows: list[dict], db: AsyncSession) -> int:
+        """
+        Inserts rows with multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING id`,
+        one round trip per batch
+
+        :return: number of newly inserted articles
+        :rtype: int
+        """
+        insert = (
+            postgresql_insert
+            if db.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+
+        saved_count = 0
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            statement = (
+                insert(ArticleDB)
+                .values(rows[start : start + INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing()
+                .returning(ArticleDB.id)
+            )
+            saved_count += len((await db.execute(statement)).all())
+        return saved_count
+
+    async def _copy_articles(self, rows: list[dict], db: AsyncSession) -> int:
+        """
+        Streams rows into a temporary staging table with binary `COPY` and moves them into
+        `article` with a single set-based `INSERT ... SELECT ... ON CONFLICT DO NOTHING`
+
+        :return: number of newly inserted articles
+        :rtype: int
+        """
+        columns = ", ".join(ARTICLE_COLUMNS)
+        await db.execute(
+            text(
+                "CREATE TEMP TABLE article_staging ("
+                "title TEXT, description TEXT, url TEXT, published_at TIMESTAMPTZ, "
+                "source TEXT, categories JSONB, simhash BIGINT, cluster_id BIGINT) "
+                "ON COMMIT DROP"
+            )
+        )
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "article_staging",
+            records=self._rows_to_records(rows),
+            columns=ARTICLE_COLUMNS,
+        )
+
+        result = await db.execute(
+            text(
+                f"INSERT INTO article ({columns}) "
+                f"SELECT DISTINCT ON (url) {columns} FROM article_staging "
+                "ON CONFLICT DO NOTHING"
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def _to_row(article: ArticleCreate) -> dict:
+        # fields are already validated DB-ready values, no serialization pass needed
+        return dict(article)
+
+    @staticmethod
+    def _supports_copy(db: AsyncSession) -> bool:
+        bind = db.get_bind()
+        return bind.dialect.name == "postgresql" and bind.dialect.driver == "asyncpg"
+
+    @staticmethod
+    def _rows_to_records(rows: list[dict]) -> list[tuple]:
+        return [
+            tuple(
+                json.dumps(row["categories"])
+                if column == "categories"
+                else row.get(column)
+                for column in ARTICLE_COLUMNS
+            )
+            for row in rows
+        ]
+
 
 db_service = DatabaseService()
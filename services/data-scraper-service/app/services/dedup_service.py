@@ -0,0 +1,261 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import ITEMS_DEDUPLICATED
+from app.models.articles import ArticleDB
+from app.schemas.articles import ArticleCreate
+
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+import hashlib
+import numpy as np
+import os
+import re
+
+load_dotenv()
+
+# articles published within this many days are matched against the new batch
+DEDUP_WINDOW_DAYS = int(os.getenv("DEDUP_WINDOW_DAYS", "3"))
+# signatures differing in at most this many bits are considered near-duplicates
+DEDUP_MAX_DISTANCE = int(os.getenv("DEDUP_MAX_DISTANCE", "6"))
+# documents processed at once while building signatures, bounds the token matrix size
+SIGNATURE_CHUNK_SIZE = 5000
+
+SIGNATURE_BITS = 64
+TOKEN_PATTERN = re.compile(r"\w{3,}")
+POPCOUNT_TABLE = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def simhash_signatures(texts: list[str]) -> np.ndarray:
+    """
+    Computes 64-bit SimHash signatures of given texts.
+
+    Every distinct token is hashed once, then the bit votes of all tokens of all documents
+    are summed with a single `np.add.reduceat` per chunk of documents.
+
+    :param texts: documents to sign
+    :type texts: list[str]
+    :return: array of signatures, 0 for documents without tokens
+    :rtype: np.ndarray (uint64)
+    """
+    token_ids: dict[str, int] = {}
+    documents = [
+        [token_ids.setdefault(token, len(token_ids)) for token in tokenize(text)]
+        for text in texts
+    ]
+
+    token_hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest())
+            for token in token_ids
+        ),
+        dtype=np.uint64,
+        count=len(token_ids),
+    )
+    # +1 / -1 vote of every token for every signature bit
+    token_votes = _to_bits(token_hashes).astype(np.int32) * 2 - 1
+
+    signatures = np.zeros(len(texts), dtype=np.uint64)
+    for start in range(0, len(documents), SIGNATURE_CHUNK_SIZE):
+        chunk = documents[start : start + SIGNATURE_CHUNK_SIZE]
+        lengths = np.fromiter((len(tokens) for tokens in chunk), dtype=np.int64)
+        non_empty = np.flatnonzero(lengths)
+        if not non_empty.size:
+            continue
+
+        flat_tokens = np.fromiter(
+            (token for tokens in chunk for token in tokens),
+            dtype=np.int64,
+            count=int(lengths.sum()),
+        )
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))[non_empty]
+        votes = np.add.reduceat(token_votes[flat_tokens], offsets, axis=0)
+        signatures[start + non_empty] = _from_bits(votes > 0)
+
+    return signatures
+
+
+def hamming_distance(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Returns numbers of differing bits of (broadcast) uint64 signature arrays
+    """
+    xor = np.ascontiguousarray(np.bitwise_xor(left, right), dtype="<u8")
+    return POPCOUNT_TABLE[xor.view(np.uint8)].reshape(*xor.shape, 8).sum(axis=-1)
+
+
+def _to_bits(values: np.ndarray) -> np.ndarray:
+    return np.unpackbits(
+        values.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little"
+    )
+
+
+def _from_bits(bits: np.ndarray) -> np.ndarray:
+    return (
+        np.packbits(bits, axis=1, bitorder="little").view("<u8").reshape(-1)
+    ).astype(np.uint64)
+
+
+def _to_signed(values: np.ndarray) -> list[int]:
+    # Postgres BIGINT is signed, signatures are stored in two's complement
+    return values.astype(np.uint64).view(np.int64).tolist()
+
+
+class DedupService:
+    """
+    Clusters near-duplicate articles (the same wire story syndicated by several sources)
+    before they are saved.
+
+    Signatures are split into `max_distance + 1` bands, by the pigeonhole principle two
+    signatures within `max_distance` bits share at least one band exactly, so only articles
+    colliding in some band (LSH buckets) are compared. Articles of the new batch are matched
+    with each other and with articles stored in the last `window_days` days.
+    """
+
+    def __init__(
+        self,
+        window_days: int = DEDUP_WINDOW_DAYS,
+        max_distance: int = DEDUP_MAX_DISTANCE,
+    ) -> None:
+        self.window_days = window_days
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = SIGNATURE_BITS // self.bands
+
+    async def assign_clusters(
+        self, articles: list[ArticleCreate], db: AsyncSession
+    ) -> list[ArticleCreate]:
+        """
+        Sets `simhash` and `cluster_id` of given articles. Articles matching an already
+        stored one join its cluster, other clusters are identified by the signature
+        of their first article. Articles without any word to sign are left unclustered.
+
+        :param articles: newly scraped articles
+        :type articles: list[ArticleCreate]
+        :param db: Description
+        :type db: AsyncSession
+        :return: the same articles with cluster ids assigned
+        :rtype: list[ArticleCreate]
+        """
+        if not articles:
+            return articles
+
+        signatures = simhash_signatures(
+            [f"{article.title} {article.description}" for article in articles]
+        )
+        stored_signatures, stored_clusters = await self._load_recent(db)
+        cluster_ids = self.cluster(signatures, stored_signatures, stored_clusters)
+
+        for article, signature, cluster_id in zip(
+            articles, _to_signed(signatures), cluster_ids
+        ):
+            article.simhash = signature or None
+            article.cluster_id = cluster_id
+            if cluster_id is not None and cluster_id != article.simhash:
+                ITEMS_DEDUPLICATED.labels("near_duplicate").inc()
+        return articles
+
+    def cluster(
+        self,
+        signatures: np.ndarray,
+        stored_signatures: np.ndarray | None = None,
+        stored_clusters: list[int] | None = None,
+    ) -> list[int | None]:
+        """
+        Groups signatures into clusters of near-duplicates
+
+        :param signatures: uint64 signatures of new articles
+        :type signatures: np.ndarray
+        :param stored_signatures: uint64 signatures of recently stored articles
+        :type stored_signatures: np.ndarray | None
+        :param stored_clusters: cluster ids of recently stored articles
+        :type stored_clusters: list[int] | None
+        :return: cluster id of every new article, None for articles without signature
+        :rtype: list[int | None]
+        """
+        if stored_signatures is None:
+            stored_signatures = np.zeros(0, dtype=np.uint64)
+            stored_clusters = []
+
+        stored_count = len(stored_signatures)
+        all_signatures = np.concatenate((stored_signatures, signatures)).astype(
+            np.uint64
+        )
+        parents = np.arange(len(all_signatures))
+
+        for left, right in self._candidate_pairs(all_signatures, stored_count):
+            self._union(parents, left, right)
+
+        signed = _to_signed(signatures)
+        roots = [self._find(parents, index) for index in range(len(all_signatures))]
+        root_clusters: dict[int, int] = {}
+        for index in range(stored_count):
+            root = roots[index]
+            root_clusters[root] = min(
+                root_clusters.get(root, stored_clusters[index]), stored_clusters[index]
+            )
+        for index in range(len(signatures)):
+            if signed[index]:
+                root_clusters.setdefault(roots[stored_count + index], signed[index])
+
+        return [
+            root_clusters.get(roots[stored_count + index])
+            for index in range(len(signatures))
+        ]
+
+    def _candidate_pairs(self, signatures: np.ndarray, first_new: int):
+        """
+        Yields index pairs of non-empty signatures sharing a band and within `max_distance`.
+        Stored articles were clustered when they were saved, so only pairs involving
+        a new article (index >= `first_new`) are compared.
+        """
+        indexes = np.flatnonzero(signatures)
+        mask = np.uint64((1 << self.band_bits) - 1)
+
+        for band in range(self.bands):
+            keys = (signatures[indexes] >> np.uint64(band * self.band_bits)) & mask
+            order = np.argsort(keys, kind="stable")
+            bounds = np.flatnonzero(np.diff(keys[order])) + 1
+            for bucket in np.split(indexes[order], bounds):
+                new = bucket[bucket >= first_new]
+                if len(bucket) < 2 or not len(new):
+                    continue
+                distances = hamming_distance(
+                    signatures[new][:, None], signatures[bucket][None, :]
+                )
+                for left, right in zip(*np.nonzero(distances <= self.max_distance)):
+                    if new[left] != bucket[right]:
+                        yield int(new[left]), int(bucket[right])
+
+    async def _load_recent(self, db: AsyncSession) -> tuple[np.ndarray, list[int]]:
+        since = datetime.now(timezone.utc) - timedelta(days=self.window_days)
+        rows = (
+            await db.execute(
+                select(ArticleDB.simhash, ArticleDB.cluster_id).where(
+                    ArticleDB.published_at >= since,
+                    ArticleDB.simhash.is_not(None),
+                    ArticleDB.cluster_id.is_not(None),
+                )
+            )
+        ).all()
+
+        signatures = np.array([row[0] for row in rows], dtype=np.int64).view(np.uint64)
+        return signatures, [row[1] for row in rows]
+
+    @staticmethod
+    def _find(parents: np.ndarray, index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return int(index)
+
+    def _union(self, parents: np.ndarray, left: int, right: int) -> None:
+        left_root, right_root = self._find(parents, left), self._find(parents, right)
+        if left_root != right_root:
+            parents[max(left_root, right_root)] = min(left_root, right_root)
+
+
+dedup_service = DedupService()
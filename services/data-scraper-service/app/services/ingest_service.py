@@ -0,0 +1,56 @@
+from app.services.article_service import scraper_service
+from app.services.db_service import db_service
+from app.services.dedup_service import dedup_service
+from app.scrapers.feed_cache import feed_cache
+from app.scrapers.seen_filter import seen_filter
+from app.scrapers.watermarks import watermark_store
+from app.schemas.articles import ArticleCreate
+from app.utils.url import canonicalize_url
+
+from collections.abc import Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class IngestService:
+    async def ingest_all_articles(
+        self,
+        db: AsyncSession,
+        limit_per_source: int | None = None,
+        on_feed_done: Callable[
+            [str, str | None, list[ArticleCreate] | BaseException], None
+        ]
+        | None = None,
+    ) -> dict:
+        """
+        Incrementally scrapes all sources, clusters near-duplicates and saves new articles.
+        Feed cache and watermarks are committed only once the articles were stored.
+
+        :param db: database session
+        :type db: AsyncSession
+        :param limit_per_source: max number of articles taken from a single feed
+        :type limit_per_source: int | None
+        :param on_feed_done: progress callback, see `ScraperService.fetch_all_articles`
+        :type on_feed_done: Callable | None
+        :return: results of saving articles to db
+        :rtype: dict
+        """
+        if not seen_filter.loaded:
+            await seen_filter.rebuild(db)
+
+        articles = await scraper_service.fetch_all_articles(
+            limit_per_source, incremental=True, on_feed_done=on_feed_done
+        )
+        try:
+            await dedup_service.assign_clusters(articles, db)
+            db_result = await db_service.save_articles(articles, db)
+        except Exception:
+            feed_cache.discard()
+            watermark_store.discard()
+            raise
+        feed_cache.commit()
+        watermark_store.commit()
+        seen_filter.update(canonicalize_url(article.url) for article in articles)
+        return db_result
+
+
+ingest_service = IngestService()
@@ -0,0 +1,161 @@
+from app.core import db as database
+from app.core.http import http_clients
+from app.schemas.articles import ArticleCreate
+from app.schemas.jobs import JobStatus, JobStatusResponse, SourceProgress
+from app.services.article_service import scraper_service
+from app.services.ingest_service import ingest_service
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.pool import NullPool
+import asyncio
+import os
+import threading
+import uuid
+
+load_dotenv()
+
+# scrapes share the feed cache, watermarks and seen filter, so by default they run one by one
+SCRAPE_JOB_WORKERS = int(os.getenv("SCRAPE_JOB_WORKERS", "1"))
+JOB_TTL_SECONDS = int(os.getenv("SCRAPE_JOB_TTL_SECONDS", "3600"))
+
+
+class JobService:
+    """
+    Runs scrape-and-save jobs in a worker pool, off the API event loop.
+
+    Every job runs its own event loop in a worker thread and reports per-source progress
+    as feeds finish. Finished jobs are kept in memory for `JOB_TTL_SECONDS`.
+    """
+
+    def __init__(self, max_workers: int = SCRAPE_JOB_WORKERS) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scrape-job"
+        )
+        self.lock = threading.Lock()
+        self.jobs: dict[str, dict] = {}
+
+    def submit(self, limit_per_source: int | None = None) -> str:
+        """
+        Queues a scrape of all sources
+
+        :param limit_per_source: max number of articles taken from a single feed
+        :type limit_per_source: int | None
+        :return: job id
+        :rtype: str
+        """
+        self._cleanup_expired()
+
+        job_id = str(uuid.uuid4())
+        sources: dict[str, SourceProgress] = {}
+        for source_name, _ in scraper_service.feeds():
+            sources.setdefault(source_name, SourceProgress()).feeds_total += 1
+
+        with self.lock:
+            self.jobs[job_id] = {
+                "status": JobStatus.QUEUED,
+                "created_at": datetime.now(),
+                "completed_at": None,
+                "sources": sources,
+                "result": None,
+                "error": None,
+            }
+            self.jobs[job_id]["future"] = self.executor.submit(
+                self._run, job_id, limit_per_source
+            )
+        return job_id
+
+    async def wait(self, job_id: str) -> dict:
+        """
+        Waits for the job without blocking the event loop, raises the job error if it failed
+        """
+        return await asyncio.wrap_future(self.jobs[job_id]["future"])
+
+    def get(self, job_id: str) -> JobStatusResponse:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return JobStatusResponse(
+                    job_id=job_id,
+                    status=JobStatus.NOT_FOUND,
+                    error=f"Job with id {job_id} does not exist or has expired.",
+                )
+            return JobStatusResponse(
+                job_id=job_id,
+                status=job["status"],
+                created_at=job["created_at"],
+                completed_at=job["completed_at"],
+                sources={
+                    source_name: progress.model_copy(deep=True)
+                    for source_name, progress in job["sources"].items()
+                },
+                result=job["result"],
+                error=job["error"],
+            )
+
+    def _run(self, job_id: str, limit_per_source: int | None) -> dict:
+        self._update(job_id, status=JobStatus.PROCESSING)
+
+        def on_feed_done(
+            source_name: str,
+            category: str | None,
+            result: list[ArticleCreate] | BaseException,
+        ) -> None:
+            with self.lock:
+                progress = self.jobs[job_id]["sources"].setdefault(
+                    source_name, SourceProgress()
+                )
+                progress.feeds_done += 1
+                if isinstance(result, BaseException):
+                    progress.errors.append(f"{category or source_name}: {result}")
+                else:
+                    progress.articles += len(result)
+
+        try:
+            result = asyncio.run(self._ingest(limit_per_source, on_feed_done))
+        except Exception as e:
+            self._update(job_id, status=JobStatus.FAILED, error=str(e))
+            raise
+
+        self._update(job_id, status=JobStatus.COMPLETED, result=result)
+        return result
+
+    @staticmethod
+    async def _ingest(limit_per_source: int | None, on_feed_done) -> dict:
+        # connections of the shared engine and HTTP client belong to the API event loop,
+        # so every job (running its own loop) gets short-lived ones closed at its end
+        engine = database.create_engine(poolclass=NullPool)
+        try:
+            async with (
+                http_clients.async_client_scope(),
+                async_sessionmaker(engine, expire_on_commit=False)() as db,
+            ):
+                return await ingest_service.ingest_all_articles(
+                    db, limit_per_source, on_feed_done
+                )
+        finally:
+            await engine.dispose()
+
+    def _update(self, job_id: str, **values) -> None:
+        with self.lock:
+            job = self.jobs[job_id]
+            job.update(values)
+            if values.get("status") in (JobStatus.COMPLETED, JobStatus.FAILED):
+                job["completed_at"] = datetime.now()
+
+    def _cleanup_expired(self) -> None:
+        now = datetime.now()
+        with self.lock:
+            expired = [
+                job_id
+                for job_id, job in self.jobs.items()
+                if job["completed_at"]
+                and (now - job["completed_at"]).total_seconds() > JOB_TTL_SECONDS
+            ]
+            for job_id in expired:
+                self.jobs.pop(job_id, None)
+
+
+job_service = JobService()
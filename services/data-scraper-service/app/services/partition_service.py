@@ -0,0 +1,80 @@
+from app.core import db as database
+
+from datetime import date
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import os
+
+load_dotenv()
+
+# monthly partitions of `article` kept created ahead of the current month
+PARTITION_MONTHS_AHEAD = int(os.getenv("DB_PARTITION_MONTHS_AHEAD", "3"))
+# seconds between partition maintenance runs, 0 disables the task
+PARTITION_CHECK_INTERVAL = float(os.getenv("DB_PARTITION_CHECK_INTERVAL", "86400"))
+
+
+def add_months(day: date, months: int) -> date:
+    """
+    Returns first day of the month `months` after the month of `day`
+    """
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+class PartitionService:
+    """
+    Maintenance of the month-partitioned `article` table (Postgres only). Partitions of
+    the upcoming months are created before any article can land in them, so inserts
+    never fall back to the default partition.
+    """
+
+    def __init__(self, months_ahead: int = PARTITION_MONTHS_AHEAD) -> None:
+        self.months_ahead = months_ahead
+
+    async def create_partitions(
+        self, db: AsyncSession, today: date | None = None
+    ) -> int:
+        """
+        Creates missing partitions from the current month up to `months_ahead` months
+
+        :param db: database session
+        :type db: AsyncSession
+        :param today: reference day, `date.today()` if not given
+        :type today: date | None
+        :return: number of created partitions
+        :rtype: int
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return 0
+
+        today = today or date.today()
+        result = await db.execute(
+            text("SELECT create_article_partitions(:start, :end)"),
+            {
+                "start": today.replace(day=1),
+                "end": add_months(today, self.months_ahead + 1),
+            },
+        )
+        await db.commit()
+        return result.scalar_one()
+
+    async def maintain(self, interval: float = PARTITION_CHECK_INTERVAL) -> None:
+        """
+        Creates upcoming partitions every `interval` seconds, runs until cancelled
+        """
+        if interval <= 0:
+            return
+        while True:
+            try:
+                async with database.Session() as db:
+                    created = await self.create_partitions(db)
+                if created:
+                    print(f"Created {created} article partitions")
+            except Exception as e:
+                print(f"Article partitions not created - error: {e}")
+            await asyncio.sleep(interval)
+
+
+partition_service = PartitionService()
@@ -0,0 +1,59 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+TRACKING_PARAM_PREFIXES = ("utm_", "at_", "mc_")
+TRACKING_PARAMS = {
+    "cmpid",
+    "emc",
+    "fbclid",
+    "gclid",
+    "ito",
+    "ocid",
+    "partner",
+    "ref",
+    "referrer",
+    "smid",
+    "smtyp",
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalizes article URL so the same story reached through different feeds gets the same
+    identity - lowercases scheme and host, drops default port, fragment and tracking
+    query params and sorts the remaining params
+
+    :param url: scraped article URL
+    :type url: str
+    :return: canonical URL
+    :rtype: str
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    try:
+        port = parts.port
+    except ValueError:
+        # malformed or out of range port, keep the netloc as scraped
+        netloc = parts.netloc.lower()
+    else:
+        netloc = (parts.hostname or "").lower()
+        if port and port != DEFAULT_PORTS.get(scheme):
+            netloc += f":{port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking_param(key)
+        )
+    )
+
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PARAM_PREFIXES)
@@ -0,0 +1,168 @@
+from app.scrapers.registry import scraper_registry
+
+from pathlib import Path
+import asyncio
+import hashlib
+import httpx
+import json
+import random
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+INDEX_FILE = "index.json"
+# response headers worth replaying, the rest (dates, cookies, CDN ids) only adds noise
+RECORDED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def fixture_url(url: str) -> str:
+    """
+    Returns URL under which a response is recorded, values of API key parameters are dropped
+    """
+    parsed = httpx.URL(url)
+    params = [
+        (name, "" if "key" in name.lower() else value)
+        for name, value in parsed.params.multi_items()
+    ]
+    return str(parsed.copy_with(params=params))
+
+
+def feed_urls() -> dict[str, str]:
+    """
+    Maps "source/category" name of every configured feed to its URL
+    """
+    return {
+        f"{source_name}/{category}" if category else source_name: scraper._build_url(
+            category
+        )
+        for source_name, scraper, category in scraper_registry.jobs
+    }
+
+
+class FeedRecorder:
+    """
+    Captures live responses of all configured feeds into a fixtures directory: raw bodies
+    stored as they were received plus `index.json` with status and headers of each one
+    """
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR) -> None:
+        self.fixtures_dir = Path(fixtures_dir)
+
+    async def record(self, client: httpx.AsyncClient | None = None) -> dict:
+        """
+        Fetches every feed once and writes the fixtures
+
+        :param client: client used for fetching, plain `httpx.AsyncClient` if not given
+        :type client: httpx.AsyncClient | None
+        :return: fixtures index
+        :rtype: dict
+        """
+        owns_client = client is None
+        client = client or httpx.AsyncClient(follow_redirects=True, timeout=30)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+
+        feeds = feed_urls()
+        try:
+            responses = await asyncio.gather(
+                *(client.get(url) for url in feeds.values()), return_exceptions=True
+            )
+        finally:
+            if owns_client:
+                await client.aclose()
+
+        index = {}
+        for (feed, url), response in zip(feeds.items(), responses):
+            if isinstance(response, Exception):
+                print(f"Feed '{feed}' not recorded - error: {response}")
+                continue
+
+            url = fixture_url(url)
+            body_file = hashlib.sha1(url.encode()).hexdigest()[:16] + ".body"
+            (self.fixtures_dir / body_file).write_bytes(response.content)
+            index[url] = {
+                "feed": feed,
+                "status_code": response.status_code,
+                "headers": {
+                    name: response.headers[name]
+                    for name in RECORDED_HEADERS
+                    if name in response.headers
+                },
+                "body": body_file,
+            }
+
+        (self.fixtures_dir / INDEX_FILE).write_text(
+            json.dumps(index, indent=2, sort_keys=True)
+        )
+        return index
+
+
+class _DelayedStream(httpx.AsyncByteStream):
+    """
+    Replayed body sent in chunks, like a body arriving over the network
+    """
+
+    def __init__(self, body: bytes, chunk_size: int) -> None:
+        self.body = body
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start : start + self.chunk_size]
+            await asyncio.sleep(0)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Local stand-in for the live feed hosts, serves recorded responses with configurable
+    latency and jitter. Unknown URLs get 404.
+
+    Time of the first request of every URL is kept in `started`, so callers can measure
+    per-feed durations.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Path = FIXTURES_DIR,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        chunk_size: int = 16 * 1024,
+        seed: int = 0,
+    ) -> None:
+        self.fixtures_dir = Path(fixtures_dir)
+        self.index: dict = json.loads((self.fixtures_dir / INDEX_FILE).read_text())
+        self.bodies = {
+            url: (self.fixtures_dir / fixture["body"]).read_bytes()
+            for url, fixture in self.index.items()
+        }
+        self.latency = latency
+        self.jitter = jitter
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+        self.started: dict[str, float] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = fixture_url(str(request.url))
+        self.started.setdefault(url, asyncio.get_running_loop().time())
+
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        fixture = self.index.get(url)
+        if fixture is None:
+            return httpx.Response(404, request=request)
+        return httpx.Response(
+            fixture["status_code"],
+            headers=fixture["headers"],
+            stream=_DelayedStream(self.bodies[url], self.chunk_size),
+            request=request,
+        )
+
+    def reset(self) -> None:
+        self.started.clear()
+
+
+if __name__ == "__main__":
+    recorded = asyncio.run(FeedRecorder().record())
+    print(f"Recorded {len(recorded)} feeds into {FIXTURES_DIR}")
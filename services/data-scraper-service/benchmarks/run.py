@@ -0,0 +1,189 @@
+from app.core.http import (
+    HTTP_MAX_PER_HOST,
+    HostLimitedTransport,
+    RateLimitedTransport,
+    http_clients,
+    rate_limiter,
+)
+from app.services.article_service import scraper_service
+from benchmarks.replay import FIXTURES_DIR, ReplayTransport, feed_urls, fixture_url
+
+from datetime import datetime
+from pathlib import Path
+import argparse
+import asyncio
+import httpx
+import json
+import math
+import platform
+import resource
+import sys
+import time
+
+RESULTS_DIR = Path(__file__).parent / "results"
+# relative change of a metric reported as regression by `compare`
+REGRESSION_THRESHOLD = 0.10
+# metrics where a higher value is better, for the rest lower is better
+HIGHER_IS_BETTER = {"articles_per_second"}
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+async def run_once(transport: ReplayTransport) -> tuple[int, float, dict[str, float]]:
+    """
+    Runs `fetch_all_articles` end-to-end against the replay transport
+
+    :return: number of articles, wall time and duration of every finished feed
+    :rtype: tuple[int, float, dict[str, float]]
+    """
+    transport.reset()
+    loop = asyncio.get_running_loop()
+    # shared client of this loop, picked up by the fetch engine instead of a live one
+    http_clients.async_client = httpx.AsyncClient(
+        transport=HostLimitedTransport(
+            RateLimitedTransport(transport, rate_limiter), HTTP_MAX_PER_HOST
+        ),
+        **http_clients._client_options(),
+    )
+    http_clients.async_client_loop = loop
+    urls = {feed: fixture_url(url) for feed, url in feed_urls().items()}
+    durations: dict[str, float] = {}
+
+    def on_feed_done(source_name: str, category: str | None, result) -> None:
+        feed = f"{source_name}/{category}" if category else source_name
+        started = transport.started.get(urls.get(feed))
+        if started is not None and not isinstance(result, BaseException):
+            durations[feed] = loop.time() - started
+
+    started = time.perf_counter()
+    articles = await scraper_service.fetch_all_articles(on_feed_done=on_feed_done)
+    wall = time.perf_counter() - started
+
+    await http_clients.aclose()
+    return len(articles), wall, durations
+
+
+def run_benchmark(
+    fixtures_dir: Path = FIXTURES_DIR,
+    latency: float = 0.05,
+    jitter: float = 0.02,
+    repeat: int = 5,
+) -> dict:
+    """
+    Benchmarks scraping of all recorded feeds
+
+    :param fixtures_dir: directory with fixtures written by `FeedRecorder`
+    :type fixtures_dir: Path
+    :param latency: mean delay of every replayed response in seconds
+    :type latency: float
+    :param jitter: max random deviation from `latency` in seconds
+    :type jitter: float
+    :param repeat: number of measured runs
+    :type repeat: int
+    :return: results in the format written by `save_results`
+    :rtype: dict
+    """
+    transport = ReplayTransport(fixtures_dir, latency, jitter)
+    articles, walls = 0, []
+    feed_samples: dict[str, list[float]] = {}
+
+    for _ in range(repeat):
+        count, wall, durations = asyncio.run(run_once(transport))
+        articles += count
+        walls.append(wall)
+        for feed, duration in durations.items():
+            feed_samples.setdefault(feed, []).append(duration)
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "latency": latency,
+            "jitter": jitter,
+            "repeat": repeat,
+            "feeds_recorded": len(transport.index),
+        },
+        "summary": {
+            "articles_per_run": articles // repeat,
+            "articles_per_second": round(articles / sum(walls), 1),
+            "wall_p50_ms": round(percentile(walls, 0.5) * 1000, 1),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        },
+        "feeds": {
+            feed: {
+                "p50_ms": round(percentile(samples, 0.5) * 1000, 1),
+                "p99_ms": round(percentile(samples, 0.99) * 1000, 1),
+            }
+            for feed, samples in sorted(feed_samples.items())
+        },
+    }
+
+
+def save_results(results: dict, path: Path) -> None:
+    """
+    Writes results as stable, sorted JSON so two runs diff line by line in review
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    """
+    Lists summary and per-feed metrics that got worse than baseline by more than
+    `REGRESSION_THRESHOLD`
+    """
+    pairs = [
+        (name, baseline["summary"].get(name), value)
+        for name, value in current["summary"].items()
+    ]
+    for feed, metrics in current["feeds"].items():
+        for name, value in metrics.items():
+            pairs.append(
+                (f"{feed} {name}", baseline["feeds"].get(feed, {}).get(name), value)
+            )
+
+    regressions = []
+    for name, before, after in pairs:
+        if not before:
+            continue
+        change = (after - before) / before
+        if name in HIGHER_IS_BETTER:
+            change = -change
+        if change > REGRESSION_THRESHOLD:
+            regressions.append(f"{name}: {before} -> {after} ({change:+.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scraper throughput benchmark")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.fixtures, args.latency, args.jitter, args.repeat)
+    save_results(results, args.output)
+    print(json.dumps(results["summary"], indent=2))
+
+    if args.baseline:
+        regressions = compare(json.loads(args.baseline.read_text()), results)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,15 @@
+import asyncio
 import os
 import sys
 
+import httpx
 import pytest
+from app.core.http import http_clients
 from app.models.articles import ArticleDB
-from sqlalchemy import StaticPool, create_engine
+from sqlalchemy import StaticPool
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 # mock database URL for testing
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
@@ -18,28 +21,59 @@ def compile_jsonb_sqlite(type_, compiler, **kw):
     return "JSON"
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def engine():
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    ArticleDB.metadata.create_all(bind=engine)
-    return engine
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    async def create_tables():
+        async with engine.begin() as connection:
+            await connection.run_sync(ArticleDB.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
 
 
 @pytest.fixture
 def db_session(engine):
-    connection = engine.connect()
+    session = AsyncSession(engine, expire_on_commit=False)
 
-    transaction = connection.begin()
+    yield session
 
-    SessionLocal = sessionmaker(bind=connection)
-    session = SessionLocal()
+    asyncio.run(session.close())
 
-    yield session
 
-    session.close()
-    transaction.rollback()
-    connection.close()
+class MockHttp:
+    """
+    Routes requests of the shared HTTP client to canned responses
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def add(self, url: str | None = None, error: Exception | None = None, **response):
+        """
+        Registers response for given URL (None matches any URL), `error` is raised instead if given
+        """
+        self.routes[url] = error or {"status_code": 200, **response}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        route = self.routes.get(str(request.url), self.routes.get(None))
+        if route is None:
+            return httpx.Response(404)
+        if isinstance(route, Exception):
+            raise route
+        return httpx.Response(**route)
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    mock = MockHttp()
+    monkeypatch.setattr(
+        http_clients,
+        "client",
+        httpx.Client(transport=httpx.MockTransport(mock.handler)),
+    )
+    return mock
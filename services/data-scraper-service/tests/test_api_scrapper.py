@@ -1,5 +1,4 @@
 import pytest
-import requests_mock
 from app.scrapers.api.api_scraper import BBCScraper, NYTScraper
 
 
@@ -15,7 +14,7 @@ def bbc_scraper():
 
 
 # --- UNIT TESTS ---
-def test_nyt_scraper_collect_data_success(nyt_scraper):
+def test_nyt_scraper_collect_data_success(nyt_scraper, mock_http):
     mock_response = {
         "status": "OK",
         "results": [
@@ -30,9 +29,8 @@ def test_nyt_scraper_collect_data_success(nyt_scraper):
         ],
     }
 
-    with requests_mock.Mocker() as m:
-        m.get("http://test-nyt.com", json=mock_response)
-        articles = nyt_scraper.collect_data()
+    mock_http.add("http://test-nyt.com", json=mock_response)
+    articles = nyt_scraper.collect_data()
 
     assert len(articles) == 1
     assert (
@@ -42,7 +40,7 @@ def test_nyt_scraper_collect_data_success(nyt_scraper):
     assert "Technology" in articles[0].categories
 
 
-def test_bbc_scraper_collect_data_success(bbc_scraper):
+def test_bbc_scraper_collect_data_success(bbc_scraper, mock_http):
     mock_response = {
         "news": [
             {
@@ -53,9 +51,8 @@ def test_bbc_scraper_collect_data_success(bbc_scraper):
         ]
     }
 
-    with requests_mock.Mocker() as m:
-        m.get("http://test-bbc.com/Economy", json=mock_response)
-        articles = bbc_scraper.collect_data(category="Economy")
+    mock_http.add("http://test-bbc.com/Economy", json=mock_response)
+    articles = bbc_scraper.collect_data(category="Economy")
 
     assert len(articles) == 1
     assert (
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+from app.schemas.articles import ArticleCreate
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def rows():
+    return [
+        {
+            "title": "  Kacper Siemionek wygrywa konkurs  ",
+            "description": "Kacper Siemionek zjadł najwięcej pierogów na świecie",
+            "url": "http://pudelek.pl/kacper",
+            "published_at": datetime(2026, 1, 1, 20, 20),
+            "source": "Pudelek",
+            "categories": ["Plotki"],
+        },
+        {
+            "title": "Krót",
+            "description": "Roxie Węgiel ma za krótki tytuł",
+            "url": "http://pudelek.pl/roxie",
+            "source": "Pudelek",
+        },
+        {
+            "title": "Roxie Węgiel nagrywa nową płytę",
+            "description": "Roxie Węgiel ogłosiła premierę płyty",
+            "url": "not a url",
+            "source": "Pudelek",
+        },
+        {
+            "title": "Roxie Węgiel nagrywa nową płytę",
+            "description": "Roxie Węgiel ogłosiła premierę płyty",
+            "url": "https://pudelek.pl/roxie-plyta",
+            "source": "Pudelek",
+        },
+    ]
+
+
+# --- UNIT TESTS ---
+def test_create_batch_reports_rejected_indices(rows):
+    articles, rejected = ArticleCreate.create_batch(rows)
+
+    assert rejected == [1, 2]
+    assert [article.url for article in articles] == [
+        "http://pudelek.pl/kacper",
+        "https://pudelek.pl/roxie-plyta",
+    ]
+    assert articles[0].title == "Kacper Siemionek wygrywa konkurs"
+
+
+def test_create_batch_all_valid(rows):
+    articles, rejected = ArticleCreate.create_batch([rows[0], rows[3]])
+
+    assert rejected == []
+    assert len(articles) == 2
+
+
+def test_article_fields_are_db_ready_values(rows):
+    [article], _ = ArticleCreate.create_batch([rows[0]])
+
+    assert isinstance(article.url, str)
+    assert dict(article)["url"] == "http://pudelek.pl/kacper"
+    assert article.model_dump_json().startswith('{"title":"Kacper Siemionek')
@@ -1,6 +1,10 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
+import asyncio
 
+import httpx
 import pytest
+from app.core.http import RateLimiter
+from app.scrapers.registry import ScraperRegistry
 from app.services.article_service import ScraperService
 
 MOCK_CONTEXT = {
@@ -15,6 +19,12 @@ MOCK_CONTEXT = {
 }
 
 
+class MockArticle:
+    def __init__(self, url: str, **kwargs):
+        self.url = url
+        self.__dict__.update(kwargs)
+
+
 # --- FIXTURES ---
 @pytest.fixture
 def service():
@@ -23,57 +33,141 @@ def service():
     return ScraperService()
 
 
-# --- UNIT TESTS ---
-@patch("app.services.article_service.CONTEXT", MOCK_CONTEXT)
-@patch("app.services.article_service.API_SCRAPERS")
-def test_fetch_articles_success(mock_scrapers, service):
+@pytest.fixture
+def mock_instance(monkeypatch):
     mock_scraper_class = MagicMock()
-    mock_scrapers.__contains__.return_value = True
-    mock_scrapers.__getitem__.return_value = mock_scraper_class
+    registry = ScraperRegistry(
+        scrapers={"rss": mock_scraper_class}, limiter=RateLimiter()
+    )
+    registry.load(MOCK_CONTEXT)
+    monkeypatch.setattr("app.services.article_service.scraper_registry", registry)
+    return mock_scraper_class.return_value
 
-    mock_instance = mock_scraper_class.return_value
-    mock_instance.collect_data.return_value = [{"title": "Art 1"}]
 
-    result = service.fetch_articles("test_source", category="Technology")
+# --- UNIT TESTS ---
+def test_fetch_articles_success(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(
+        return_value=[MockArticle("http://kacpersiemionek.com/1", title="Art 1")]
+    )
+
+    result = asyncio.run(service.fetch_articles("test_source", category="Technology"))
 
     assert len(result) == 1
-    assert result[0]["title"] == "Art 1"
-    mock_instance.collect_data.assert_called_once_with("Technology")
+    assert result[0].title == "Art 1"
+    client, category = mock_instance.collect_data_async.await_args.args
+    assert isinstance(client, httpx.AsyncClient)
+    assert category == "Technology"
+    mock_instance.collect_data.assert_not_called()
 
 
-@patch("app.services.article_service.CONTEXT", MOCK_CONTEXT)
-def test_fetch_articles_invalid_source(service):
+def test_fetch_articles_invalid_source(mock_instance, service):
     with pytest.raises(ValueError) as exc:
-        service.fetch_articles("non_existent")
+        asyncio.run(service.fetch_articles("non_existent"))
     assert "not found" in str(exc.value)
 
 
-@patch("app.services.article_service.CONTEXT", MOCK_CONTEXT)
-@patch("app.services.article_service.API_SCRAPERS")
-def test_fetch_all_articles_aggregation(mock_scrapers, service):
-    mock_scraper_class = MagicMock()
-    mock_scrapers.__contains__.return_value = True
-    mock_scrapers.__getitem__.return_value = mock_scraper_class
-    mock_instance = mock_scraper_class.return_value
+def test_fetch_articles_raises_failed_category(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(
+        side_effect=Exception("Kacper Siemionek zgubił kabel")
+    )
 
-    mock_instance.collect_data.return_value = [{"title": "Test test test 123"}]
+    with pytest.raises(Exception, match="Kacper Siemionek zgubił kabel"):
+        asyncio.run(service.fetch_articles("test_source"))
 
-    result = service.fetch_all_articles()
+
+def test_fetch_all_articles_aggregation(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(
+        return_value=[
+            MockArticle("http://kacpersiemionek.com/1", title="Test test test 123")
+        ]
+    )
+
+    result = asyncio.run(service.fetch_all_articles())
 
     assert len(result) == 1
-    assert result[0]["title"] == "Test test test 123"
+    assert result[0].title == "Test test test 123"
 
 
-@patch("app.services.article_service.CONTEXT", MOCK_CONTEXT)
-@patch("app.services.article_service.API_SCRAPERS")
-def test_fetch_all_articles_with_limit(mock_scrapers, service):
-    mock_scraper_class = MagicMock()
-    mock_scrapers.__contains__.return_value = True
-    mock_scrapers.__getitem__.return_value = mock_scraper_class
-    mock_instance = mock_scraper_class.return_value
+def test_fetch_all_articles_with_limit(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(
+        return_value=[
+            MockArticle(f"http://kacpersiemionek.com/{i}", t=i) for i in range(5)
+        ]
+    )
+
+    result = asyncio.run(service.fetch_all_articles(limit_per_source=2))
+
+    assert len(result) == 2
 
-    mock_instance.collect_data.return_value = [{"t": i} for i in range(5)]
 
-    result = service.fetch_all_articles(limit_per_source=2)
+def test_incremental_limit_leaves_rest_of_feed_for_next_run(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(
+        return_value=[
+            MockArticle(f"http://kacpersiemionek.com/{i}", t=i) for i in range(5)
+        ]
+    )
+
+    asyncio.run(service.fetch_all_articles(limit_per_source=5, incremental=True))
+    mock_instance.discard_staged.assert_not_called()
+
+    result = asyncio.run(
+        service.fetch_all_articles(limit_per_source=2, incremental=True)
+    )
 
     assert len(result) == 2
+    mock_instance.discard_staged.assert_called_with("Technology")
+
+
+def test_fetch_all_articles_source_failure(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(side_effect=Exception("Timeout"))
+
+    result = asyncio.run(service.fetch_all_articles())
+
+    assert result == []
+
+
+def test_stream_all_articles_with_limit(mock_instance, service):
+    mock_instance.collect_data_async = AsyncMock(
+        return_value=[
+            MockArticle(f"http://kacpersiemionek.com/{i}", t=i) for i in range(5)
+        ]
+    )
+
+    async def collect():
+        return [article async for article in service.stream_all_articles(2)]
+
+    assert [article.t for article in asyncio.run(collect())] == [0, 1]
+
+
+def test_fetch_articles_drops_urls_repeated_across_categories(monkeypatch, service):
+    mock_scraper_class = MagicMock()
+    registry = ScraperRegistry(
+        scrapers={"rss": mock_scraper_class}, limiter=RateLimiter()
+    )
+    registry.load(
+        {
+            "pudelek": {
+                "type": "rss",
+                "title": "Pudelek",
+                "endpoint": {
+                    "base_url": "http://pudelek.pl/%s",
+                    "categories": ["plotki", "gwiazdy"],
+                },
+            }
+        }
+    )
+    monkeypatch.setattr("app.services.article_service.scraper_registry", registry)
+    mock_scraper_class.return_value.collect_data_async = AsyncMock(
+        side_effect=lambda client, category: [
+            MockArticle("http://pudelek.pl/roxie", category=category),
+            MockArticle(f"http://pudelek.pl/{category}", category=category),
+        ]
+    )
+
+    result = asyncio.run(service.fetch_articles("pudelek"))
+
+    assert [article.url for article in result] == [
+        "http://pudelek.pl/roxie",
+        "http://pudelek.pl/plotki",
+        "http://pudelek.pl/gwiazdy",
+    ]
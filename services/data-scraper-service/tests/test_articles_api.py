@@ -1,7 +1,8 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 import pytest
 from app.core.db import get_db
 from app.main import app
+from app.schemas.articles import ArticleCreate
 from fastapi.testclient import TestClient
 
 client = TestClient(app)
@@ -45,7 +46,9 @@ def test_get_all_articles_api(override_db):
 
 
 def test_get_articles_by_source_and_category(override_db):
-    with patch("app.api.v1.articles.scraper_service.fetch_articles") as mock_fetch:
+    with patch(
+        "app.api.v1.articles.scraper_service.fetch_articles", new_callable=AsyncMock
+    ) as mock_fetch:
         full_article = {
             "title": "Filtered Article",
             "description": "Siemionek Kacper",
@@ -60,4 +63,29 @@ def test_get_articles_by_source_and_category(override_db):
 
         assert response.status_code == 200
         assert response.json()[0]["title"] == "Filtered Article"
-        mock_fetch.assert_called_once_with("RSS", "Technology")
+        mock_fetch.assert_awaited_once_with("RSS", "Technology")
+
+
+def test_stream_all_articles_api():
+    articles = [
+        ArticleCreate(
+            title=f"Roxie Węgiel w Świebodzinie, część {number}",
+            description="Kacper Siemionek komentuje stylizację",
+            url=f"http://pudelek.pl/roxie-{number}",
+            source="Pudelek",
+        )
+        for number in range(2)
+    ]
+
+    async def stream(limit=None):
+        for article in articles:
+            yield article
+
+    with patch("app.api.v1.articles.scraper_service.stream_all_articles", stream):
+        response = client.get("/articles/all/stream")
+
+    lines = response.text.splitlines()
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(lines) == 2
+    assert ArticleCreate.model_validate_json(lines[1]).url == articles[1].url
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from app.scrapers.fetch_engine import fetch_engine
+from app.scrapers.source_health import HealthTracker
+from benchmarks.replay import FeedRecorder, ReplayTransport, fixture_url
+from benchmarks.run import compare, run_benchmark, save_results
+
+SAMPLE_RSS_XML = """
+<rss version="2.0">
+    <channel>
+        <item>
+            <title>Kacper Siemionek otwiera pierogarnię w Świebodzinie</title>
+            <link>http://pudelek.pl/kacper-pierogi</link>
+            <description>Fani ustawiają się w kolejce od piątej rano. [ZOBACZ ZDJĘCIA]</description>
+            <pubDate>Sat, 01 Jan 2026 20:20:00 GMT</pubDate>
+        </item>
+    </channel>
+</rss>
+"""
+
+
+def live_feeds(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith((".xml", "/feed")):
+        return httpx.Response(
+            200,
+            content=SAMPLE_RSS_XML.encode("utf-8"),
+            headers={"content-type": "application/rss+xml", "set-cookie": "x=1"},
+        )
+    return httpx.Response(404)
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(live_feeds))
+    asyncio.run(FeedRecorder(tmp_path).record(client))
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def fresh_health(monkeypatch):
+    monkeypatch.setattr(fetch_engine, "health", HealthTracker())
+
+
+# --- UNIT TESTS ---
+def test_fixture_url_drops_api_keys():
+    assert (
+        fixture_url("https://api.nytimes.com/svc/world.json?api-key=tajne&page=2")
+        == "https://api.nytimes.com/svc/world.json?api-key=&page=2"
+    )
+
+
+def test_recorder_keeps_body_status_and_relevant_headers(fixtures_dir):
+    index = json.loads((fixtures_dir / "index.json").read_text())
+    fixture = index["https://www.tvn24.pl/najnowsze.xml"]
+
+    assert fixture["feed"] == "TVN24/najnowsze"
+    assert fixture["status_code"] == 200
+    assert fixture["headers"] == {"content-type": "application/rss+xml"}
+    assert (fixtures_dir / fixture["body"]).read_bytes() == SAMPLE_RSS_XML.encode()
+
+
+def test_replay_transport_serves_recorded_responses(fixtures_dir):
+    transport = ReplayTransport(fixtures_dir, latency=0.01, chunk_size=64)
+
+    async def fetch(url):
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get(url)
+
+    response = asyncio.run(fetch("https://www.tvn24.pl/najnowsze.xml"))
+    missing = asyncio.run(fetch("https://kacpersiemionek.com/rss.xml"))
+
+    assert response.status_code == 200
+    assert response.content == SAMPLE_RSS_XML.encode()
+    assert missing.status_code == 404
+    assert "https://www.tvn24.pl/najnowsze.xml" in transport.started
+
+
+def test_run_benchmark_reports_throughput_and_feed_latencies(fixtures_dir, tmp_path):
+    results = run_benchmark(fixtures_dir, latency=0.0, jitter=0.0, repeat=2)
+
+    assert results["summary"]["articles_per_run"] > 0
+    assert results["summary"]["articles_per_second"] > 0
+    assert results["summary"]["peak_rss_mb"] > 0
+    assert set(results["feeds"]["TVN24/najnowsze"]) == {"p50_ms", "p99_ms"}
+
+    save_results(results, tmp_path / "results" / "run.json")
+    assert json.loads((tmp_path / "results" / "run.json").read_text()) == results
+
+
+def test_compare_reports_regressions_only():
+    baseline = {
+        "summary": {"articles_per_second": 100.0, "peak_rss_mb": 50.0},
+        "feeds": {"Pudelek/plotki": {"p50_ms": 10.0, "p99_ms": 20.0}},
+    }
+    current = {
+        "summary": {"articles_per_second": 80.0, "peak_rss_mb": 40.0},
+        "feeds": {"Pudelek/plotki": {"p50_ms": 10.5, "p99_ms": 30.0}},
+    }
+
+    assert compare(baseline, current) == [
+        "articles_per_second: 100.0 -> 80.0 (+20%)",
+        "Pudelek/plotki p99_ms: 20.0 -> 30.0 (+50%)",
+    ]
@@ -1,7 +1,9 @@
 from datetime import datetime
+import asyncio
 import pytest
 from app.models.articles import ArticleDB
 from app.services.db_service import DatabaseService
+from sqlalchemy import func, select
 
 # --- FIXTURES ---
 
@@ -24,6 +26,17 @@ class MockArticle:
     def model_dump(self, *args, **kwargs):
         return self.__dict__
 
+    def __iter__(self):
+        return iter(self.__dict__.items())
+
+
+def count_articles(db_session):
+    return asyncio.run(db_session.scalar(select(func.count()).select_from(ArticleDB)))
+
+
+def first_article(db_session, **filters):
+    return asyncio.run(db_session.scalar(select(ArticleDB).filter_by(**filters)))
+
 
 # --- UNIT TESTS ---
 
@@ -40,22 +53,18 @@ def test_save_articles_success(service, db_session):
         )
     ]
 
-    result = service.save_articles(articles, db_session)
+    result = asyncio.run(service.save_articles(articles, db_session))
 
     assert result["status"] == "SUCCESS"
     assert result["new_saved"] == 1
 
-    db_record = (
-        db_session.query(ArticleDB)
-        .filter_by(url="http://kacpersiemionek.com/test-1")
-        .first()
-    )
+    db_record = first_article(db_session, url="http://kacpersiemionek.com/test-1")
     assert db_record is not None
     assert db_record.title == "Kacper Siemionek Test"
 
 
 def test_save_articles_empty_list(service, db_session):
-    result = service.save_articles([], db_session)
+    result = asyncio.run(service.save_articles([], db_session))
     assert result["status"] == "SUCCESS"
     assert result["new_saved"] == 0
 
@@ -70,8 +79,8 @@ def test_save_articles_special_chars(service, db_session):
         source="Test",
         categories=[],
     )
-    service.save_articles([article], db_session)
-    db_record = db_session.query(ArticleDB).first()
+    asyncio.run(service.save_articles([article], db_session))
+    db_record = first_article(db_session)
     assert db_record.title == title_with_emojis
 
 
@@ -85,8 +94,82 @@ def test_save_articles_duplicate_url(service, db_session):
         categories=["Politics"],
     )
 
-    service.save_articles([article], db_session)
-    result = service.save_articles([article], db_session)
+    asyncio.run(service.save_articles([article], db_session))
+    result = asyncio.run(service.save_articles([article], db_session))
 
     assert result["new_saved"] == 0
-    assert db_session.query(ArticleDB).count() == 1
+    assert count_articles(db_session) == 1
+
+
+def test_save_articles_mixed_batch_counts(service, db_session):
+    existing = MockArticle(
+        title="Kacper Siemionek Test",
+        description="Test test test",
+        url="http://kacpersiemionek.com/existing",
+        published_at=datetime.now(),
+        source="Test Source",
+        categories=[],
+    )
+    asyncio.run(service.save_articles([existing], db_session))
+
+    new_articles = [
+        MockArticle(
+            title=f"Kacper Siemionek Test {i}",
+            description="Test test test",
+            url=f"http://kacpersiemionek.com/new-{i}",
+            published_at=datetime.now(),
+            source="Test Source",
+            categories=[],
+        )
+        for i in range(3)
+    ]
+    result = asyncio.run(service.save_articles(new_articles + [existing], db_session))
+
+    assert result["total_scraped"] == 4
+    assert result["new_saved"] == 3
+    assert result["skipped_duplicates"] == 1
+    assert count_articles(db_session) == 4
+
+
+def test_save_articles_duplicates_within_batch(service, db_session):
+    article = MockArticle(
+        title="Roxie Węgiel założyła TO do sklepu!? [ZOBACZ ZDJĘCIA]",
+        description="Fani w szoku",
+        url="http://pudelek.pl/roxie-2",
+        published_at=datetime.now(),
+        source="Pudelek",
+        categories=[],
+    )
+
+    result = asyncio.run(service.save_articles([article, article], db_session))
+
+    assert result["new_saved"] == 1
+    assert result["skipped_duplicates"] == 1
+
+
+def test_rows_to_records_serializes_categories_as_json(service):
+    records = service._rows_to_records(
+        [
+            {
+                "title": 'Roxie "Węgiel", nowe zdjęcia',
+                "description": "Fani w szoku",
+                "url": "http://pudelek.pl/roxie-3",
+                "published_at": datetime(2026, 1, 22, 12),
+                "source": "Pudelek",
+                "categories": ["Skandale", "Moda"],
+            }
+        ]
+    )
+
+    assert records == [
+        (
+            'Roxie "Węgiel", nowe zdjęcia',
+            "Fani w szoku",
+            "http://pudelek.pl/roxie-3",
+            datetime(2026, 1, 22, 12),
+            "Pudelek",
+            '["Skandale", "Moda"]',
+            None,
+            None,
+        )
+    ]
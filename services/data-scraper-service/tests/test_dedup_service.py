@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from app.models.articles import ArticleDB
+from app.schemas.articles import ArticleCreate
+from app.services.dedup_service import (
+    DedupService,
+    hamming_distance,
+    simhash_signatures,
+)
+
+WIRE_STORY = (
+    "Kacper Siemionek kupił zamek w Bieszczadach",
+    "Celebryta zapłacił za zamek w Bieszczadach rekordową kwotę, a sąsiedzi "
+    "nie kryją zdziwienia i pytają skąd miał tyle pieniędzy na remont wieży",
+)
+SYNDICATED_STORY = (
+    "PILNE: Kacper Siemionek kupił zamek w Bieszczadach",
+    "Celebryta zapłacił za zamek w Bieszczadach rekordową kwotę, a sąsiedzi "
+    "nie kryją zdziwienia i pytają skąd miał tyle pieniędzy na remont wieży",
+)
+OTHER_STORY = (
+    "Roxie Węgiel założyła TO do sklepu!?",
+    "Fani są w SZOKU. Eksperci pytają o atencję, a modowi krytycy milczą.",
+)
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def service():
+    return DedupService(window_days=3, max_distance=6)
+
+
+def make_article(story, url, published_at=None):
+    return ArticleCreate(
+        title=story[0],
+        description=story[1],
+        url=url,
+        published_at=published_at or datetime.now(timezone.utc),
+        source="Pudelek",
+        categories=["Plotki"],
+    )
+
+
+# --- UNIT TESTS ---
+def test_signatures_are_stable_and_similar_for_near_duplicates():
+    signatures = simhash_signatures(
+        [" ".join(WIRE_STORY), " ".join(SYNDICATED_STORY), " ".join(OTHER_STORY)]
+    )
+
+    assert signatures.dtype == np.uint64
+    assert signatures[0] == simhash_signatures([" ".join(WIRE_STORY)])[0]
+    assert hamming_distance(signatures[0], signatures[1]) <= 6
+    assert hamming_distance(signatures[0], signatures[2]) > 6
+
+
+def test_signature_of_text_without_words_is_zero():
+    assert simhash_signatures(["?! ..", ""]).tolist() == [0, 0]
+
+
+def test_cluster_groups_near_duplicates(service):
+    signatures = np.array(
+        [0b1111_0000, 0b1111_0001, 0xFFFF_0000_0000_0000, 0b1111_0000],
+        dtype=np.uint64,
+    )
+
+    clusters = service.cluster(signatures)
+
+    assert clusters[0] == clusters[1] == clusters[3] == 0b1111_0000
+    assert clusters[2] != clusters[0]
+
+
+def test_cluster_joins_stored_cluster(service):
+    stored = np.array([0b1011, 0xFF00_0000], dtype=np.uint64)
+
+    clusters = service.cluster(
+        np.array([0b1010, 0xF0F0_F0F0_0000_0000], dtype=np.uint64), stored, [7, 8]
+    )
+
+    assert clusters[0] == 7
+    assert clusters[1] != 8
+
+
+def test_cluster_leaves_empty_signatures_unclustered(service):
+    assert service.cluster(np.array([0, 0], dtype=np.uint64)) == [None, None]
+
+
+def test_assign_clusters_uses_recent_articles(service, db_session):
+    stored = make_article(WIRE_STORY, "http://tvn24.pl/zamek")
+    asyncio.run(service.assign_clusters([stored], db_session))
+    old = make_article(
+        WIRE_STORY,
+        "http://interia.pl/zamek-archiwum",
+        datetime.now(timezone.utc) - timedelta(days=10),
+    )
+    asyncio.run(service.assign_clusters([old], db_session))
+    old.cluster_id = 42
+    for article in (stored, old):
+        db_session.add(
+            ArticleDB(**article.model_dump(mode="python") | {"url": str(article.url)})
+        )
+    asyncio.run(db_session.flush())
+
+    articles = asyncio.run(
+        service.assign_clusters(
+            [
+                make_article(SYNDICATED_STORY, "http://bbc.com/zamek"),
+                make_article(OTHER_STORY, "http://pudelek.pl/roxie"),
+            ],
+            db_session,
+        )
+    )
+
+    assert articles[0].cluster_id == stored.cluster_id
+    assert articles[1].cluster_id not in (stored.cluster_id, 42)
+    assert all(article.simhash for article in articles)
@@ -0,0 +1,91 @@
+import pytest
+from app.scrapers.api.api_scraper import BBCScraper
+from app.scrapers.feed_cache import FeedCache
+
+MOCK_RESPONSE = {
+    "news": [
+        {
+            "title": "Kacper Siemionek założył to na plażę?! [ZOBACZ ZDJĘCIA]",
+            "summary": "ODWAŻNY KACPER SIEMIONEK w nowym, ostrym wydaniu! [ZOBACZ ZDJĘCIA]",
+            "news_link": "http://bbc.com/news1",
+        }
+    ]
+}
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = FeedCache(str(tmp_path / "feed_cache.json"))
+    monkeypatch.setattr("app.scrapers.base_scraper.feed_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def bbc_scraper():
+    return BBCScraper(url="http://test-bbc.com/%s", source_name="BBC")
+
+
+# --- UNIT TESTS ---
+def test_conditional_headers_empty_for_unknown_url(cache):
+    assert cache.conditional_headers("http://test-bbc.com/news") == {}
+
+
+def test_commit_persists_staged_entries(cache):
+    cache.stage(
+        "http://test-bbc.com/news",
+        {"ETag": '"v1"', "Last-Modified": "Sat, 01 Jan 2026 20:20:00 GMT"},
+        cache.fingerprint(b"body"),
+    )
+    assert cache.conditional_headers("http://test-bbc.com/news") == {}
+
+    cache.commit()
+    reloaded = FeedCache(cache.path)
+
+    assert reloaded.conditional_headers("http://test-bbc.com/news") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 01 Jan 2026 20:20:00 GMT",
+    }
+    assert reloaded.is_unchanged(
+        "http://test-bbc.com/news", 200, cache.fingerprint(b"body")
+    )
+    assert not reloaded.is_unchanged(
+        "http://test-bbc.com/news", 200, cache.fingerprint(b"new body")
+    )
+
+
+def test_discard_drops_staged_entries(cache):
+    cache.stage("http://test-bbc.com/news", {}, cache.fingerprint(b"body"))
+    cache.discard()
+    cache.commit()
+
+    assert not cache.is_unchanged(
+        "http://test-bbc.com/news", 200, cache.fingerprint(b"body")
+    )
+
+
+def test_incremental_collect_skips_not_modified_feed(cache, bbc_scraper, mock_http):
+    mock_http.add(
+        "http://test-bbc.com/news", json=MOCK_RESPONSE, headers={"ETag": '"v1"'}
+    )
+    first = bbc_scraper.collect_data("news", incremental=True)
+    cache.commit()
+
+    mock_http.add("http://test-bbc.com/news", status_code=304)
+    second = bbc_scraper.collect_data("news", incremental=True)
+
+    assert len(first) == 1
+    assert second == []
+    assert mock_http.requests[-1].headers["If-None-Match"] == '"v1"'
+
+
+def test_incremental_collect_skips_identical_body(cache, bbc_scraper, mock_http):
+    mock_http.add("http://test-bbc.com/news", json=MOCK_RESPONSE)
+    bbc_scraper.collect_data("news", incremental=True)
+    cache.commit()
+
+    second = bbc_scraper.collect_data("news", incremental=True)
+    full = bbc_scraper.collect_data("news")
+
+    assert second == []
+    assert len(full) == 1
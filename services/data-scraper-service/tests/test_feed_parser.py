@@ -0,0 +1,90 @@
+import asyncio
+
+import httpx
+import pytest
+from app.scrapers.rss.feed_parser import RssStreamParser, parse_feed
+from app.scrapers.rss.rss_scraper import RssScraper
+
+SAMPLE_RSS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Pudelek</title>
+        <item>
+            <title><![CDATA[Roxie W\xc4\x99giel <b>w nowym</b> wydaniu!]]></title>
+            <link>http://pudelek.pl/roxie-1</link>
+            <guid>roxie-1</guid>
+            <description>Fani s\xc4\x85 w SZOKU. Eksperci pytaj\xc4\x85 o atencj\xc4\x99.</description>
+            <pubDate>Sat, 01 Jan 2026 20:20:00 +0000</pubDate>
+            <category>Skandale</category>
+            <category>Moda</category>
+        </item>
+        <item>
+            <title>Kacper Siemionek na pla\xc5\xbcy w \xc5\x9awiebodzinie</title>
+            <link>http://pudelek.pl/kacper-1</link>
+            <description>Kacper Siemionek zn\xc3\xb3w zaskoczy\xc5\x82 fan\xc3\xb3w.</description>
+            <pubDate>Sat, 01 Jan 2026 18:00:00 GMT</pubDate>
+        </item>
+    </channel>
+</rss>
+"""
+
+
+# --- UNIT TESTS ---
+def test_parse_feed_reads_item_children():
+    items = parse_feed(SAMPLE_RSS_XML)
+
+    assert len(items) == 2
+    assert items[0]["title"] == "Roxie Węgiel <b>w nowym</b> wydaniu!"
+    assert items[0]["link"] == "http://pudelek.pl/roxie-1"
+    assert items[0]["guid"] == "roxie-1"
+    assert items[0]["categories"] == ["Skandale", "Moda"]
+    assert items[1]["guid"] is None
+    assert items[1]["categories"] == []
+
+
+def test_stream_parser_handles_arbitrary_chunks():
+    parser = RssStreamParser()
+    items = []
+    for i in range(0, len(SAMPLE_RSS_XML), 7):
+        items += parser.feed(SAMPLE_RSS_XML[i : i + 7])
+    items += parser.close()
+
+    assert [item["link"] for item in items] == [
+        "http://pudelek.pl/roxie-1",
+        "http://pudelek.pl/kacper-1",
+    ]
+
+
+def test_stream_parser_releases_processed_items():
+    parser = RssStreamParser()
+    parser.feed(SAMPLE_RSS_XML[: SAMPLE_RSS_XML.index(b"</channel>")])
+
+    channel = parser.stack[-1]
+
+    assert channel.tag == "channel"
+    assert [child.tag for child in channel] == ["title"]
+
+
+def test_stream_parser_invalid_xml():
+    parser = RssStreamParser()
+
+    with pytest.raises(Exception):
+        parser.feed(b"Kacper Siemionek, completely not valid XML")
+        parser.close()
+
+
+def test_collect_data_async_streams_feed():
+    def handler(request):
+        return httpx.Response(200, content=SAMPLE_RSS_XML)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = RssScraper("http://pudelek.pl/%s.xml", "Pudelek")
+            return await scraper.collect_data_async(client, "gwiazdy")
+
+    articles = asyncio.run(run())
+
+    assert len(articles) == 2
+    assert articles[0].title == "Roxie Węgiel w nowym wydaniu!"
+    assert articles[0].categories == ["gwiazdy"]
+    assert articles[0].published_at.year == 2026
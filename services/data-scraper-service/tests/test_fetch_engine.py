@@ -0,0 +1,142 @@
+import asyncio
+
+import httpx
+import pytest
+from app.core.http import HostLimitedTransport
+from app.scrapers.fetch_engine import FetchEngine
+from app.scrapers.source_health import HealthTracker
+
+
+class MockScraper:
+    def __init__(self, url: str, delay: float = 0.0, fail: bool = False):
+        self.url = url
+        self.source_name = url
+        self.source_id = url
+        self.delay = delay
+        self.fail = fail
+
+    async def collect_data_async(self, client, category=None, incremental=False):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise Exception("Request failed")
+        return [f"{self.url}/{category}"]
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle_async_request(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return httpx.Response(200, content=b"Kacper Siemionek")
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def engine():
+    return FetchEngine(max_concurrency=2, health=HealthTracker())
+
+
+# --- UNIT TESTS ---
+def test_gather_preserves_job_order(engine):
+    jobs = [
+        (MockScraper("http://slow.com", delay=0.05), "a"),
+        (MockScraper("http://fast.com"), "b"),
+        (MockScraper("http://fast.com"), None),
+    ]
+
+    results = asyncio.run(engine.gather(jobs))
+
+    assert results == [
+        ["http://slow.com/a"],
+        ["http://fast.com/b"],
+        ["http://fast.com/None"],
+    ]
+
+
+def test_gather_returns_exceptions_in_place(engine):
+    jobs = [
+        (MockScraper("http://dead.com", fail=True), None),
+        (MockScraper("http://alive.com"), None),
+    ]
+
+    results = asyncio.run(engine.gather(jobs))
+
+    assert isinstance(results[0], Exception)
+    assert results[1] == ["http://alive.com/None"]
+
+
+def test_gather_respects_global_cap():
+    engine = FetchEngine(max_concurrency=2)
+    running = 0
+    max_running = 0
+
+    class TrackingScraper(MockScraper):
+        async def collect_data_async(self, client, category=None, incremental=False):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+    asyncio.run(engine.gather([(TrackingScraper("http://a.com"), None)] * 6))
+
+    assert max_running == 2
+
+
+def test_host_limited_transport_caps_requests_per_host():
+    inner = CountingTransport()
+
+    async def run():
+        transport = HostLimitedTransport(inner, max_per_host=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            responses = await asyncio.gather(
+                *(client.get("http://rss.nytimes.com/feed") for _ in range(4))
+            )
+        return responses
+
+    responses = asyncio.run(run())
+
+    assert all(response.content == b"Kacper Siemionek" for response in responses)
+    assert inner.max_in_flight == 1
+
+
+def test_gather_reports_jobs_as_they_finish(engine):
+    finished = []
+    jobs = [
+        (MockScraper("http://slow.com", delay=0.05), "a"),
+        (MockScraper("http://dead.com", fail=True), None),
+    ]
+
+    asyncio.run(
+        engine.gather(
+            jobs, on_done=lambda index, result: finished.append((index, result))
+        )
+    )
+
+    assert finished[0][0] == 1
+    assert isinstance(finished[0][1], Exception)
+    assert finished[1] == (0, ["http://slow.com/a"])
+
+
+def test_stream_yields_results_in_completion_order(engine):
+    jobs = [
+        (MockScraper("http://slow.com", delay=0.05), "a"),
+        (MockScraper("http://dead.com", fail=True), None),
+        (MockScraper("http://fast.com"), "b"),
+    ]
+
+    async def collect():
+        return [item async for item in engine.stream(jobs)]
+
+    results = asyncio.run(collect())
+
+    assert [index for index, _ in results][-1] == 0
+    assert sorted(index for index, _ in results) == [0, 1, 2]
+    assert isinstance(dict(results)[1], Exception)
+    assert dict(results)[2] == ["http://fast.com/b"]
@@ -0,0 +1,243 @@
+import asyncio
+
+import httpx
+import pytest
+from app.core.http import (
+    ACCEPT_ENCODING,
+    HttpClients,
+    RateLimitedTransport,
+    RateLimiter,
+    ThrottleBudget,
+    TokenBucket,
+    retry_after,
+    throttle_budget,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ThrottlingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, *responses: httpx.Response):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def handle_async_request(self, request):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def fetch(transport: httpx.AsyncBaseTransport, url: str = "http://pudelek.pl/rss"):
+    async def get():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get(url)
+
+    return asyncio.run(get())
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def clients():
+    clients = HttpClients()
+    yield clients
+    asyncio.run(clients.aclose())
+
+
+# --- UNIT TESTS ---
+def test_get_client_is_shared(clients):
+    client = clients.get_client()
+
+    assert clients.get_client() is client
+    assert client.headers["Accept-Encoding"] == ACCEPT_ENCODING
+    assert client.timeout.connect is not None
+    assert client.timeout.read is not None
+
+
+def test_get_async_client_is_shared_within_loop(clients):
+    async def get_twice():
+        return clients.get_async_client(), clients.get_async_client()
+
+    first, second = asyncio.run(get_twice())
+
+    assert first is second
+
+
+def test_get_async_client_is_bound_to_its_loop(clients):
+    async def get_client():
+        return clients.get_async_client()
+
+    shared = asyncio.run(get_client())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(get_client())
+    assert clients.async_client is shared
+
+
+def test_current_async_client_of_other_loop_is_closed(clients):
+    async def shared_client():
+        async with clients.current_async_client() as client:
+            return client
+
+    async def other_loop_client():
+        async with clients.current_async_client() as client:
+            assert not client.is_closed
+        return client
+
+    shared = asyncio.run(shared_client())
+    temporary = asyncio.run(other_loop_client())
+
+    assert temporary is not shared
+    assert temporary.is_closed
+    assert not shared.is_closed
+
+
+def test_async_client_scope_is_used_and_closed(clients):
+    async def scoped_job():
+        async with clients.async_client_scope() as scoped:
+            async with clients.current_async_client() as client:
+                assert client is scoped
+        return scoped
+
+    first = asyncio.run(scoped_job())
+    second = asyncio.run(scoped_job())
+
+    assert first.is_closed and second.is_closed
+    assert clients.async_client is None
+
+
+def test_aclose_resets_clients(clients):
+    async def open_and_close():
+        clients.get_client()
+        clients.get_async_client()
+        await clients.aclose()
+
+    asyncio.run(open_and_close())
+
+    assert clients.client is None
+    assert clients.async_client is None
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    clock.now += 1.0
+    assert bucket.reserve() == 0.5
+
+
+def test_token_bucket_pause_delays_next_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=3, clock=clock)
+
+    bucket.pause(10)
+
+    assert bucket.reserve() == 10.0
+    assert bucket.reserve() == 11.0
+
+
+def test_rate_limiter_keeps_buckets_of_unchanged_hosts():
+    limiter = RateLimiter()
+    limiter.configure({"api.nytimes.com": (2, 1), "bbc.com": (1, 1)})
+    nyt = limiter.bucket("api.nytimes.com")
+
+    limiter.configure({"api.nytimes.com": (2, 1)})
+
+    assert limiter.bucket("api.nytimes.com") is nyt
+    assert limiter.bucket("bbc.com") is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("3", 3.0), ("-1", 0.0), ("Kacper Siemionek", None), (None, None)],
+)
+def test_retry_after_parses_seconds(value, expected):
+    headers = httpx.Headers({"retry-after": value} if value else {})
+
+    assert retry_after(headers) == expected
+
+
+def test_retry_after_parses_http_date():
+    headers = httpx.Headers({"retry-after": "Sat, 01 Jan 2000 00:00:00 GMT"})
+
+    assert retry_after(headers) == 0.0
+
+
+def test_rate_limited_transport_retries_throttled_request():
+    limiter = RateLimiter()
+    limiter.configure({"pudelek.pl": (100, 1)})
+    upstream = ThrottlingTransport(
+        httpx.Response(429, headers={"retry-after": "0.01"}),
+        httpx.Response(200, content=b"Roxie Wegiel"),
+    )
+
+    response = fetch(RateLimitedTransport(upstream, limiter))
+
+    assert response.status_code == 200
+    assert upstream.calls == 2
+
+
+def test_rate_limited_transport_gives_up_after_max_retries():
+    upstream = ThrottlingTransport(*(httpx.Response(429) for _ in range(3)))
+
+    response = fetch(RateLimitedTransport(upstream, RateLimiter(), 2, backoff=0.001))
+
+    assert response.status_code == 429
+    assert upstream.calls == 3
+
+
+def test_rate_limited_transport_skips_too_long_retry_after():
+    upstream = ThrottlingTransport(
+        httpx.Response(503, headers={"retry-after": "3600"}),
+    )
+
+    response = fetch(RateLimitedTransport(upstream, RateLimiter()))
+
+    assert response.status_code == 503
+    assert upstream.calls == 1
+
+
+def test_rate_limit_wait_moves_deadline_of_the_fetch():
+    limiter = RateLimiter()
+    limiter.configure({"pudelek.pl": (10, 1)})
+    upstream = ThrottlingTransport(*(httpx.Response(200) for _ in range(2)))
+
+    async def get():
+        async with httpx.AsyncClient(
+            transport=RateLimitedTransport(upstream, limiter)
+        ) as client:
+            async with asyncio.timeout(0.05) as deadline:
+                with throttle_budget(ThrottleBudget(deadline, max_wait=1)) as budget:
+                    for _ in range(2):
+                        await client.get("http://pudelek.pl/rss")
+        return budget
+
+    budget = asyncio.run(get())
+
+    assert upstream.calls == 2
+    assert 0.05 < budget.waited <= 0.1
+    assert not budget.exhausted
+
+
+def test_retry_after_longer_than_throttle_budget_is_not_waited_for():
+    upstream = ThrottlingTransport(httpx.Response(429, headers={"retry-after": "5"}))
+
+    async def get():
+        async with httpx.AsyncClient(
+            transport=RateLimitedTransport(upstream, RateLimiter())
+        ) as client:
+            async with asyncio.timeout(1) as deadline:
+                with throttle_budget(ThrottleBudget(deadline, max_wait=2)) as budget:
+                    return await client.get("http://pudelek.pl/rss"), budget
+
+    response, budget = asyncio.run(get())
+
+    assert response.status_code == 429
+    assert upstream.calls == 1
+    assert budget.exhausted
@@ -0,0 +1,110 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from app.main import app
+from app.schemas.jobs import JobStatus
+from app.services.job_service import JobService
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+FEEDS = [("Pudelek", "Plotki"), ("Pudelek", "Moda"), ("BBC", None)]
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def service(monkeypatch):
+    service = JobService(max_workers=1)
+    monkeypatch.setattr("app.api.v1.articles.job_service", service)
+    monkeypatch.setattr("app.services.job_service.scraper_service.feeds", lambda: FEEDS)
+    yield service
+    service.executor.shutdown(wait=True)
+
+
+def fake_ingest(release: threading.Event | None = None, error: Exception | None = None):
+    async def ingest(db, limit_per_source=None, on_feed_done=None):
+        on_feed_done("Pudelek", "Plotki", ["Roxie Węgiel w Świebodzinie"])
+        on_feed_done("BBC", None, Exception("Kacper Siemionek zablokował serwer"))
+        if release:
+            release.wait(timeout=5)
+        if error:
+            raise error
+        return {"status": "SUCCESS", "new_saved": 1}
+
+    return ingest
+
+
+# --- UNIT TESTS ---
+def test_job_reports_progress_and_result(service):
+    release = threading.Event()
+    with patch(
+        "app.services.job_service.ingest_service.ingest_all_articles",
+        fake_ingest(release),
+    ):
+        job_id = service.submit(limit_per_source=5)
+        while service.get(job_id).sources["BBC"].feeds_done == 0:
+            time.sleep(0.01)
+        running = service.get(job_id)
+        release.set()
+        service.jobs[job_id]["future"].result(timeout=5)
+    finished = service.get(job_id)
+
+    assert running.status == JobStatus.PROCESSING
+    assert running.sources["Pudelek"].feeds_total == 2
+    assert running.sources["Pudelek"].feeds_done == 1
+    assert running.sources["Pudelek"].articles == 1
+    assert running.sources["BBC"].errors == ["BBC: Kacper Siemionek zablokował serwer"]
+    assert finished.status == JobStatus.COMPLETED
+    assert finished.result == {"status": "SUCCESS", "new_saved": 1}
+    assert finished.completed_at is not None
+
+
+def test_failed_job_keeps_error(service):
+    with patch(
+        "app.services.job_service.ingest_service.ingest_all_articles",
+        fake_ingest(error=RuntimeError("Database error during bulk save")),
+    ):
+        job_id = service.submit()
+        with pytest.raises(RuntimeError):
+            service.jobs[job_id]["future"].result(timeout=5)
+
+    status = service.get(job_id)
+    assert status.status == JobStatus.FAILED
+    assert status.error == "Database error during bulk save"
+
+
+def test_unknown_job_not_found(service):
+    status = service.get("nie-ma-takiego-joba")
+
+    assert status.status == JobStatus.NOT_FOUND
+    assert status.error
+
+
+def test_post_articles_async_returns_job_id(service):
+    with patch(
+        "app.services.job_service.ingest_service.ingest_all_articles",
+        fake_ingest(),
+    ):
+        response = client.post("/articles?async=true&limit=3")
+        job_id = response.json()["job_id"]
+        service.jobs[job_id]["future"].result(timeout=5)
+
+    status = client.get(f"/articles/jobs/{job_id}")
+
+    assert response.status_code == 200
+    assert status.status_code == 200
+    assert status.json()["status"] == "completed"
+    assert status.json()["sources"]["Pudelek"]["articles"] == 1
+
+
+def test_post_articles_waits_for_result(service):
+    with patch(
+        "app.services.job_service.ingest_service.ingest_all_articles",
+        fake_ingest(),
+    ):
+        response = client.post("/articles")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "SUCCESS", "new_saved": 1}
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+from app.core.metrics import BreakerStateCollector, registry
+from app.main import app
+from app.scrapers.fetch_engine import FetchEngine
+from app.scrapers.rss import RssScraper
+from app.scrapers.source_health import HealthTracker
+from app.services.db_service import DatabaseService
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+
+client = TestClient(app)
+
+
+class MockScraper:
+    def __init__(self, source_name: str, fail: bool = False):
+        self.source_name = source_name
+        self.source_id = source_name
+        self.fail = fail
+
+    async def collect_data_async(self, client, category=None, incremental=False):
+        if self.fail:
+            raise Exception("Roxie Węgiel zjadła kabel")
+        return [f"{self.source_name}/{category}"]
+
+
+def sample(name: str, **labels) -> float:
+    return registry.get_sample_value(name, labels) or 0.0
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def health():
+    return HealthTracker(failure_threshold=1, cooldown=60)
+
+
+# --- UNIT TESTS ---
+def test_metrics_endpoint_exposes_prometheus_format():
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "scraper_fetch_duration_seconds" in response.text
+    assert "scraper_items_saved_total" in response.text
+
+
+def test_fetch_records_latency_by_source_category_and_outcome(health):
+    engine = FetchEngine(health=health)
+    ok_before = sample(
+        "scraper_fetch_duration_seconds_count",
+        source="Pudelek",
+        category="plotki",
+        outcome="success",
+    )
+    error_before = sample(
+        "scraper_fetch_duration_seconds_count",
+        source="Zepsuty",
+        category="",
+        outcome="error",
+    )
+
+    asyncio.run(
+        engine.gather(
+            [(MockScraper("Pudelek"), "plotki"), (MockScraper("Zepsuty", True), None)]
+        )
+    )
+
+    assert (
+        sample(
+            "scraper_fetch_duration_seconds_count",
+            source="Pudelek",
+            category="plotki",
+            outcome="success",
+        )
+        == ok_before + 1
+    )
+    assert (
+        sample(
+            "scraper_fetch_duration_seconds_count",
+            source="Zepsuty",
+            category="",
+            outcome="error",
+        )
+        == error_before + 1
+    )
+
+
+def test_validate_articles_counts_parsed_and_rejected_items():
+    scraper = RssScraper("http://pudelek.pl/rss", "Pudelek-metrics")
+
+    scraper._validate_articles(
+        [
+            scraper._article_row(
+                "Kacper Siemionek wygrywa konkurs",
+                "Kacper Siemionek zjadł najwięcej pierogów na świecie",
+                "http://pudelek.pl/kacper",
+                [],
+            ),
+            scraper._article_row("Krót", "za krótki", "http://pudelek.pl/roxie", []),
+        ]
+    )
+
+    assert sample("scraper_items_parsed_total", source="Pudelek-metrics") == 2
+    assert sample("scraper_items_rejected_total", source="Pudelek-metrics") == 1
+
+
+def test_known_url_counts_as_deduplicated(monkeypatch):
+    monkeypatch.setattr(
+        "app.scrapers.base_scraper.seen_filter", {"http://pudelek.pl/kacper"}
+    )
+    scraper = RssScraper("http://pudelek.pl/rss", "Pudelek")
+    before = sample("scraper_items_deduplicated_total", reason="seen")
+
+    assert scraper._is_known("http://pudelek.pl/kacper", incremental=True)
+    assert not scraper._is_known("http://pudelek.pl/roxie", incremental=True)
+
+    assert sample("scraper_items_deduplicated_total", reason="seen") == before + 1
+
+
+def test_save_articles_records_duration_and_counts(db_session):
+    service = DatabaseService()
+    scraper = RssScraper("http://pudelek.pl/rss", "Pudelek")
+    [article] = scraper._validate_articles(
+        [
+            scraper._article_row(
+                "Roxie Węgiel nagrywa nową płytę",
+                "Roxie Węgiel ogłosiła premierę płyty na przyszły tydzień",
+                "http://pudelek.pl/roxie-plyta",
+                [],
+            )
+        ]
+    )
+    saves_before = sample("scraper_db_save_duration_seconds_count", method="insert")
+    saved_before = sample("scraper_items_saved_total")
+    conflicts_before = sample("scraper_items_deduplicated_total", reason="conflict")
+
+    asyncio.run(service.save_articles([article, article], db_session))
+
+    assert (
+        sample("scraper_db_save_duration_seconds_count", method="insert")
+        == saves_before + 1
+    )
+    assert sample("scraper_items_saved_total") == saved_before + 1
+    assert (
+        sample("scraper_items_deduplicated_total", reason="conflict")
+        == conflicts_before + 1
+    )
+
+
+def test_breaker_state_collector_reports_every_source(health):
+    breakers = CollectorRegistry()
+    breakers.register(BreakerStateCollector(health))
+    health.record_success("Pudelek", 0.1)
+    health.record_failure("Zepsuty", Exception("Kacper Siemionek wyłączył serwer"))
+
+    assert (
+        breakers.get_sample_value("scraper_breaker_state", {"source": "Pudelek"}) == 0
+    )
+    assert (
+        breakers.get_sample_value("scraper_breaker_state", {"source": "Zepsuty"}) == 2
+    )
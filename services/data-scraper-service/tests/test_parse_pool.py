@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+from app.scrapers.feed_cache import FeedCache
+from app.scrapers.parse_pool import ParsePool
+from app.scrapers.rss.rss_scraper import RssScraper, extract_articles
+from app.scrapers.watermarks import WatermarkStore
+
+RSS_ITEM = """
+        <item>
+            <title>{title}</title>
+            <link>http://pudelek.pl/kacper-{number}</link>
+            <description>Kacper Siemionek znowu w &lt;b&gt;centrum&lt;/b&gt; uwagi, odcinek {number}.</description>
+            <pubDate>{date}</pubDate>
+        </item>
+"""
+
+FEED = (
+    "<rss><channel>"
+    + RSS_ITEM.format(
+        title="Kacper Siemionek otwiera pierogarnię",
+        number=1,
+        date="Sat, 03 Jan 2026 20:20:00 GMT",
+    )
+    + RSS_ITEM.format(title="Krót", number=2, date="Sat, 02 Jan 2026 20:20:00 GMT")
+    + RSS_ITEM.format(
+        title="Kacper Siemionek zamyka pierogarnię", number=3, date="wczoraj"
+    )
+    + RSS_ITEM.format(
+        title="Kacper Siemionek wraca do Świebodzina",
+        number=4,
+        date="Thu, 01 Jan 2026 20:20:00 GMT",
+    )
+    + "</channel></rss>"
+).encode()
+
+
+class InlinePool(ParsePool):
+    """
+    Parse pool running offloaded functions in-process
+    """
+
+    def __init__(self, threshold: int = 0):
+        super().__init__(workers=1, threshold=threshold)
+        self.calls = 0
+
+    async def run(self, function, *args):
+        self.calls += 1
+        return function(*args)
+
+
+def collect(scraper, incremental=False):
+    async def run():
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=FEED)
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await scraper.collect_data_async(client, "plotki", incremental)
+
+    return asyncio.run(run())
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def scraper():
+    return RssScraper(url="http://pudelek.pl/rss/%s", source_name="Pudelek")
+
+
+@pytest.fixture
+def isolated_state(tmp_path, monkeypatch):
+    cache = FeedCache(str(tmp_path / "feed_cache.json"))
+    monkeypatch.setattr("app.scrapers.base_scraper.feed_cache", cache)
+    monkeypatch.setattr("app.scrapers.rss.rss_scraper.feed_cache", cache)
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+    monkeypatch.setattr("app.scrapers.base_scraper.watermark_store", store)
+    return cache, store
+
+
+# --- UNIT TESTS ---
+def test_extract_articles_returns_validated_rows_in_feed_order():
+    entries, parsed, rejected = extract_articles(FEED, "plotki", "Pudelek")
+
+    assert (parsed, rejected) == (3, 1)
+    assert [row and row["url"] for _, _, row in entries] == [
+        "http://pudelek.pl/kacper-1",
+        None,
+        "http://pudelek.pl/kacper-4",
+    ]
+    assert entries[0][2]["description"].startswith("Kacper Siemionek znowu w centrum")
+    assert entries[0][2]["categories"] == ["plotki"]
+
+
+def test_offloaded_parsing_matches_inline(scraper, monkeypatch):
+    inline = collect(scraper)
+    pool = InlinePool()
+    monkeypatch.setattr("app.scrapers.rss.rss_scraper.parse_pool", pool)
+
+    offloaded = collect(scraper)
+
+    assert pool.calls == 1
+    assert [article.model_dump() for article in offloaded] == [
+        article.model_dump() for article in inline
+    ]
+
+
+def test_small_feeds_are_parsed_inline(scraper, monkeypatch):
+    pool = InlinePool(threshold=len(FEED) + 1)
+    monkeypatch.setattr("app.scrapers.rss.rss_scraper.parse_pool", pool)
+
+    articles = collect(scraper)
+
+    assert pool.calls == 0
+    assert len(articles) == 2
+
+
+def test_unchanged_feed_is_not_sent_to_workers(scraper, isolated_state, monkeypatch):
+    cache, store = isolated_state
+    pool = InlinePool()
+    monkeypatch.setattr("app.scrapers.rss.rss_scraper.parse_pool", pool)
+
+    first = collect(scraper, incremental=True)
+    cache.commit()
+    store.commit()
+    second = collect(scraper, incremental=True)
+
+    assert len(first) == 2
+    assert second == []
+    assert pool.calls == 1
+
+
+def test_should_offload_needs_workers_and_size():
+    assert not ParsePool(workers=0, threshold=0).should_offload(10**6)
+    assert not ParsePool(workers=2, threshold=100).should_offload(99)
+    assert ParsePool(workers=2, threshold=100).should_offload(100)
+
+
+def test_worker_process_parses_feed():
+    pool = ParsePool(workers=1, threshold=0)
+
+    try:
+        entries, parsed, rejected = asyncio.run(
+            pool.run(extract_articles, FEED, None, "Pudelek")
+        )
+    finally:
+        pool.shutdown()
+
+    assert (parsed, rejected) == (3, 1)
+    assert entries[-1][2]["title"] == "Kacper Siemionek wraca do Świebodzina"
@@ -0,0 +1,47 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+import asyncio
+
+import pytest
+from app.services.partition_service import PartitionService, add_months
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def postgres_session():
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute = AsyncMock(
+        return_value=MagicMock(**{"scalar_one.return_value": 2})
+    )
+    session.commit = AsyncMock()
+    return session
+
+
+# --- UNIT TESTS ---
+def test_add_months_rolls_over_year():
+    assert add_months(date(2026, 11, 17), 1) == date(2026, 12, 1)
+    assert add_months(date(2026, 11, 17), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 31), 0) == date(2026, 1, 1)
+
+
+def test_create_partitions_covers_current_and_upcoming_months(postgres_session):
+    service = PartitionService(months_ahead=3)
+
+    created = asyncio.run(
+        service.create_partitions(postgres_session, today=date(2026, 11, 17))
+    )
+
+    assert created == 2
+    statement, params = postgres_session.execute.call_args.args
+    assert "create_article_partitions" in str(statement)
+    assert params == {"start": date(2026, 11, 1), "end": date(2027, 3, 1)}
+    postgres_session.commit.assert_awaited_once()
+
+
+def test_create_partitions_skips_unpartitioned_databases(db_session):
+    assert asyncio.run(PartitionService().create_partitions(db_session)) == 0
+
+
+def test_maintain_disabled_with_zero_interval():
+    asyncio.run(asyncio.wait_for(PartitionService().maintain(interval=0), timeout=1))
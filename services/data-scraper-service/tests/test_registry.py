@@ -0,0 +1,155 @@
+import json
+import os
+
+import pytest
+from app.core.http import RateLimiter
+from app.scrapers.api.api_scraper import NYTScraper
+from app.scrapers.registry import ScraperRegistry
+from app.scrapers.rss import RssScraper
+
+CONFIG = {
+    "pudelek": {
+        "title": "Pudelek",
+        "endpoint": {
+            "base_url": "http://pudelek.pl/%s.xml",
+            "categories": ["plotki", "gwiazdy"],
+        },
+        "type": "RssScraper",
+    },
+    "kacper-news": {
+        "title": "KacperNews",
+        "endpoint": {"base_url": "http://kacpersiemionek.com/api?api-key="},
+        "type": "NYTScraper",
+        "api_key": "KACPER_API_KEY",
+    },
+}
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG))
+    return path
+
+
+@pytest.fixture
+def registry(config_file, monkeypatch):
+    monkeypatch.setenv("KACPER_API_KEY", "pierogi")
+    registry = ScraperRegistry(str(config_file), limiter=RateLimiter())
+    registry.load()
+    return registry
+
+
+def write_config(path, config):
+    path.write_text(json.dumps(config))
+    # make sure the change is visible even on filesystems with coarse timestamps
+    mtime = os.stat(path).st_mtime + 10
+    os.utime(path, (mtime, mtime))
+
+
+# --- UNIT TESTS ---
+def test_load_compiles_scrapers_with_formatted_urls(registry):
+    pudelek = registry.get("pudelek")
+    kacper = registry.get("kacper-news")
+
+    assert isinstance(pudelek.scraper, RssScraper)
+    assert pudelek.urls == {
+        "plotki": "http://pudelek.pl/plotki.xml",
+        "gwiazdy": "http://pudelek.pl/gwiazdy.xml",
+    }
+    assert isinstance(kacper.scraper, NYTScraper)
+    assert kacper.urls == {None: "http://kacpersiemionek.com/api?api-key=pierogi"}
+    assert [(name, category) for name, _, category in registry.jobs] == [
+        ("Pudelek", "plotki"),
+        ("Pudelek", "gwiazdy"),
+        ("KacperNews", None),
+    ]
+
+
+def test_scrapers_are_keyed_by_config_source_id(registry):
+    assert registry.get("pudelek").scraper.source_id == "pudelek"
+    assert registry.get("kacper-news").scraper.source_id == "kacper-news"
+    assert registry.get("kacper-news").scraper.source_name == "KacperNews"
+
+
+def test_jobs_reuse_the_same_scraper_instances(registry):
+    first = [scraper for _, scraper, _ in registry.jobs]
+    second = [scraper for _, scraper, _ in registry.jobs]
+
+    assert all(a is b for a, b in zip(first, second))
+    assert first[0] is first[1]
+
+
+def test_get_unknown_source_or_category(registry):
+    with pytest.raises(ValueError, match="Source: `roxie` not found"):
+        registry.get("roxie")
+    with pytest.raises(ValueError, match="Category: `sport` not found"):
+        registry.get("pudelek", "sport")
+
+
+def test_reload_if_changed_swaps_in_new_sources(registry, config_file):
+    assert registry.reload_if_changed() is False
+
+    write_config(
+        config_file,
+        CONFIG
+        | {
+            "roxie": {
+                "title": "Roxie",
+                "endpoint": {"base_url": "http://roxie.pl/rss"},
+                "type": "RssScraper",
+            }
+        },
+    )
+
+    assert registry.reload_if_changed() is True
+    assert registry.get("roxie").urls == {None: "http://roxie.pl/rss"}
+
+
+def test_invalid_config_keeps_current_scrapers(registry, config_file):
+    jobs = registry.jobs
+    write_config(
+        config_file,
+        {"zepsute": {"title": "Zepsute", "endpoint": {}, "type": "RssScraper"}},
+    )
+
+    assert registry.reload() is False
+    assert registry.jobs is jobs
+    assert registry.get("pudelek")
+
+
+def test_unknown_scraper_type_is_rejected(config_file):
+    registry = ScraperRegistry(str(config_file), scrapers={}, limiter=RateLimiter())
+
+    with pytest.raises(RuntimeError, match="is not configured"):
+        registry.load()
+
+
+def test_rate_limits_configured_per_host(config_file):
+    limiter = RateLimiter()
+    write_config(
+        config_file,
+        CONFIG
+        | {
+            "kacper-news": CONFIG["kacper-news"]
+            | {"rate_limit": {"requests_per_second": 2, "burst": 3}}
+        },
+    )
+
+    ScraperRegistry(str(config_file), limiter=limiter).load()
+
+    bucket = limiter.bucket("kacpersiemionek.com")
+    assert (bucket.rate, bucket.burst) == (2.0, 3)
+    assert limiter.bucket("pudelek.pl") is None
+
+
+def test_invalid_rate_limit_is_rejected(config_file):
+    write_config(
+        config_file,
+        CONFIG
+        | {"pudelek": CONFIG["pudelek"] | {"rate_limit": {"requests_per_second": 0}}},
+    )
+
+    with pytest.raises(ValueError, match="requests_per_second"):
+        ScraperRegistry(str(config_file), limiter=RateLimiter()).load()
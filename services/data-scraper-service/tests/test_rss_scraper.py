@@ -1,8 +1,8 @@
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+import httpx
 import pytest
-import requests
 from app.scrapers.rss.rss_scraper import RssScraper
 
 SAMPLE_RSS_XML = """
@@ -24,8 +24,10 @@ SAMPLE_RSS_XML = """
 # --- FIXTURES ---
 @pytest.fixture
 def mock_article_create():
-    with patch("app.scrapers.rss.rss_scraper.ArticleCreate.create") as mock_create:
-        yield mock_create
+    with patch(
+        "app.scrapers.base_scraper.ArticleCreate.create_batch"
+    ) as mock_create_batch:
+        yield mock_create_batch
 
 
 @pytest.fixture
@@ -37,13 +39,13 @@ def rss_scraper():
 
 
 # --- UNIT TESTS ---
-@patch("app.scrapers.rss.rss_scraper.requests.get")
-def test_collect_data_success(mock_get, rss_scraper, mock_article_create):
-    mock_response = MagicMock()
-    mock_response.content = SAMPLE_RSS_XML.encode("utf-8")
-    mock_get.return_value = mock_response
+def test_collect_data_success(mock_http, rss_scraper, mock_article_create):
+    mock_http.add(
+        "http://kacpersiemionek.com/rss/Technology",
+        content=SAMPLE_RSS_XML.encode("utf-8"),
+    )
 
-    mock_article_create.side_effect = lambda **kwargs: kwargs
+    mock_article_create.side_effect = lambda rows: (rows, [])
 
     results = rss_scraper.collect_data(category="Technology")
 
@@ -70,9 +72,8 @@ def test_collect_data_success(mock_get, rss_scraper, mock_article_create):
     assert "Technology" in article_data["categories"]
 
 
-@patch("app.scrapers.rss.rss_scraper.requests.get")
-def test_collect_data_request_failure(mock_get, rss_scraper):
-    mock_get.side_effect = requests.RequestException("Network error")
+def test_collect_data_request_failure(mock_http, rss_scraper):
+    mock_http.add(error=httpx.ConnectError("Network error"))
 
     with pytest.raises(Exception) as exc:
         rss_scraper.collect_data()
@@ -80,11 +81,8 @@ def test_collect_data_request_failure(mock_get, rss_scraper):
     assert "Request failed for" in str(exc.value)
 
 
-@patch("app.scrapers.rss.rss_scraper.requests.get")
-def test_collect_data_invalid_xml(mock_get, rss_scraper):
-    mock_response = MagicMock()
-    mock_response.content = b"Kacper Siemionek, completely not valid XML"
-    mock_get.return_value = mock_response
+def test_collect_data_invalid_xml(mock_http, rss_scraper):
+    mock_http.add(content=b"Kacper Siemionek, completely not valid XML")
 
     with pytest.raises(Exception) as exc:
         rss_scraper.collect_data()
@@ -92,8 +90,7 @@ def test_collect_data_invalid_xml(mock_get, rss_scraper):
     assert len(str(exc.value)) > 0
 
 
-@patch("app.scrapers.rss.rss_scraper.requests.get")
-def test_collect_data_missing_fields(mock_get, rss_scraper, mock_article_create):
+def test_collect_data_missing_fields(mock_http, rss_scraper, mock_article_create):
     broken_xml = """
     <rss version="2.0">
         <channel>
@@ -105,9 +102,6 @@ def test_collect_data_missing_fields(mock_get, rss_scraper, mock_article_create)
         </channel>
     </rss>
     """
-    mock_response = MagicMock()
-    mock_response.content = broken_xml.encode("utf-8")
-    mock_get.return_value = mock_response
+    mock_http.add(content=broken_xml.encode("utf-8"))
 
-    with pytest.raises(AttributeError):
-        rss_scraper.collect_data()
+    assert rss_scraper.collect_data() == []
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from app.models.articles import ArticleArchiveDB, ArticleDB
+from app.scrapers.api.api_scraper import BBCScraper
+from app.scrapers.seen_filter import SeenUrlFilter
+
+MOCK_RESPONSE = {
+    "news": [
+        {
+            "title": "Kacper Siemionek założył to na plażę?! [ZOBACZ ZDJĘCIA]",
+            "summary": "ODWAŻNY KACPER SIEMIONEK w nowym, ostrym wydaniu! [ZOBACZ ZDJĘCIA]",
+            "news_link": "http://bbc.com/news1?utm_source=rss",
+        },
+        {
+            "title": "Roxie Węgiel założyła TO do sklepu!? [ZOBACZ ZDJĘCIA]",
+            "summary": "Fani są w SZOKU. Eksperci pytają o atencję.",
+            "news_link": "http://bbc.com/news2",
+        },
+    ]
+}
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def seen(tmp_path, monkeypatch):
+    seen = SeenUrlFilter(str(tmp_path / "seen_urls.bin"))
+    monkeypatch.setattr("app.scrapers.base_scraper.seen_filter", seen)
+    return seen
+
+
+# --- UNIT TESTS ---
+def test_update_persists_urls(seen):
+    seen.update(["http://bbc.com/news1", "http://bbc.com/news2"])
+    reloaded = SeenUrlFilter(seen.path)
+
+    assert reloaded.loaded
+    assert len(reloaded) == 2
+    assert "http://bbc.com/news1" in reloaded
+    assert "http://bbc.com/news3" not in reloaded
+
+
+def test_update_skips_known_urls(seen):
+    seen.update(["http://bbc.com/news1"])
+    seen.update(["http://bbc.com/news1", "http://bbc.com/news2"])
+
+    assert len(seen) == 2
+
+
+def test_rebuild_from_database(seen, db_session):
+    db_session.add(
+        ArticleDB(
+            title="Kacper Siemionek Test",
+            description="Test test test",
+            url="HTTP://BBC.com/news1?smid=share",
+            published_at=datetime.now(),
+            source="BBC",
+            categories=[],
+        )
+    )
+    asyncio.run(db_session.flush())
+
+    asyncio.run(seen.rebuild(db_session))
+
+    assert seen.loaded
+    assert "http://bbc.com/news1" in seen
+
+
+def test_rebuild_keeps_archived_urls(seen, db_session):
+    db_session.add(
+        ArticleArchiveDB(
+            id=1,
+            url="http://bbc.com/news2?utm_source=rss",
+            published_at=datetime(2026, 1, 1),
+        )
+    )
+    asyncio.run(db_session.flush())
+
+    asyncio.run(seen.rebuild(db_session))
+
+    assert "http://bbc.com/news2" in seen
+    assert "http://bbc.com/news1" not in seen
+
+
+def test_incremental_collect_drops_known_articles(seen, mock_http):
+    seen.update(["http://bbc.com/news1"])
+    mock_http.add("http://test-bbc.com/news", json=MOCK_RESPONSE)
+
+    incremental = BBCScraper("http://test-bbc.com/%s", "BBC").collect_data(
+        "news", incremental=True
+    )
+    full = BBCScraper("http://test-bbc.com/%s", "BBC").collect_data("news")
+
+    assert [str(article.url) for article in incremental] == ["http://bbc.com/news2"]
+    assert len(full) == 2
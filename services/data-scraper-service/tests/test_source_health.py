@@ -0,0 +1,186 @@
+import asyncio
+
+import httpx
+import pytest
+from app.core.http import RateLimitedTransport, RateLimiter
+from app.main import app
+from app.scrapers.fetch_engine import FetchEngine
+from app.scrapers.source_health import BreakerState, HealthTracker, SourceUnavailable
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class MockScraper:
+    def __init__(self, source_name: str, delay: float = 0.0, fail: bool = False):
+        self.source_name = source_name
+        self.source_id = source_name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def collect_data_async(self, client, category=None, incremental=False):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise Exception("Kacper Siemionek wyłączył serwer")
+        return [f"{self.source_name}/{category}"]
+
+
+class RateLimitedScraper:
+    def __init__(self, source_name: str, limiter: RateLimiter):
+        self.source_name = source_name
+        self.source_id = source_name
+        self.client = httpx.AsyncClient(
+            transport=RateLimitedTransport(
+                httpx.MockTransport(lambda request: httpx.Response(200)), limiter
+            )
+        )
+
+    async def collect_data_async(self, client, category=None, incremental=False):
+        response = await self.client.get(f"http://api.nytimes.com/{category}.json")
+        response.raise_for_status()
+        return [f"{self.source_name}/{category}"]
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(clock):
+    return HealthTracker(failure_threshold=2, cooldown=60, clock=clock)
+
+
+# --- UNIT TESTS ---
+def test_breaker_opens_after_consecutive_failures(tracker):
+    tracker.record_failure("Pudelek", Exception("500"))
+    assert tracker.allow("Pudelek")
+
+    tracker.record_failure("Pudelek", Exception("500"))
+
+    assert not tracker.allow("Pudelek")
+    assert tracker.snapshot()["sources"]["Pudelek"]["state"] == BreakerState.OPEN
+
+
+def test_breaker_probes_once_after_cooldown(tracker, clock):
+    for _ in range(2):
+        tracker.record_failure("Pudelek", Exception("500"))
+    clock.now += 61
+
+    assert tracker.allow("Pudelek")
+    assert not tracker.allow("Pudelek")
+
+    tracker.record_success("Pudelek", 0.5)
+
+    assert tracker.allow("Pudelek")
+    assert [
+        (transition["from"], transition["to"])
+        for transition in tracker.snapshot()["transitions"]
+    ] == [
+        (BreakerState.CLOSED, BreakerState.OPEN),
+        (BreakerState.OPEN, BreakerState.HALF_OPEN),
+        (BreakerState.HALF_OPEN, BreakerState.CLOSED),
+    ]
+
+
+def test_failed_probe_reopens_breaker(tracker, clock):
+    for _ in range(2):
+        tracker.record_failure("Pudelek", Exception("500"))
+    clock.now += 61
+    tracker.allow("Pudelek")
+
+    tracker.record_failure("Pudelek", Exception("500"))
+
+    assert not tracker.allow("Pudelek")
+    assert tracker.snapshot()["sources"]["Pudelek"]["retry_in_seconds"] == 60
+
+
+def test_timeout_follows_p95(tracker, monkeypatch):
+    monkeypatch.setattr("app.scrapers.source_health.TIMEOUT_MIN_SECONDS", 1)
+    monkeypatch.setattr("app.scrapers.source_health.TIMEOUT_MAX_SECONDS", 20)
+    assert tracker.timeout("BBC") == 20
+
+    for duration in [0.5] * 19 + [1.5]:
+        tracker.record_success("BBC", duration)
+
+    assert tracker.timeout("BBC") == pytest.approx(1.5)
+
+
+def test_engine_skips_open_source_and_times_out_slow_one(tracker, monkeypatch):
+    monkeypatch.setattr("app.scrapers.source_health.TIMEOUT_MAX_SECONDS", 0.05)
+    engine = FetchEngine(max_concurrency=4, health=tracker)
+    dead = MockScraper("Dead", fail=True)
+    slow = MockScraper("Slow", delay=1)
+
+    for _ in range(2):
+        asyncio.run(engine.gather([(dead, None)]))
+    results = asyncio.run(
+        engine.gather([(dead, None), (slow, None), (MockScraper("Fast"), "a")])
+    )
+
+    assert dead.calls == 2
+    assert isinstance(results[0], SourceUnavailable)
+    assert isinstance(results[1], TimeoutError)
+    assert results[2] == ["Fast/a"]
+    assert tracker.snapshot()["sources"]["Slow"]["consecutive_failures"] == 1
+
+
+def test_waiting_for_rate_limit_does_not_fail_source(tracker, monkeypatch):
+    monkeypatch.setattr("app.scrapers.source_health.TIMEOUT_MAX_SECONDS", 0.05)
+    limiter = RateLimiter()
+    limiter.configure({"api.nytimes.com": (20, 1)})
+    scraper = RateLimitedScraper("nyt-top-stories", limiter)
+    categories = ["world", "us", "politics", "business", "technology"]
+    engine = FetchEngine(health=tracker)
+
+    results = asyncio.run(
+        engine.gather([(scraper, category) for category in categories])
+    )
+
+    assert results == [[f"nyt-top-stories/{category}"] for category in categories]
+    health = tracker.snapshot()["sources"]["nyt-top-stories"]
+    assert health["state"] == "closed"
+    assert health["total_failures"] == 0
+    assert health["p95_seconds"] < 0.05
+
+
+def test_sources_sharing_display_name_have_own_breakers(tracker):
+    engine = FetchEngine(health=tracker)
+    broken = MockScraper("Pudelek", fail=True)
+    broken.source_id = "pudelek-rss"
+    working = MockScraper("Pudelek")
+    working.source_id = "pudelek-api"
+
+    for _ in range(2):
+        asyncio.run(engine.gather([(broken, None)]))
+    results = asyncio.run(engine.gather([(broken, None), (working, "plotki")]))
+
+    assert isinstance(results[0], SourceUnavailable)
+    assert results[1] == ["Pudelek/plotki"]
+    assert tracker.snapshot()["sources"]["pudelek-rss"]["state"] == "open"
+    assert tracker.snapshot()["sources"]["pudelek-api"]["state"] == "closed"
+
+
+def test_sources_health_endpoint(monkeypatch, tracker):
+    tracker.record_failure("Pudelek", Exception("Roxie Węgiel przeciążyła serwer"))
+    monkeypatch.setattr("app.api.v1.sources.health_tracker", tracker)
+
+    response = client.get("/sources/health")
+
+    assert response.status_code == 200
+    assert response.json()["sources"]["Pudelek"]["state"] == "closed"
+    assert (
+        response.json()["sources"]["Pudelek"]["last_error"]
+        == "Roxie Węgiel przeciążyła serwer"
+    )
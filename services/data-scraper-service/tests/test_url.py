@@ -0,0 +1,40 @@
+from app.utils.url import canonicalize_url
+
+
+def test_canonicalize_url_strips_tracking_params():
+    url = "https://www.nytimes.com/2026/01/17/world/story.html?smid=url-share&utm_source=rss&page=2"
+    expected = "https://www.nytimes.com/2026/01/17/world/story.html?page=2"
+
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_normalizes_scheme_and_host():
+    url = "HTTPS://WWW.NYTimes.com:443/2026/01/17/world/story.html#comments"
+    expected = "https://www.nytimes.com/2026/01/17/world/story.html"
+
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_sorts_query_params():
+    assert canonicalize_url("http://pudelek.pl/roxie?b=2&a=1") == (
+        "http://pudelek.pl/roxie?a=1&b=2"
+    )
+
+
+def test_canonicalize_url_keeps_non_default_port_and_adds_root_path():
+    assert canonicalize_url("http://kacpersiemionek.com:8080") == (
+        "http://kacpersiemionek.com:8080/"
+    )
+
+
+def test_canonicalize_url_is_idempotent():
+    url = "https://fakty.interia.pl/swiat/news-kacper,nId,123?utm_campaign=feed"
+
+    assert canonicalize_url(canonicalize_url(url)) == canonicalize_url(url)
+
+
+def test_canonicalize_url_keeps_malformed_port():
+    assert canonicalize_url("HTTP://Pudelek.pl:99999/roxie?utm_source=rss") == (
+        "http://pudelek.pl:99999/roxie"
+    )
+    assert canonicalize_url("http://pudelek.pl:roxie/") == "http://pudelek.pl:roxie/"
@@ -0,0 +1,257 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from app.scrapers.api.api_scraper import NYTScraper
+from app.scrapers.feed_cache import FeedCache
+from app.scrapers.rss.rss_scraper import RssScraper
+from app.scrapers.watermarks import WatermarkStore
+
+RSS_ITEM = """
+        <item>
+            <title>Roxie Węgiel odcinek {number} [ZOBACZ ZDJĘCIA]</title>
+            <link>http://pudelek.pl/roxie-{number}</link>
+            <guid>pudelek-roxie-{number}</guid>
+            <description>Fani są w SZOKU po raz {number}. Eksperci pytają o atencję.</description>
+            <pubDate>Sat, 0{number} Jan 2026 20:20:00 GMT</pubDate>
+        </item>
+"""
+
+
+def rss_feed(*numbers):
+    items = "".join(RSS_ITEM.format(number=number) for number in numbers)
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+def nyt_response(*dates):
+    return {
+        "status": "OK",
+        "results": [
+            {
+                "title": f"Kacper Siemionek na Wall Street {index}",
+                "abstract": "Celebryta z Świebodzina debiutuje na giełdzie.",
+                "url": f"http://nytimes.com/siemionek-{index}",
+                "published_date": date,
+            }
+            for index, date in enumerate(dates)
+        ],
+    }
+
+
+# --- FIXTURES ---
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+    monkeypatch.setattr("app.scrapers.base_scraper.watermark_store", store)
+    return store
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = FeedCache(str(tmp_path / "feed_cache.json"))
+    monkeypatch.setattr("app.scrapers.base_scraper.feed_cache", cache)
+    monkeypatch.setattr("app.scrapers.rss.rss_scraper.feed_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def rss_scraper():
+    return RssScraper(url="http://pudelek.pl/rss/%s", source_name="Pudelek")
+
+
+# --- UNIT TESTS ---
+def test_walk_skips_guid_or_older_date(store):
+    store.stage(
+        "Pudelek/Plotki",
+        {"guid": "roxie-2", "published_at": "2026-01-02T20:20:00+00:00"},
+    )
+    store.commit()
+    walk = WatermarkStore(store.path).walk("Pudelek", "Plotki")
+
+    assert not walk.reached(datetime(2026, 1, 3), "roxie-3")
+    assert walk.reached(None, "roxie-2")
+    assert walk.reached(datetime(2026, 1, 1, tzinfo=timezone.utc), "roxie-1")
+
+
+def test_disabled_walk_skips_nothing(store):
+    store.stage("Pudelek", {"guid": "roxie-2", "published_at": None})
+    store.commit()
+    walk = store.walk("Pudelek", enabled=False)
+    walk.observe(None, "roxie-3")
+    walk.stage()
+
+    assert not walk.reached(None, "roxie-2")
+    assert store.staged == {}
+
+
+def test_discard_drops_staged_watermarks(store):
+    store.stage("Pudelek", {"guid": "roxie-2", "published_at": None})
+    store.discard()
+    store.commit()
+
+    assert store.get("Pudelek") is None
+
+
+def test_incremental_rss_skips_items_behind_watermark(
+    store, cache, rss_scraper, mock_http
+):
+    mock_http.add("http://pudelek.pl/rss/Plotki", content=rss_feed(2, 1))
+    first = rss_scraper.collect_data("Plotki", incremental=True)
+    store.commit()
+
+    mock_http.add("http://pudelek.pl/rss/Plotki", content=rss_feed(4, 3, 2, 1))
+    second = rss_scraper.collect_data("Plotki", incremental=True)
+    store.commit()
+
+    assert [str(article.url) for article in first] == [
+        "http://pudelek.pl/roxie-2",
+        "http://pudelek.pl/roxie-1",
+    ]
+    assert [str(article.url) for article in second] == [
+        "http://pudelek.pl/roxie-4",
+        "http://pudelek.pl/roxie-3",
+    ]
+    assert store.get("Pudelek", "Plotki") == {
+        "guid": "pudelek-roxie-4",
+        "published_at": "2026-01-04T20:20:00+00:00",
+    }
+
+
+def test_incremental_rss_keeps_new_items_of_ranked_feed(
+    store, cache, rss_scraper, mock_http
+):
+    store.stage(
+        "Pudelek/Plotki",
+        {"guid": "pudelek-roxie-3", "published_at": "2026-01-03T20:20:00+00:00"},
+    )
+    store.commit()
+    mock_http.add("http://pudelek.pl/rss/Plotki", content=rss_feed(3, 1, 5, 2, 4))
+
+    articles = rss_scraper.collect_data("Plotki", incremental=True)
+
+    assert [str(article.url) for article in articles] == [
+        "http://pudelek.pl/roxie-5",
+        "http://pudelek.pl/roxie-4",
+    ]
+    assert store.staged["Pudelek/Plotki"]["published_at"] == (
+        "2026-01-05T20:20:00+00:00"
+    )
+
+
+def test_incremental_stream_skips_items_behind_watermark(store, cache, rss_scraper):
+    store.stage("Pudelek/Plotki", {"guid": "pudelek-roxie-2", "published_at": None})
+    store.commit()
+    body = rss_feed(3, 2, 1)
+    split = body.index(b"</item>") + len(b"</item>")
+    chunks_read = []
+
+    async def chunks():
+        for chunk in (body[:split], body[split:-20], body[-20:]):
+            chunks_read.append(chunk)
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(200, content=chunks())
+
+    async def collect():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await rss_scraper.collect_data_async(
+                client, "Plotki", incremental=True
+            )
+
+    articles = asyncio.run(collect())
+
+    assert [str(article.url) for article in articles] == [
+        "http://pudelek.pl/roxie-3",
+        "http://pudelek.pl/roxie-1",
+    ]
+    assert len(chunks_read) == 3
+    assert cache.staged["http://pudelek.pl/rss/Plotki"]["fingerprint"] is not None
+    assert store.staged["Pudelek/Plotki"]["guid"] == "pudelek-roxie-3"
+
+
+def test_interrupted_stream_stages_nothing(store, cache, rss_scraper):
+    body = rss_feed(3, 2, 1)
+
+    async def chunks():
+        yield body[:-20]
+        raise httpx.ReadError("Kacper Siemionek wyciągnął kabel")
+
+    def handler(request):
+        return httpx.Response(200, content=chunks())
+
+    async def collect():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await rss_scraper.collect_data_async(
+                client, "Plotki", incremental=True
+            )
+
+    with pytest.raises(Exception, match="Request failed"):
+        asyncio.run(collect())
+    assert cache.staged == {}
+    assert store.staged == {}
+
+
+def test_full_scrape_ignores_watermark(store, rss_scraper, mock_http):
+    store.stage("Pudelek/Plotki", {"guid": "pudelek-roxie-2", "published_at": None})
+    store.commit()
+    mock_http.add("http://pudelek.pl/rss/Plotki", content=rss_feed(3, 2, 1))
+
+    articles = rss_scraper.collect_data("Plotki")
+
+    assert len(articles) == 3
+    assert store.staged == {}
+
+
+def test_incremental_api_skips_older_dates(store, cache, mock_http):
+    scraper = NYTScraper(url="http://nytimes.com/%s", source_name="NYT")
+    store.stage(
+        "NYT/world", {"guid": None, "published_at": "2026-01-17T00:00:00+00:00"}
+    )
+    store.commit()
+    mock_http.add(
+        "http://nytimes.com/world",
+        json=nyt_response(
+            "2026-01-18T12:00:00-05:00",
+            "2026-01-16T12:00:00-05:00",
+            "2026-01-18T10:00:00-05:00",
+        ),
+    )
+
+    articles = scraper.collect_data("world", incremental=True)
+
+    assert [str(article.url) for article in articles] == [
+        "http://nytimes.com/siemionek-0",
+        "http://nytimes.com/siemionek-2",
+    ]
+    assert store.staged["NYT/world"]["published_at"] == "2026-01-18T17:00:00+00:00"
+
+
+def test_sources_sharing_display_name_have_own_watermarks(store, cache, mock_http):
+    rss = RssScraper(url="http://pudelek.pl/rss/%s", source_name="Pudelek")
+    rss.source_id = "pudelek-rss"
+    mirror = RssScraper(url="http://pudelek.com/rss/%s", source_name="Pudelek")
+    mirror.source_id = "pudelek-mirror"
+    mock_http.add("http://pudelek.pl/rss/Plotki", content=rss_feed(4, 3))
+    mock_http.add("http://pudelek.com/rss/Plotki", content=rss_feed(2, 1))
+
+    rss.collect_data("Plotki", incremental=True)
+    store.commit()
+    articles = mirror.collect_data("Plotki", incremental=True)
+
+    assert len(articles) == 2
+    assert store.get("pudelek-rss", "Plotki")["guid"] == "pudelek-roxie-4"
+    assert store.get("Pudelek", "Plotki") is None
+
+
+def test_discard_staged_keeps_feed_for_next_run(store, cache, rss_scraper, mock_http):
+    mock_http.add("http://pudelek.pl/rss/Plotki", content=rss_feed(2, 1))
+    rss_scraper.collect_data("Plotki", incremental=True)
+
+    rss_scraper.discard_staged("Plotki")
+    store.commit()
+    cache.commit()
+
+    assert store.get("Pudelek", "Plotki") is None
+    assert "http://pudelek.pl/rss/Plotki" not in cache.entries
@@ -4,6 +4,7 @@ import httpx
 
 from contextlib import asynccontextmanager
 from datetime import date
+import asyncio
 import logging
 import os
 
@@ -16,15 +17,24 @@ logger = logging.getLogger(__name__)
 
 SCRAPER_URL = os.getenv("SCRAPER_URL", "http://data-service:8082/articles")
 AGENT_URL = os.getenv("AGENT_URL", "http://agent-service:8083/daily_summary")
+SCRAPER_POLL_INTERVAL = float(os.getenv("SCRAPER_POLL_INTERVAL", "5"))
+SCRAPER_JOB_TIMEOUT = float(os.getenv("SCRAPER_JOB_TIMEOUT", "1800"))
 
 
 async def trigger_scraping_job():
     logger.info("Data Scrapping starts...")
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.post(SCRAPER_URL, timeout=180)
-            logger.info(f"Scraping status: {response.status_code}")
-            logger.info(f"Scraping response: {response.text}")
+            response = await client.post(
+                SCRAPER_URL, params={"async": "true"}, timeout=30
+            )
+            response.raise_for_status()
+            job_id = response.json()["job_id"]
+            logger.info(f"Scraping job {job_id} started")
+
+            job = await poll_scraping_job(client, job_id)
+            logger.info(f"Scraping status: {job['status']}")
+            logger.info(f"Scraping response: {job}")
 
         except Exception as e:
             logger.error(
@@ -32,6 +42,20 @@ async def trigger_scraping_job():
             )
 
 
+async def poll_scraping_job(client: httpx.AsyncClient, job_id: str) -> dict:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SCRAPER_JOB_TIMEOUT
+    while True:
+        response = await client.get(f"{SCRAPER_URL}/jobs/{job_id}", timeout=30)
+        response.raise_for_status()
+        job = response.json()
+        if job["status"] not in ("queued", "processing"):
+            return job
+        if loop.time() > deadline:
+            raise TimeoutError(f"Scraping job {job_id} did not finish in time")
+        await asyncio.sleep(SCRAPER_POLL_INTERVAL)
+
+
 async def trigger_agent_summary_job():
     logger.info("Preparing daily summary starts...")
     async with httpx.AsyncClient() as client: